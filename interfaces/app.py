@@ -1,8 +1,62 @@
 import json
 from opti_test.array_cable_problem import ArrayCableProblem
+from opti_test.cache import DEFAULT_CACHE_FILE
+from opti_test.jobs import SolveJob
+from opti_test.model_data import ModelData
 import streamlit as st
 
 
+@st.cache_resource(max_entries=8)
+def get_model_data(input_data: str) -> ModelData:
+    # Shared by all sessions and kept across reruns, including the crossing pairs, which take the longest to create
+    array_cable_problem = ArrayCableProblem(**json.loads(input_data))
+    model_data = ModelData.create(
+        array_cable_problem.units, array_cable_problem.cable_types, array_cable_problem.candidate_settings
+    )
+    model_data.get_crossing_link_pairs()
+    return model_data
+
+
+def start_job(array_cable_problem: ArrayCableProblem, input_data: str, method: str, use_cache: bool):
+    # Every session has its own job, which solves in its own process, so sessions do not block each other
+    if "job" in st.session_state:
+        st.session_state.job.close()
+    st.session_state.job = SolveJob(
+        array_cable_problem, method, DEFAULT_CACHE_FILE if use_cache else None, get_model_data(input_data)
+    )
+    st.session_state.job_input = input_data
+
+
+@st.fragment(run_every=1)
+def show_progress():
+    job = st.session_state.job
+    progress = job.get_progress()
+    elapsed_time, objective, gap = st.columns(3)
+    elapsed_time.metric("Elapsed time", f"{progress.elapsed_time_in_seconds:.0f} s")
+    objective.metric(
+        "Best layout cost",
+        "-" if progress.objective_function_value is None else f"{progress.objective_function_value:.4g}",
+    )
+    gap.metric("Gap", "-" if progress.gap is None else f"{progress.gap:.2%}")
+    if st.button("Cancel"):
+        job.cancel()
+    if not job.is_running():
+        st.rerun()
+
+
+def show_result():
+    job = st.session_state.job
+    if job.is_cancelled:
+        st.warning("The optimization was cancelled")
+    elif job.error is not None:
+        st.error(job.error)
+    elif job.result.layout is None:
+        st.warning("No feasible layout was found")
+    else:
+        st.header("Layout")
+        st.write(job.result.plot(False))
+
+
 def main():
     st.title("Array cable optimization")
     st.sidebar.header("Navigation")
@@ -11,14 +65,19 @@ def main():
     if option == "Application":
         uploaded_file = st.file_uploader("Get input file (.json)", type="json")
         if uploaded_file is not None:
-            data = json.load(uploaded_file)
-            array_cable_problem = ArrayCableProblem(**data)
+            input_data = uploaded_file.getvalue().decode()
+            array_cable_problem = ArrayCableProblem(**json.loads(input_data))
             st.write(array_cable_problem.plot(False))
+            method = st.radio("Method", ("mip", "heuristic", "decomposition"))
+            use_cache = st.checkbox("Use cached results", value=True)
             is_optimize = st.button("Optimize")
             if is_optimize:
-                array_cable_problem.create_layout()
-                st.header("Layout")
-                st.write(array_cable_problem.plot(False))
+                start_job(array_cable_problem, input_data, method, use_cache)
+            if st.session_state.get("job_input") == input_data:
+                if st.session_state.job.is_running():
+                    show_progress()
+                else:
+                    show_result()
 
     if option == "Documentation":
         with open("docs/index.md", "r") as file:
@@ -2,15 +2,123 @@ import json
 import click
 
 from opti_test.array_cable_problem import ArrayCableProblem
+from opti_test.batch import get_input_files, solve_batch, summarize
+from opti_test.cache import DEFAULT_CACHE_FILE, ResultCache
+from opti_test.classes import Layout
+from opti_test.sweep import load_scenarios, run_sweeps, to_dataframe
 
 
 @click.command
 @click.option("--input_file", help="json file with the input data")
 @click.option("--output_file", default="results.json", help="json file with the results")
-def run(input_file: str, output_file: str):
+@click.option("--lazy_crossings", is_flag=True, help="add non-crossing constraints only when they are violated")
+@click.option(
+    "--formulation",
+    type=click.Choice(["basic", "strong"]),
+    default="basic",
+    help="basic model, or flows in turbines with valid inequalities",
+)
+@click.option("--presolve", is_flag=True, help="remove dominated cable types and too long links before solving")
+@click.option("--time_limit", type=float, default=None, help="wall-clock time limit of a solve in seconds per instance")
+@click.option("--mip_rel_gap", type=float, default=None, help="relative gap at which the solver stops")
+@click.option("--node_limit", type=int, default=None, help="maximum number of branch and bound nodes")
+@click.option("--threads", type=int, default=None, help="number of threads of the solver")
+@click.option("--incumbent_file", default=None, help="json lines file to write every improving layout to while solving")
+@click.option("--cache_file", default=str(DEFAULT_CACHE_FILE), help="sqlite file with the cached results")
+@click.option("--no_cache", is_flag=True, help="always solve the problem instead of using cached results")
+@click.option(
+    "--method",
+    type=click.Choice(["mip", "heuristic", "decomposition"]),
+    default="mip",
+    help="exact, heuristic or per-substation solve",
+)
+@click.option("--initial_layout_file", default=None, help="json file with a layout to warm-start the solver from")
+@click.option("--input_glob", default=None, help="directory or glob pattern of json files to solve as a batch")
+@click.option("--batch_output_file", default="results.jsonl", help="json lines file with the batch results")
+@click.option("--timeout", type=float, default=None, help="wall-clock limit in seconds per instance of the batch")
+@click.option("--workers", type=int, default=None, help="number of worker processes for the batch or decomposition")
+@click.option("--max_turbines_per_substation", type=int, default=None, help="cluster capacity of the decomposition")
+@click.option("--sweep_file", default=None, help="json file with the scenarios to solve with one model per instance")
+@click.option("--sweep_output_file", default="sweep.csv", help="csv file with the results of all scenarios")
+def run(
+    input_file: str,
+    output_file: str,
+    lazy_crossings: bool,
+    formulation: str,
+    presolve: bool,
+    time_limit: float | None,
+    mip_rel_gap: float | None,
+    node_limit: int | None,
+    threads: int | None,
+    incumbent_file: str | None,
+    cache_file: str,
+    no_cache: bool,
+    method: str,
+    initial_layout_file: str | None,
+    input_glob: str | None,
+    batch_output_file: str,
+    timeout: float | None,
+    workers: int | None,
+    max_turbines_per_substation: int | None,
+    sweep_file: str | None,
+    sweep_output_file: str,
+):
+    # Only the options set on the command line override the solver settings of the input files
+    context = click.get_current_context()
+    solver_settings = {
+        name: value
+        for name, value in {
+            "lazy_crossings": lazy_crossings,
+            "formulation": formulation,
+            "presolve": presolve,
+            "time_limit": time_limit,
+            "mip_rel_gap": mip_rel_gap,
+            "node_limit": node_limit,
+            "threads": threads,
+            "max_turbines_per_substation": max_turbines_per_substation,
+        }.items()
+        if context.get_parameter_source(name) != click.core.ParameterSource.DEFAULT
+    }
+    if sweep_file is not None:
+        input_files = [input_file] if input_glob is None else get_input_files(input_glob)
+        table = to_dataframe(run_sweeps(input_files, load_scenarios(sweep_file), workers, solver_settings))
+        table.to_csv(sweep_output_file, index=False)
+        click.echo(table.to_string(index=False))
+        return
+
+    if input_glob is not None:
+        input_files = get_input_files(input_glob)
+        results = solve_batch(
+            input_files, batch_output_file, workers, method, solver_settings, None if no_cache else cache_file, timeout
+        )
+        click.echo(summarize(results))
+        return
+
     with open(input_file, "r") as file:
         array_cable_problem = ArrayCableProblem(**json.load(file))
-    array_cable_problem.create_layout()
+    array_cable_problem.solver_settings = array_cable_problem.solver_settings.model_copy(
+        update=solver_settings | ({} if workers is None else {"decomposition_workers": workers})
+    )
+    initial_layout = None
+    if initial_layout_file is not None:
+        with open(initial_layout_file, "r") as file:
+            initial_layout = Layout.model_validate_json(file.read())
+    cache = None if no_cache else ResultCache(cache_file)
+    if incumbent_file is None:
+        array_cable_problem.create_layout(cache, initial_layout, method)
+    else:
+        with open(incumbent_file, "w") as file:
+
+            def write_incumbent(layout: Layout):
+                file.write(layout.model_dump_json() + "\n")
+                file.flush()
+
+            array_cable_problem.create_layout(cache, initial_layout, method, on_incumbent=write_incumbent)
+    if array_cable_problem.candidate_report is not None:
+        click.echo(str(array_cable_problem.candidate_report))
+    if array_cable_problem.presolve_report is not None:
+        click.echo(str(array_cable_problem.presolve_report))
+    click.echo(str(array_cable_problem.statistics))
     if array_cable_problem.layout is not None:
         with open(output_file, "w") as file:
             file.write(array_cable_problem.layout.model_dump_json())
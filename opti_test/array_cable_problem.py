@@ -1,31 +1,177 @@
+from opti_test.cache import ResultCache, get_fingerprint
+from opti_test.candidates import CandidateReport, CandidateSettings
+from opti_test.decomposition import DecompositionBuilder
+from opti_test.heuristic import HeuristicBuilder
 from opti_test.model_builder import ModelBuilder
-from opti_test.model_data import ModelData, Parameters
-from pydantic import BaseModel
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+from opti_test.model_data import ModelData, Parameters, SolverSettings
+from opti_test.presolve import PresolveReport, presolve
+from opti_test.statistics import SolveStatistics
+from collections.abc import Callable
+from time import perf_counter
 
-from opti_test.classes import CableType, Unit, Layout
+from pydantic import BaseModel, Field, PrivateAttr
+import numpy as np
+
+from opti_test.classes import CableType, Link, Unit, Layout
+
+# From this number of units, plots are drawn in the fast mode, as a trace per cable and labels get slow to render
+_FAST_PLOT_UNITS = 200
 
 
 class ArrayCableProblem(BaseModel):
     units: list[Unit]
     cable_types: list[CableType]
     parameters: Parameters
+    candidate_settings: CandidateSettings | None = None
+    solver_settings: SolverSettings = Field(default_factory=SolverSettings)
     layout: Layout | None = None
+    candidate_report: CandidateReport | None = None
+    presolve_report: PresolveReport | None = None
+    statistics: SolveStatistics | None = None
+
+    _model_builder: ModelBuilder | None = PrivateAttr(default=None)
+
+    def create_layout(
+        self,
+        cache: ResultCache | None = None,
+        initial_layout: Layout | None = None,
+        method: str = "mip",
+        model_data: ModelData | None = None,
+        on_incumbent: Callable[[Layout], None] | None = None,
+    ):
+        """
+        :param cache: Cache to look up the layout in, and to store it in after solving
+        :param initial_layout: Layout to start the solver from, e.g. the layout before a small change to the problem
+        :param method: Either "mip" for the optimal layout, "heuristic" for a fast constructive layout, or
+            "decomposition" for solving the clusters of turbines around each substation separately
+        :param model_data: Model data of this problem, e.g. kept from an earlier call, which is created if None
+        :param on_incumbent: Called with every improving layout of the mip method while solving, e.g. to keep the best
+            layout found before a deadline. It is called from a background thread.
+        """
+        if method not in ["mip", "heuristic", "decomposition"]:
+            raise ValueError(f"Unknown method {method}, use 'mip', 'heuristic' or 'decomposition'")
+
+        start = perf_counter()
+        self.statistics = statistics = SolveStatistics()
+        if cache is not None:
+            key = get_fingerprint(self, method)
+            with statistics.measure("cache"):
+                self.layout = cache.get(key)
+            if self.layout is not None:
+                self.layout.statistics = statistics
+                return
+
+        if model_data is None:
+            with statistics.measure("model_data"):
+                model_data = ModelData.create(self.units, self.cable_types, self.candidate_settings)
+        self.candidate_report = model_data.candidate_report
+        self.presolve_report = None
+        if method == "heuristic":
+            with statistics.measure("heuristic"):
+                layout_connections = HeuristicBuilder(model_data, self.parameters).solve()
+        elif method == "decomposition":
+            with statistics.measure("decomposition"):
+                layout_connections = DecompositionBuilder(model_data, self.parameters, self.solver_settings).solve()
+        else:
+            if self.solver_settings.presolve:
+                with statistics.measure("presolve"):
+                    model_data, self.presolve_report = presolve(model_data, self.parameters)
+            initial_connections = None if initial_layout is None else initial_layout.connections
+            if initial_connections is None and self.solver_settings.heuristic_warm_start:
+                with statistics.measure("heuristic"):
+                    initial_connections = HeuristicBuilder(model_data, self.parameters).solve()
+            model_builder = ModelBuilder(
+                model_data,
+                self.parameters,
+                self.solver_settings,
+                statistics,
+                on_incumbent=None if on_incumbent is None else lambda c: on_incumbent(Layout(connections=c)),
+            )
+            layout_connections = model_builder.solve(initial_connections, start)
+        if layout_connections is None:
+            self.layout = None
+        else:
+            self.layout = Layout(connections=layout_connections, statistics=statistics)
+
+        if cache is not None and self.layout is not None:
+            # The statistics belong to this solve, so they are not cached with the layout
+            cache.set(key, self.layout.model_copy(update={"statistics": None}))
+
+    def reoptimize(self):
+        """
+        Creates the layout with the MIP, like `create_layout`, but keeps the model. The edits below are then applied to
+        the model in place, and the next call re-solves it starting from the previous layout, instead of rebuilding it.
+        The candidate links and the presolve are not updated by the edits, so the model is built without presolve.
+        """
+        self.statistics = statistics = SolveStatistics()
+        if self._model_builder is None:
+            with statistics.measure("model_data"):
+                model_data = ModelData.create(self.units, self.cable_types, self.candidate_settings)
+            self.candidate_report = model_data.candidate_report
+            self._model_builder = ModelBuilder(
+                model_data, self.parameters, self.solver_settings, statistics, is_incremental=True
+            )
+            layout_connections = self._model_builder.solve()
+        else:
+            self._model_builder.statistics = statistics
+            layout_connections = self._model_builder.resolve()
+        self.layout = (
+            None if layout_connections is None else Layout(connections=layout_connections, statistics=statistics)
+        )
+
+    def move_unit(self, unit: Unit, x: float, y: float):
+        """
+        Moves the unit to (x, y), keeping its candidate links in the model of `reoptimize`
+        """
+        key = (unit.name, unit.x, unit.y)
+        moved = unit.model_copy(update={"x": x, "y": y})
+        self.units = [moved if (u.name, u.x, u.y) == key else u for u in self.units]
+        if self._model_builder is not None:
+            self._model_builder.move_unit(self._model_builder.core.coordinates.get_index(unit), x, y)
 
-    def create_layout(self):
-        model_data = ModelData.create(self.units, self.cable_types)
-        layout_connections = ModelBuilder(model_data, self.parameters).solve()
-        self.layout = Layout(connections=layout_connections)
+    def set_cable_cost(self, cable_type: CableType, cost_per_km: float):
+        changed = cable_type.model_copy(update={"cost_per_km": cost_per_km})
+        self.cable_types = [changed if c == cable_type else c for c in self.cable_types]
+        if self._model_builder is not None:
+            self._model_builder.set_cable_cost(
+                self._model_builder.model_data.cable_types.index(cable_type), cost_per_km
+            )
+
+    def set_link_allowed(self, link: Link, is_allowed: bool):
+        """
+        Removes the link from the model of `reoptimize`, or restores it
+        """
+        if self._model_builder is None:
+            raise ValueError("Links can only be removed from the model of reoptimize, call it first")
+        link_id = self._model_builder.model_data.get_link_id(link)
+        if link_id is None:
+            raise ValueError(f"The link {link} is not part of the model")
+        self._model_builder.set_link_allowed(link_id, is_allowed)
+
+    def plot(self, show: bool = True, fast: bool | None = None):
+        """
+        :param fast: Draws the units and the cables of every cable type as single WebGL traces without unit labels,
+            which keeps the figure small and quick to render for large farms. By default, it is used from
+            _FAST_PLOT_UNITS units.
+        """
+        # Plotting dependencies are imported here, so that solving does not pay for importing them
+        import plotly.express as px
+
+        if fast is None:
+            fast = len(self.units) >= _FAST_PLOT_UNITS
 
-    def plot(self, show: bool = True):
         df = self._create_dataframe_for_units()
-        fig = px.scatter(df, x="Easting", y="Northing", text="Name")
-        fig.update_traces(textposition="top center")
+        if fast:
+            fig = px.scatter(df, x="Easting", y="Northing", hover_name="Name", render_mode="webgl")
+        else:
+            fig = px.scatter(df, x="Easting", y="Northing", text="Name")
+            fig.update_traces(textposition="top center")
 
         if self.layout is not None:
-            self._add_layout_to_plot(fig)
+            if fast:
+                self._add_layout_to_plot_by_cable_type(fig)
+            else:
+                self._add_layout_to_plot(fig)
 
         if show:
             fig.show()
@@ -33,12 +179,19 @@ class ArrayCableProblem(BaseModel):
         return fig
 
     def _create_dataframe_for_units(self):
-        columns = ["Name", "Easting", "Northing"]
-        data = [[u.name, u.x, u.y] for u in self.units]
+        import pandas as pd
 
-        return pd.DataFrame(data=data, columns=columns)
+        return pd.DataFrame(
+            {
+                "Name": [u.name for u in self.units],
+                "Easting": np.fromiter((u.x for u in self.units), dtype=float, count=len(self.units)),
+                "Northing": np.fromiter((u.y for u in self.units), dtype=float, count=len(self.units)),
+            }
+        )
 
     def _add_layout_to_plot(self, fig):
+        import plotly.graph_objects as go
+
         for c in self.layout.connections:
             fig.add_trace(
                 go.Scatter(
@@ -48,3 +201,29 @@ class ArrayCableProblem(BaseModel):
                     name=str(c),
                 )
             )
+
+    def _add_layout_to_plot_by_cable_type(self, fig):
+        import plotly.colors
+        import plotly.graph_objects as go
+
+        connections_by_cable_type = {}
+        for c in self.layout.connections:
+            connections_by_cable_type.setdefault(c.cable_type.name, []).append(c)
+
+        colors = plotly.colors.qualitative.Plotly
+        for i, (name, connections) in enumerate(connections_by_cable_type.items()):
+            # The cables are separated by NaN, so that they are not connected to each other
+            x = np.full((len(connections), 3), np.nan)
+            y = np.full((len(connections), 3), np.nan)
+            x[:, 0], y[:, 0] = [c.link.origin.x for c in connections], [c.link.origin.y for c in connections]
+            x[:, 1], y[:, 1] = [c.link.destination.x for c in connections], [c.link.destination.y for c in connections]
+            fig.add_trace(
+                go.Scattergl(
+                    x=x.ravel(),
+                    y=y.ravel(),
+                    mode="lines",
+                    line=dict(color=colors[i % len(colors)]),
+                    name=name,
+                    hoverinfo="name",
+                )
+            )
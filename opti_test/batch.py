@@ -0,0 +1,177 @@
+import json
+import multiprocessing
+from multiprocessing.connection import wait
+import os
+from glob import glob
+from pathlib import Path
+from time import perf_counter
+
+from pydantic import BaseModel
+
+from opti_test.array_cable_problem import ArrayCableProblem
+from opti_test.cache import ResultCache
+from opti_test.classes import Layout
+from opti_test.processes import start_process_group, terminate_process_group
+
+
+class BatchResult(BaseModel):
+    instance: str
+    status: str
+    solution_time: float
+    objective_function_value: float | None = None
+    layout: Layout | None = None
+    error: str | None = None
+
+
+def get_input_files(input_path: str) -> list[str]:
+    """
+    :param input_path: A directory with json files, or a glob pattern
+    """
+    if Path(input_path).is_dir():
+        return sorted(str(p) for p in Path(input_path).glob("*.json"))
+    return sorted(glob(input_path))
+
+
+def solve_instance(
+    input_file: str, method: str = "mip", solver_settings: dict | None = None, cache_file: str | None = None
+) -> BatchResult:
+    """
+    :param solver_settings: Solver settings overriding the ones in the input file, e.g. the time limit
+    """
+    start = perf_counter()
+    try:
+        with open(input_file, "r") as file:
+            array_cable_problem = ArrayCableProblem(**json.load(file))
+        array_cable_problem.solver_settings = array_cable_problem.solver_settings.model_copy(
+            update=solver_settings or {}
+        )
+        array_cable_problem.create_layout(None if cache_file is None else ResultCache(cache_file), method=method)
+    except Exception as error:
+        return BatchResult(
+            instance=input_file, status="failed", solution_time=perf_counter() - start, error=repr(error)
+        )
+
+    layout = array_cable_problem.layout
+    return BatchResult(
+        instance=input_file,
+        status="no layout" if layout is None else "solved",
+        solution_time=perf_counter() - start,
+        objective_function_value=None if layout is None else sum(c.get_cost() for c in layout.connections),
+        layout=layout,
+    )
+
+
+def solve_batch(
+    input_files: list[str],
+    output_file: str,
+    workers: int | None = None,
+    method: str = "mip",
+    solver_settings: dict | None = None,
+    cache_file: str | None = None,
+    timeout: float | None = None,
+) -> list[BatchResult]:
+    """
+    Solves the instances in a pool of `workers` processes, which solve one instance after the other, so that the
+    imports are only paid once per worker under every start method. A worker whose instance exceeds the timeout is
+    terminated and replaced, without stopping the others. Every result is appended to the json lines output file as
+    soon as it is finished.
+
+    :param solver_settings: Solver settings for all instances, e.g. {"time_limit": 60} as the time limit of a solve
+    :param timeout: Wall-clock limit in seconds per instance, which also covers reading the input and building the
+        model. Instances exceeding it are reported with the status "timeout".
+    """
+    context = multiprocessing.get_context()
+    pending = list(input_files)
+    idle = [_Worker(context) for _ in range(min(workers or os.cpu_count() or 1, len(pending)))]
+    busy = []
+    results = []
+    try:
+        with open(output_file, "w") as file:
+            while pending or busy:
+                while pending and idle:
+                    worker = idle.pop()
+                    worker.submit(pending.pop(0), method, solver_settings, cache_file)
+                    busy.append(worker)
+
+                wait_time = None
+                if timeout is not None:
+                    wait_time = max(0.0, min(w.start for w in busy) + timeout - perf_counter())
+                ready = wait([w.connection for w in busy], timeout=wait_time)
+
+                for worker in list(busy):
+                    if worker.connection in ready:
+                        try:
+                            result = worker.connection.recv()
+                            idle.append(worker)
+                        except EOFError:  # The worker process itself failed
+                            worker.terminate()
+                            result = BatchResult(
+                                instance=worker.input_file,
+                                status="failed",
+                                solution_time=perf_counter() - worker.start,
+                                error=f"The process stopped with exit code {worker.process.exitcode}",
+                            )
+                    elif timeout is not None and perf_counter() - worker.start >= timeout:
+                        worker.terminate()
+                        result = BatchResult(
+                            instance=worker.input_file, status="timeout", solution_time=perf_counter() - worker.start
+                        )
+                    else:
+                        continue
+                    busy.remove(worker)
+                    if worker not in idle and pending:
+                        idle.append(_Worker(context))
+                    file.write(result.model_dump_json() + "\n")
+                    file.flush()
+                    results.append(result)
+    finally:
+        for worker in idle:
+            worker.close()
+        for worker in busy:
+            worker.terminate()
+    return results
+
+
+class _Worker:
+    """
+    Process of the batch, which solves the instances it receives until it receives None. It is not a daemon, as the
+    decomposition solves its clusters in a process pool, and it leads a process group, so that terminating it also
+    terminates that pool.
+    """
+
+    def __init__(self, context):
+        self.connection, connection = context.Pipe()
+        self.process = context.Process(target=_work, args=(connection,))
+        self.process.start()
+        connection.close()
+        self.input_file = None
+        self.start = None
+
+    def submit(self, input_file: str, method: str, solver_settings: dict | None, cache_file: str | None):
+        self.input_file, self.start = input_file, perf_counter()
+        self.connection.send((input_file, method, solver_settings, cache_file))
+
+    def close(self):
+        self.connection.send(None)
+        self.process.join()
+        self.connection.close()
+
+    def terminate(self):
+        terminate_process_group(self.process)
+        self.connection.close()
+
+
+def _work(connection):
+    start_process_group()
+    try:
+        while (task := connection.recv()) is not None:
+            connection.send(solve_instance(*task))
+    finally:
+        connection.close()
+
+
+def summarize(results: list[BatchResult]) -> str:
+    failures = [r for r in results if r.status != "solved"]
+    lines = [f"Solved {len(results) - len(failures)} of {len(results)} instances"]
+    lines.extend(f"  {r.instance}: {r.status}" + ("" if r.error is None else f" ({r.error})") for r in failures)
+    return "\n".join(lines)
@@ -0,0 +1,82 @@
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from time import time
+
+from opti_test import __version__
+from opti_test.classes import Layout
+
+DEFAULT_CACHE_FILE = Path.home() / ".cache" / "opti_test" / "results.db"
+DEFAULT_MAX_SIZE_IN_BYTES = 100 * 1024**2
+
+
+class ResultCache:
+    """
+    On-disk cache of solved layouts in a SQLite database, keyed by the fingerprint of the problem.
+    Once the stored layouts exceed the maximum size, the least recently used ones are evicted.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_CACHE_FILE, max_size_in_bytes: int = DEFAULT_MAX_SIZE_IN_BYTES):
+        self.path = Path(path)
+        self.max_size_in_bytes = max_size_in_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                """CREATE TABLE IF NOT EXISTS results
+                (Key text PRIMARY KEY, Layout text, Size integer, LastAccess float)"""
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, key: str) -> Layout | None:
+        with self._connect() as connection:
+            row = connection.execute("SELECT Layout FROM results WHERE Key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE results SET LastAccess = ? WHERE Key = ?", (time(), key))
+        return Layout.model_validate_json(row[0])
+
+    def set(self, key: str, layout: Layout):
+        layout_json = layout.model_dump_json()
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)", (key, layout_json, len(layout_json), time())
+            )
+            self._evict(connection)
+
+    def get_size_in_bytes(self) -> int:
+        with self._connect() as connection:
+            return connection.execute("SELECT COALESCE(SUM(Size), 0) FROM results").fetchone()[0]
+
+    def _evict(self, connection: sqlite3.Connection):
+        total_size = connection.execute("SELECT COALESCE(SUM(Size), 0) FROM results").fetchone()[0]
+        if total_size <= self.max_size_in_bytes:
+            return
+
+        evicted_keys = []
+        for key, size in connection.execute("SELECT Key, Size FROM results ORDER BY LastAccess"):
+            if total_size <= self.max_size_in_bytes:
+                break
+            evicted_keys.append((key,))
+            total_size -= size
+        connection.executemany("DELETE FROM results WHERE Key = ?", evicted_keys)
+
+
+def get_fingerprint(problem, method: str = "mip") -> str:
+    """
+    Canonical hash of everything that determines the layout of an ArrayCableProblem: the units and cable types
+    (independent of their order), the parameters, the candidate and solver settings except the log file, the method
+    and the code version.
+    """
+    content = {
+        "version": __version__,
+        "method": method,
+        "units": sorted([u.name, u.x, u.y] for u in problem.units),
+        "cable_types": sorted([c.name, c.max_mw_on_cable, c.cost_per_km] for c in problem.cable_types),
+        "parameters": problem.parameters.model_dump(),
+        "candidate_settings": None if problem.candidate_settings is None else problem.candidate_settings.model_dump(),
+        "solver_settings": problem.solver_settings.model_dump(exclude={"log_file"}),
+    }
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
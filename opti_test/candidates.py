@@ -0,0 +1,103 @@
+import numpy as np
+from pydantic import BaseModel
+
+from opti_test.classes import Unit
+from opti_test.geometry import UnitCoordinates
+
+
+class CandidateSettings(BaseModel):
+    """
+    Selects the sparse set of candidate links. The links from the k nearest neighbours and the Delaunay triangulation
+    are combined, and the result is restricted to the maximum distance. The link from each turbine to its nearest
+    substation is always kept, so that every turbine can be connected.
+    """
+
+    k_nearest_neighbours: int | None = None
+    use_delaunay: bool = False
+    max_distance_in_km: float | None = None
+
+
+class CandidateReport(BaseModel):
+    number_of_links: int
+    number_of_candidate_links: int
+    number_of_connections: int
+    number_of_candidate_connections: int
+
+    def __str__(self):
+        return (
+            f"Kept {self.number_of_candidate_links} of {self.number_of_links} links "
+            f"and {self.number_of_candidate_connections} of {self.number_of_connections} connections"
+        )
+
+
+def get_candidate_matrix(units: list[Unit], settings: CandidateSettings) -> np.ndarray:
+    """
+    :return: Symmetric boolean matrix, where entry (i, j) states if units i and j may be linked
+    """
+    coordinates = UnitCoordinates(units)
+    distances = coordinates.get_distance_matrix_in_km()
+    number_of_units = len(units)
+
+    if settings.k_nearest_neighbours is None and not settings.use_delaunay:
+        is_candidate = np.ones((number_of_units, number_of_units), dtype=bool)
+    else:
+        is_candidate = np.zeros((number_of_units, number_of_units), dtype=bool)
+    if settings.k_nearest_neighbours is not None:
+        is_candidate |= _get_nearest_neighbours(distances, settings.k_nearest_neighbours)
+    if settings.use_delaunay:
+        is_candidate |= _get_delaunay_edges(coordinates)
+    if settings.max_distance_in_km is not None:
+        is_candidate &= distances <= settings.max_distance_in_km
+
+    is_candidate |= _get_nearest_substations(units, distances)
+    is_candidate |= is_candidate.T
+    np.fill_diagonal(is_candidate, False)
+    return is_candidate
+
+
+def _get_nearest_neighbours(distances: np.ndarray, k: int) -> np.ndarray:
+    number_of_units = len(distances)
+    is_neighbour = np.zeros((number_of_units, number_of_units), dtype=bool)
+    k = min(k, number_of_units - 1)
+    if k <= 0:
+        return is_neighbour
+
+    others = distances.copy()
+    np.fill_diagonal(others, np.inf)
+    nearest = np.argpartition(others, k - 1, axis=1)[:, :k]
+    np.put_along_axis(is_neighbour, nearest, True, axis=1)
+    return is_neighbour
+
+
+def _get_delaunay_edges(coordinates: UnitCoordinates) -> np.ndarray:
+    import shapely
+
+    number_of_units = len(coordinates.x)
+    is_edge = np.zeros((number_of_units, number_of_units), dtype=bool)
+
+    units_at_point = {}
+    for num, point in enumerate(zip(coordinates.x.tolist(), coordinates.y.tolist())):
+        units_at_point.setdefault(point, []).append(num)
+
+    edges = shapely.delaunay_triangles(
+        shapely.multipoints(np.stack([coordinates.x, coordinates.y], axis=1)), only_edges=True
+    )
+    for edge in shapely.get_parts(edges):
+        start, end = shapely.get_coordinates(edge).tolist()
+        for i in units_at_point.get(tuple(start), []):
+            is_edge[i, units_at_point.get(tuple(end), [])] = True
+    return is_edge
+
+
+def _get_nearest_substations(units: list[Unit], distances: np.ndarray) -> np.ndarray:
+    number_of_units = len(units)
+    is_nearest = np.zeros((number_of_units, number_of_units), dtype=bool)
+
+    substations = [num for num, u in enumerate(units) if not u.is_turbine()]
+    if len(substations) == 0:
+        return is_nearest
+
+    turbines = [num for num, u in enumerate(units) if u.is_turbine()]
+    nearest = np.array(substations)[np.argmin(distances[np.ix_(turbines, substations)], axis=1)]
+    is_nearest[turbines, nearest] = True
+    return is_nearest
@@ -1,7 +1,7 @@
 from pydantic import BaseModel
-import numpy as np
-import pandas as pd
-from shapely.geometry import LineString
+
+from opti_test.geometry import get_distance_in_km, is_crossing
+from opti_test.statistics import SolveStatistics
 
 
 class Unit(BaseModel):
@@ -48,24 +48,17 @@ class Link(BaseModel):
         return hash(self.origin) + 5 * hash(self.destination)
 
     def get_distance_in_km(self):
-        return np.sqrt((self.origin.x - self.destination.x) ** 2 + (self.origin.y - self.destination.y) ** 2) / 1000
+        return get_distance_in_km(self.origin.x, self.origin.y, self.destination.x, self.destination.y)
 
     def check_if_crossing(self, link2) -> bool:
-        line1 = _convert_link_to_line_string(self)
-        line2 = _convert_link_to_line_string(link2)
-
         if self.origin in [link2.origin, link2.destination] or self.destination in [link2.origin, link2.destination]:
             return False
-        return line1.crosses(line2)
-
-
-def _convert_link_to_line_string(link: Link) -> LineString:
-    return LineString(
-        [
-            (link.origin.x, link.origin.y),
-            (link.destination.x, link.destination.y),
-        ]
-    )
+        return is_crossing(
+            (self.origin.x, self.origin.y),
+            (self.destination.x, self.destination.y),
+            (link2.origin.x, link2.origin.y),
+            (link2.destination.x, link2.destination.y),
+        )
 
 
 class Connection(BaseModel):
@@ -84,8 +77,11 @@ class Connection(BaseModel):
 
 class Layout(BaseModel):
     connections: list[Connection]
+    statistics: SolveStatistics | None = None
 
     def to_dataframe(self):
+        import pandas as pd
+
         columns = ["Origin", "Destination", "CableType"]
 
         data = [[c.link.origin.name, c.link.destination.name, c.cable_type.name] for c in self.connections]
@@ -0,0 +1,134 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from opti_test.classes import CableType, Unit
+from opti_test.geometry import UnitCoordinates
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Index:
+    """
+    Groups ids by an integer key in compressed form: the ids of group g are order[offsets[g]:offsets[g + 1]]
+    """
+
+    order: np.ndarray
+    offsets: np.ndarray
+
+    @classmethod
+    def create(cls, groups: np.ndarray, number_of_groups: int) -> "Index":
+        order = np.argsort(groups, kind="stable")
+        offsets = np.zeros(number_of_groups + 1, dtype=int)
+        np.cumsum(np.bincount(groups, minlength=number_of_groups), out=offsets[1:])
+        return cls(order, offsets)
+
+    def get(self, group: int) -> np.ndarray:
+        return self.order[self.offsets[group] : self.offsets[group + 1]]
+
+
+@dataclass(slots=True, eq=False)
+class CoreData:
+    """
+    Struct-of-arrays representation of the units, links and connections, where every object is identified by its
+    position. The pydantic classes are only created at the API boundary, as hashing them dominates the solver path.
+    Units are identified by their name and coordinates, while units with the same name are never linked.
+    """
+
+    coordinates: UnitCoordinates
+    name_ids: dict[str, int]
+    unit_name: np.ndarray
+    is_turbine: np.ndarray
+    link_origin: np.ndarray
+    link_destination: np.ndarray
+    link_distance: np.ndarray
+    cable_capacity: np.ndarray
+    cable_cost_per_km: np.ndarray
+    connection_link: np.ndarray
+    connection_cable_type: np.ndarray
+    outgoing_by_unit: Index
+    incoming_by_unit: Index
+    connections_by_link: Index
+    connections_by_cable_type: Index
+    units_by_name: Index
+
+    @classmethod
+    def create(cls, units: list[Unit], cable_types: list[CableType], is_candidate: np.ndarray | None = None):
+        """
+        :param units: Units without duplicates
+        :param cable_types: Cable types without duplicates
+        :param is_candidate: Boolean matrix, where entry (i, j) states if units i and j may be linked. All links are
+            created if it is None
+        """
+        coordinates = UnitCoordinates(units)
+        name_ids = {}
+        unit_name = np.array([name_ids.setdefault(u.name, len(name_ids)) for u in units], dtype=int)
+        is_turbine = np.array([u.is_turbine() for u in units], dtype=bool)
+
+        is_link = get_possible_links(unit_name, is_turbine)
+        if is_candidate is not None:
+            is_link &= is_candidate
+        link_origin, link_destination = np.nonzero(is_link)
+        link_distance = coordinates.get_distance_matrix_in_km()[link_origin, link_destination]
+
+        # Connections are ordered by link, and then by cable type
+        number_of_links, number_of_cable_types = len(link_origin), len(cable_types)
+        connection_link = np.repeat(np.arange(number_of_links), number_of_cable_types)
+        connection_cable_type = np.tile(np.arange(number_of_cable_types), number_of_links)
+
+        return cls(
+            coordinates=coordinates,
+            name_ids=name_ids,
+            unit_name=unit_name,
+            is_turbine=is_turbine,
+            link_origin=link_origin,
+            link_destination=link_destination,
+            link_distance=link_distance,
+            cable_capacity=np.array([c.max_mw_on_cable for c in cable_types], dtype=float),
+            cable_cost_per_km=np.array([c.cost_per_km for c in cable_types], dtype=float),
+            connection_link=connection_link,
+            connection_cable_type=connection_cable_type,
+            outgoing_by_unit=Index.create(link_origin, len(units)),
+            incoming_by_unit=Index.create(link_destination, len(units)),
+            connections_by_link=Index.create(connection_link, number_of_links),
+            connections_by_cable_type=Index.create(connection_cable_type, number_of_cable_types),
+            units_by_name=Index.create(unit_name, len(name_ids)),
+        )
+
+    def move_unit(self, unit_id: int, unit: Unit) -> np.ndarray:
+        """
+        Moves the unit to the coordinates of the given unit, keeping its links
+
+        :return: The ids of the links of the unit
+        """
+        self.coordinates.move(unit_id, unit)
+        link_ids = self.get_link_ids_of_unit(unit_id)
+        origin, destination = self.link_origin[link_ids], self.link_destination[link_ids]
+        x, y = self.coordinates.x, self.coordinates.y
+        self.link_distance[link_ids] = (
+            np.sqrt((x[origin] - x[destination]) ** 2 + (y[origin] - y[destination]) ** 2) / 1000
+        )
+        return link_ids
+
+    def get_link_ids_of_unit(self, unit_id: int) -> np.ndarray:
+        return np.union1d(self.outgoing_by_unit.get(unit_id), self.incoming_by_unit.get(unit_id))
+
+    def get_unit_ids(self, name: str) -> np.ndarray:
+        """
+        :return: The ids of the units with the name, which are usually one
+        """
+        name_id = self.name_ids.get(name)
+        return np.empty(0, dtype=int) if name_id is None else self.units_by_name.get(name_id)
+
+    def get_connection_costs(self) -> np.ndarray:
+        return self.link_distance[self.connection_link] * self.cable_cost_per_km[self.connection_cable_type]
+
+    def get_connection_id(self, link: int, cable_type: int) -> int:
+        return link * len(self.cable_capacity) + cable_type
+
+
+def get_possible_links(unit_name: np.ndarray, is_turbine: np.ndarray) -> np.ndarray:
+    """
+    :return: Boolean matrix, where entry (i, j) states if a link from unit i to unit j is possible, i.e. if i is a
+        turbine and the units do not share their name
+    """
+    return is_turbine[:, None] & (unit_name[:, None] != unit_name[None, :])
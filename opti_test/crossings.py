@@ -0,0 +1,155 @@
+from collections.abc import Iterator
+
+import numpy as np
+
+from opti_test.classes import Link
+from opti_test.core import Index
+from opti_test.geometry import UnitCoordinates, are_crossing, get_certain_crossings
+
+# The spatial index returns the candidate pairs of a block of segments at once, which bounds the memory per block
+_BLOCK_SIZE = 128
+
+
+def get_crossing_pairs(links: list[Link]) -> np.ndarray:
+    """
+    Finds all pairs of crossing links in one pass, using a spatial index over the line geometries.
+    It applies the same rule as Link.check_if_crossing, i.e. links sharing a unit never cross.
+
+    :param links: The links to check against each other
+    :return: (n, 2) array with the lexicographically sorted index pairs (i, j), i < j, of the crossing links
+    """
+    units = {(u.name, u.x, u.y): u for link in links for u in (link.origin, link.destination)}
+    coordinates = UnitCoordinates(list(units.values()))
+    names = {}
+    unit_name = np.array([names.setdefault(name, len(names)) for name in coordinates.names], dtype=int)
+    origin = np.array([coordinates.get_index(link.origin) for link in links], dtype=int)
+    destination = np.array([coordinates.get_index(link.destination) for link in links], dtype=int)
+    return get_crossing_link_pairs(origin, destination, coordinates.x, coordinates.y, unit_name)
+
+
+def get_crossing_link_pairs(
+    origin: np.ndarray, destination: np.ndarray, x: np.ndarray, y: np.ndarray, unit_name: np.ndarray
+) -> np.ndarray:
+    """
+    Array version of `get_crossing_pairs` for links given by the ids of their units
+
+    :param origin: Unit id of the origin of each link
+    :param destination: Unit id of the destination of each link
+    :param x: x coordinate of each unit
+    :param y: y coordinate of each unit
+    :param unit_name: Name id of each unit, as links between units with the same name are sharing a unit
+    :return: (n, 2) array with the lexicographically sorted index pairs (i, j), i < j, of the crossing links
+    """
+    pairs = np.concatenate(
+        [np.empty((0, 2), dtype=int), *iter_crossing_link_pairs(origin, destination, x, y, unit_name)]
+    )
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def get_crossing_link_pairs_of(
+    link_ids: np.ndarray,
+    origin: np.ndarray,
+    destination: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    unit_name: np.ndarray,
+) -> np.ndarray:
+    """
+    Version of `get_crossing_link_pairs` which only checks the given links against all links, e.g. after moving a unit
+
+    :param link_ids: Ids of the links to check
+    :return: (n, 2) array with the lexicographically sorted index pairs (i, j), i < j, of the crossing links, where i or
+        j is one of the given links
+    """
+    if len(link_ids) == 0 or len(origin) < 2:
+        return np.empty((0, 2), dtype=int)
+
+    import shapely
+
+    start, end = np.stack([x[origin], y[origin]], axis=1), np.stack([x[destination], y[destination]], axis=1)
+    lines = shapely.linestrings(np.stack([start, end], axis=1))
+    first, second = shapely.STRtree(lines).query(lines[link_ids])
+    first = link_ids[first]
+    is_candidate = (first != second) & _are_not_sharing_unit(unit_name[origin], unit_name[destination], first, second)
+    # Checked with the lower link first, like Link.check_if_crossing in a loop over the pairs
+    first, second = np.minimum(first[is_candidate], second[is_candidate]), np.maximum(first, second)[is_candidate]
+
+    is_crossing = are_crossing(start[first], end[first], start[second], end[second])
+    return np.unique(np.stack([first[is_crossing], second[is_crossing]], axis=1), axis=0)
+
+
+def iter_crossing_link_pairs(
+    origin: np.ndarray, destination: np.ndarray, x: np.ndarray, y: np.ndarray, unit_name: np.ndarray
+) -> Iterator[np.ndarray]:
+    """
+    Streaming version of `get_crossing_link_pairs`, which yields the crossing pairs in blocks, so that only a block of
+    candidate pairs is held in memory at a time. The pairs are not sorted across blocks.
+    """
+    if len(origin) < 2:
+        return
+
+    import shapely
+
+    # A link and its reverse share the same segment, so the geometry is only checked once per segment
+    endpoints = np.sort(np.stack([origin, destination], axis=1), axis=1)
+    segments, segment_of_link = np.unique(endpoints, axis=0, return_inverse=True)
+    segment_links = _to_padded_array(segment_of_link.ravel(), len(segments))
+
+    start = np.stack([x[segments[:, 0]], y[segments[:, 0]]], axis=1)
+    end = np.stack([x[segments[:, 1]], y[segments[:, 1]]], axis=1)
+    link_start, link_end = np.stack([x[origin], y[origin]], axis=1), np.stack([x[destination], y[destination]], axis=1)
+    start_name, end_name = unit_name[segments[:, 0]], unit_name[segments[:, 1]]
+
+    lines = shapely.linestrings(np.stack([start, end], axis=1))
+    tree = shapely.STRtree(lines)
+
+    for block_start in range(0, len(segments), _BLOCK_SIZE):
+        first, second = tree.query(lines[block_start : block_start + _BLOCK_SIZE])
+        first += block_start
+        is_candidate = (first < second) & _are_not_sharing_unit(start_name, end_name, first, second)
+        first, second = first[is_candidate], second[is_candidate]
+
+        is_crossing, is_certain = get_certain_crossings(start[first], end[first], start[second], end[second])
+        yield _get_link_pairs(segment_links, first[is_crossing & is_certain], second[is_crossing & is_certain])
+
+        # shapely decides the nearly degenerate pairs depending on the order and direction of the segments, so they
+        # are checked per pair of links, with the lower link first, like Link.check_if_crossing in a loop over the pairs
+        if not is_certain.all():
+            pairs = _get_link_pairs(segment_links, first[~is_certain], second[~is_certain])
+            first_link, second_link = pairs[:, 0], pairs[:, 1]
+            yield pairs[
+                are_crossing(
+                    link_start[first_link], link_end[first_link], link_start[second_link], link_end[second_link]
+                )
+            ]
+
+
+def _are_not_sharing_unit(start_name, end_name, first, second) -> np.ndarray:
+    return (
+        (start_name[first] != start_name[second])
+        & (start_name[first] != end_name[second])
+        & (end_name[first] != start_name[second])
+        & (end_name[first] != end_name[second])
+    )
+
+
+def _to_padded_array(segment_of_link: np.ndarray, number_of_segments: int) -> np.ndarray:
+    """
+    :return: Array with the link ids of every segment as rows, padded with -1
+    """
+    index = Index.create(segment_of_link, number_of_segments)
+    counts = np.diff(index.offsets)
+    segments = segment_of_link[index.order]
+    positions = np.arange(len(segment_of_link)) - index.offsets[segments]
+
+    segment_links = np.full((number_of_segments, counts.max()), -1)
+    segment_links[segments, positions] = index.order
+    return segment_links
+
+
+def _get_link_pairs(segment_links: np.ndarray, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    first_links = np.repeat(segment_links[first], segment_links.shape[1], axis=1).ravel()
+    second_links = np.tile(segment_links[second], segment_links.shape[1]).ravel()
+    is_link_pair = (first_links >= 0) & (second_links >= 0)
+    first_links, second_links = first_links[is_link_pair], second_links[is_link_pair]
+    return np.stack([np.minimum(first_links, second_links), np.maximum(first_links, second_links)], axis=1)
@@ -0,0 +1,146 @@
+import math
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import combinations
+
+import numpy as np
+
+from opti_test.core import CoreData
+from opti_test.crossings import get_crossing_pairs
+from opti_test.model_builder import ModelBuilder
+from opti_test.model_data import ModelData, Parameters, SolverSettings
+
+
+class DecompositionBuilder:
+    """
+    Splits the farm into one cluster per substation, solves the clusters as independent ModelBuilder subproblems in a
+    process pool and merges their layouts. Two rules couple the clusters after the merge:
+
+    - If the clusters use more cable types than allowed, all clusters are re-solved with every admissible combination
+      of the cable types they used, and the cheapest combination is kept.
+    - If links of different clusters cross, these clusters are merged into one and solved again.
+
+    The layout is feasible for the full problem, but not necessarily optimal, as links between clusters are not used.
+    """
+
+    def __init__(self, model_data: ModelData, parameters: Parameters, solver_settings: SolverSettings | None = None):
+        self.model_data = model_data
+        self.parameters = parameters
+        self.solver_settings = SolverSettings() if solver_settings is None else solver_settings
+
+    def solve(self) -> list | None:
+        core = self.model_data.core
+        if not core.is_turbine.any():
+            return []
+        if core.is_turbine.all():
+            return None
+
+        assignment = get_substation_assignment(core, self.solver_settings.max_turbines_per_substation)
+        clusters = [[s] + np.flatnonzero(assignment == s).tolist() for s in np.unique(assignment).tolist()]
+        all_cable_types = list(range(len(self.model_data.cable_types)))
+
+        with ProcessPoolExecutor(max_workers=self.solver_settings.decomposition_workers) as executor:
+            while True:
+                layouts = self._solve_clusters(executor, clusters, all_cable_types)
+                if layouts is None:
+                    return None
+
+                used_cable_types = sorted({self.model_data.cable_types.index(c.cable_type) for c in _merge(layouts)})
+                if len(used_cable_types) > self.parameters.max_number_of_cable_types:
+                    layouts = self._solve_with_cable_type_limit(executor, clusters, used_cable_types)
+                    if layouts is None:
+                        return None
+
+                crossing_clusters = _get_crossing_clusters(layouts)
+                if len(crossing_clusters) == 0:
+                    return _merge(layouts)
+                clusters = _merge_clusters(clusters, crossing_clusters)
+
+    def _solve_clusters(self, executor: Executor, clusters: list[list[int]], cable_types: list[int]) -> list | None:
+        """
+        :return: The layout of every cluster, or None if a cluster has no layout
+        """
+        subproblems = [self.model_data.get_subproblem(cluster, cable_types) for cluster in clusters]
+        layouts = list(
+            executor.map(
+                _solve_subproblem,
+                subproblems,
+                [self.parameters] * len(clusters),
+                [self.solver_settings] * len(clusters),
+            )
+        )
+        return None if any(layout is None for layout in layouts) else layouts
+
+    def _solve_with_cable_type_limit(
+        self, executor: Executor, clusters: list[list[int]], used_cable_types: list[int]
+    ) -> list | None:
+        best_layouts, best_cost = None, math.inf
+        for cable_types in combinations(used_cable_types, self.parameters.max_number_of_cable_types):
+            layouts = self._solve_clusters(executor, clusters, list(cable_types))
+            cost = math.inf if layouts is None else sum(c.get_cost() for c in _merge(layouts))
+            if cost < best_cost:
+                best_layouts, best_cost = layouts, cost
+        return best_layouts
+
+
+def get_substation_assignment(core: CoreData, max_turbines_per_substation: int | None = None) -> np.ndarray:
+    """
+    Assigns every turbine to its nearest substation. With a capacity, the turbines with the largest regret, i.e. the
+    largest detour to their second nearest substation, are assigned first, to the nearest substation with capacity left.
+
+    :return: The id of the assigned substation for every turbine, and -1 for the substations
+    """
+    turbines, substations = np.flatnonzero(core.is_turbine), np.flatnonzero(~core.is_turbine)
+    distances = core.coordinates.get_distance_matrix_in_km()[np.ix_(turbines, substations)]
+    assignment = np.full(len(core.is_turbine), -1)
+
+    if max_turbines_per_substation is None:
+        assignment[turbines] = substations[np.argmin(distances, axis=1)]
+        return assignment
+    if max_turbines_per_substation * len(substations) < len(turbines):
+        raise ValueError(
+            f"{len(substations)} substations with {max_turbines_per_substation} turbines each cannot connect "
+            f"{len(turbines)} turbines"
+        )
+
+    sorted_distances = np.sort(distances, axis=1)
+    regret = sorted_distances[:, 1] - sorted_distances[:, 0] if len(substations) > 1 else sorted_distances[:, 0]
+    remaining_capacity = np.full(len(substations), max_turbines_per_substation)
+    for num in np.argsort(-regret, kind="stable").tolist():
+        substation = np.argmin(np.where(remaining_capacity > 0, distances[num], math.inf))
+        remaining_capacity[substation] -= 1
+        assignment[turbines[num]] = substations[substation]
+    return assignment
+
+
+def _solve_subproblem(model_data: ModelData, parameters: Parameters, solver_settings: SolverSettings) -> list | None:
+    return ModelBuilder(model_data, parameters, solver_settings).solve()
+
+
+def _merge(layouts: list[list]) -> list:
+    return [c for layout in layouts for c in layout]
+
+
+def _get_crossing_clusters(layouts: list[list]) -> list[tuple[int, int]]:
+    """
+    :return: The pairs of clusters with crossing links
+    """
+    cluster_of_connection = np.repeat(np.arange(len(layouts)), [len(layout) for layout in layouts])
+    pairs = cluster_of_connection[get_crossing_pairs([c.link for c in _merge(layouts)])]
+    return sorted({(i, j) for i, j in pairs.tolist() if i != j})
+
+
+def _merge_clusters(clusters: list[list[int]], crossing_clusters: list[tuple[int, int]]) -> list[list[int]]:
+    parent = list(range(len(clusters)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            i = parent[i]
+        return i
+
+    for i, j in crossing_clusters:
+        parent[find(j)] = find(i)
+
+    merged = {}
+    for num, cluster in enumerate(clusters):
+        merged.setdefault(find(num), []).extend(cluster)
+    return list(merged.values())
@@ -0,0 +1,145 @@
+import math
+
+import numpy as np
+
+# Orientations that are tiny relative to the coordinates, or computed from (nearly) underflowing products, are left to
+# shapely, which is only imported for them. The relative tolerance is far above the floating point error of the
+# orientation test, so the remaining signs are exact and agree with shapely, which itself is not exact for nearly
+# degenerate segments.
+_RELATIVE_TOLERANCE = 1e-9
+_MIN_RELIABLE_MAGNITUDE = 1e-280
+
+
+class UnitCoordinates:
+    """
+    Contiguous coordinate arrays of a list of units, indexed by the position of the unit in the list
+    """
+
+    def __init__(self, units: list):
+        self.names = [u.name for u in units]
+        self.x = np.ascontiguousarray([u.x for u in units], dtype=float)
+        self.y = np.ascontiguousarray([u.y for u in units], dtype=float)
+        self._index = {_get_unit_key(u): num for num, u in enumerate(units)}
+        self._distance_matrix = None
+
+    def get_index(self, unit) -> int:
+        return self._index[_get_unit_key(unit)]
+
+    def move(self, num: int, unit):
+        """
+        Moves the unit at position num to the coordinates of the given unit with the same name
+        """
+        del self._index[(self.names[num], self.x[num].item(), self.y[num].item())]
+        self._index[_get_unit_key(unit)] = num
+        self.x[num], self.y[num] = unit.x, unit.y
+        if self._distance_matrix is not None:
+            distances = get_distance_matrix_in_km(self.x[num : num + 1], self.y[num : num + 1], self.x, self.y)[0]
+            self._distance_matrix[num, :] = self._distance_matrix[:, num] = distances
+
+    def get_distance_matrix_in_km(self) -> np.ndarray:
+        if self._distance_matrix is None:
+            self._distance_matrix = get_distance_matrix_in_km(self.x, self.y)
+        return self._distance_matrix
+
+
+def _get_unit_key(unit) -> tuple[str, float, float]:
+    return unit.name, unit.x, unit.y
+
+
+def get_distance_in_km(x1: float, y1: float, x2: float, y2: float) -> float:
+    return math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2) / 1000
+
+
+def get_distance_matrix_in_km(
+    x: np.ndarray, y: np.ndarray, x2: np.ndarray | None = None, y2: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    :return: The distances between the points (x, y) as rows and the points (x2, y2) as columns, which are the points
+        (x, y) if not given
+    """
+    x2, y2 = (x, y) if x2 is None else (x2, y2)
+    return np.sqrt((x[:, None] - x2[None, :]) ** 2 + (y[:, None] - y2[None, :]) ** 2) / 1000
+
+
+def are_crossing(start1: np.ndarray, end1: np.ndarray, start2: np.ndarray, end2: np.ndarray) -> np.ndarray:
+    """
+    Checks for a block of segment pairs whether the segments cross, i.e. whether their interiors intersect in a
+    single point. This matches shapely's `crosses` for two lines.
+
+    :param start1: (n, 2) array with the start points of the first segments
+    :param end1: (n, 2) array with the end points of the first segments
+    :param start2: (n, 2) array with the start points of the second segments
+    :param end2: (n, 2) array with the end points of the second segments
+    :return: Boolean array of length n
+    """
+    is_crossing, is_certain = get_certain_crossings(start1, end1, start2, end2)
+    uncertain = np.flatnonzero(~is_certain)
+    if len(uncertain) > 0:
+        import shapely
+
+        lines1 = shapely.linestrings(np.stack([start1[uncertain], end1[uncertain]], axis=1))
+        lines2 = shapely.linestrings(np.stack([start2[uncertain], end2[uncertain]], axis=1))
+        is_crossing[uncertain] = shapely.crosses(lines1, lines2)
+
+    return is_crossing
+
+
+def get_certain_crossings(
+    start1: np.ndarray, end1: np.ndarray, start2: np.ndarray, end2: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Version of `are_crossing` without the shapely fallback. shapely's `crosses` depends on the order and direction of
+    nearly degenerate segments, so callers which check a segment for several links decide the uncertain pairs per link.
+
+    :return: Boolean arrays of length n, whether the segments cross and whether that is certain, where the first is
+        only valid if the second is True
+    """
+    sign1, is_certain1 = _get_orientations(start1, end1, start2)
+    sign2, is_certain2 = _get_orientations(start1, end1, end2)
+    sign3, is_certain3 = _get_orientations(start2, end2, start1)
+    sign4, is_certain4 = _get_orientations(start2, end2, end1)
+
+    is_separated = (is_certain1 & is_certain2 & (sign1 == sign2)) | (is_certain3 & is_certain4 & (sign3 == sign4))
+    is_certain = is_separated | (is_certain1 & is_certain2 & is_certain3 & is_certain4)
+    return ~is_separated & (sign1 != sign2) & (sign3 != sign4), is_certain
+
+
+def is_crossing(start1: tuple, end1: tuple, start2: tuple, end2: tuple) -> bool:
+    """
+    Scalar version of `are_crossing` for a single pair of segments given as (x, y) tuples
+    """
+    sign1, is_certain1 = _get_orientation(start1, end1, start2)
+    sign2, is_certain2 = _get_orientation(start1, end1, end2)
+    sign3, is_certain3 = _get_orientation(start2, end2, start1)
+    sign4, is_certain4 = _get_orientation(start2, end2, end1)
+
+    if (is_certain1 and is_certain2 and sign1 == sign2) or (is_certain3 and is_certain4 and sign3 == sign4):
+        return False
+    if is_certain1 and is_certain2 and is_certain3 and is_certain4:
+        return True
+
+    import shapely
+
+    return shapely.LineString([start1, end1]).crosses(shapely.LineString([start2, end2]))
+
+
+def _get_orientations(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    left = (a[:, 0] - c[:, 0]) * (b[:, 1] - c[:, 1])
+    right = (a[:, 1] - c[:, 1]) * (b[:, 0] - c[:, 0])
+    determinant = left - right
+    magnitude = np.abs(left) + np.abs(right)
+    scale = np.max(np.abs(np.concatenate([a, b, c], axis=1)), axis=1)
+
+    is_certain = (np.abs(determinant) > _RELATIVE_TOLERANCE * scale**2) & (magnitude > _MIN_RELIABLE_MAGNITUDE)
+    return np.sign(determinant), is_certain
+
+
+def _get_orientation(a: tuple, b: tuple, c: tuple) -> tuple[float, bool]:
+    left = (a[0] - c[0]) * (b[1] - c[1])
+    right = (a[1] - c[1]) * (b[0] - c[0])
+    determinant = left - right
+    magnitude = abs(left) + abs(right)
+    scale = max(abs(a[0]), abs(a[1]), abs(b[0]), abs(b[1]), abs(c[0]), abs(c[1]))
+
+    is_certain = abs(determinant) > _RELATIVE_TOLERANCE * scale**2 and magnitude > _MIN_RELIABLE_MAGNITUDE
+    return math.copysign(1.0, determinant), is_certain
@@ -0,0 +1,189 @@
+import math
+from itertools import combinations
+
+import numpy as np
+
+from opti_test.crossings import get_crossing_link_pairs
+from opti_test.geometry import are_crossing
+from opti_test.model_data import ModelData, Parameters
+
+
+class HeuristicBuilder:
+    """
+    Constructive heuristic with the same interface as the ModelBuilder. For every admissible combination of cable
+    types, a capacitated tree is built with the Esau-Williams heuristic, rejecting links that cross the tree. Each link
+    then gets the cheapest cable of the combination which carries its flow, and the cheapest layout is returned.
+    """
+
+    def __init__(self, model_data: ModelData, parameters: Parameters):
+        self.model_data = model_data
+        self.parameters = parameters
+
+        self.core = model_data.core
+        self.coordinates = self.core.coordinates
+        self.points = np.stack([self.coordinates.x, self.coordinates.y], axis=1)
+        self.distances = self.coordinates.get_distance_matrix_in_km()
+        self.is_turbine = self.core.is_turbine
+        # Id of the link between two units, or -1 if there is none
+        self.link_ids = np.full(self.distances.shape, -1)
+        self.link_ids[self.core.link_origin, self.core.link_destination] = np.arange(len(self.core.link_origin))
+
+    def solve(self) -> list | None:
+        if not self.is_turbine.any():
+            return []
+
+        trees = {}
+        best_layout, best_cost = None, math.inf
+        for cable_types in self._get_cable_type_combinations():
+            capacity = int(self.core.cable_capacity[list(cable_types)].max() // self.parameters.mw_produced_per_turbine)
+            if capacity not in trees:
+                trees[capacity] = self._build_tree(capacity)
+            if trees[capacity] is None:
+                continue
+
+            layout = self._assign_cable_types(trees[capacity], cable_types)
+            cost = self.core.get_connection_costs()[layout].sum() if layout is not None else math.inf
+            if cost < best_cost:
+                best_layout, best_cost = layout, cost
+        if best_layout is None:
+            return None
+        return [self.model_data.get_connection(num) for num in best_layout.tolist()]
+
+    def _get_cable_type_combinations(self):
+        cable_types = sorted(
+            range(len(self.model_data.cable_types)),
+            key=lambda num: (
+                self.core.cable_capacity[num],
+                self.core.cable_cost_per_km[num],
+                self.model_data.cable_types[num].name,
+            ),
+        )
+        max_number_of_cable_types = min(self.parameters.max_number_of_cable_types, len(cable_types))
+        for number_of_cable_types in range(1, max_number_of_cable_types + 1):
+            yield from combinations(cable_types, number_of_cable_types)
+
+    def _build_tree(self, capacity: int) -> dict[int, int] | None:
+        """
+        :return: The next unit towards the substation for every turbine, or None if no tree is found
+        """
+        if capacity < 1:
+            return None
+
+        turbines = np.flatnonzero(self.is_turbine).tolist()
+        available = self.link_ids >= 0
+
+        # Initially, every turbine forms its own component, connected through its gate to the nearest substation.
+        # Components are identified by the turbine at their gate.
+        component = {i: i for i in turbines}
+        members = {i: [i] for i in turbines}
+        gate = {}
+        for i in turbines:
+            substations = np.flatnonzero(available[i] & ~self.is_turbine)
+            gate[i] = substations[np.argmin(self.distances[i, substations])].item() if len(substations) else None
+        # Every component has one edge to the substation, which is replaced by the edge attaching it to another
+        # component, so the edges are kept in one row per turbine. Units of -1 mark components without a gate.
+        edges = np.array([(i, -1 if gate[i] is None else gate[i]) for i in turbines], dtype=int).reshape(-1, 2)
+        edge_of_component = {i: num for num, i in enumerate(turbines)}
+
+        # Tradeoff of attaching the component of turbine i to turbine j instead of using its gate
+        is_open = available & available.T & np.outer(self.is_turbine, self.is_turbine)
+        tradeoffs = np.full(self.distances.shape, math.inf)
+        for i in turbines:
+            self._update_tradeoffs(tradeoffs, is_open, i, self._get_gate_cost(i, gate[i]))
+        best_per_turbine = np.min(tradeoffs, axis=1)
+
+        while True:
+            i = int(np.argmin(best_per_turbine))
+            if not best_per_turbine[i] < 0:
+                break
+            j = int(np.argmin(tradeoffs[i]))
+            source, target = component[i], component[j]
+            is_open[i, j] = is_open[j, i] = False
+            tradeoffs[i, j] = tradeoffs[j, i] = math.inf
+            best_per_turbine[[i, j]] = tradeoffs[[i, j]].min(axis=1)
+
+            if source == target or len(members[source]) + len(members[target]) > capacity:
+                continue
+            if self._is_crossing_edges(i, j, edges):
+                continue
+
+            # The source component is attached to the target component, so its own gate is not needed anymore
+            gate.pop(source)
+            edges[edge_of_component.pop(source)] = (i, j)
+            for member in members.pop(source):
+                component[member] = target
+                members[target].append(member)
+            gate_cost = self._get_gate_cost(target, gate[target])
+            for member in members[target]:
+                self._update_tradeoffs(tradeoffs, is_open, member, gate_cost)
+                best_per_turbine[member] = tradeoffs[member].min()
+
+        if any(gate[c] is None for c in members):
+            return None
+        return self._orient_tree({(i, j) for i, j in edges[edges[:, 1] >= 0].tolist()}, gate)
+
+    def _get_gate_cost(self, root: int, gate: int | None) -> float:
+        return math.inf if gate is None else self.distances[root, gate].item()
+
+    def _update_tradeoffs(self, tradeoffs: np.ndarray, is_open: np.ndarray, i: int, gate_cost: float):
+        tradeoffs[i] = np.where(is_open[i], self.distances[i] - gate_cost, math.inf)
+
+    def _is_crossing_edges(self, i: int, j: int, edges: np.ndarray) -> bool:
+        edges = edges[(edges[:, 1] >= 0) & (edges != i).all(axis=1) & (edges != j).all(axis=1)]
+        start, end = np.repeat(self.points[[i]], len(edges), axis=0), np.repeat(self.points[[j]], len(edges), axis=0)
+        return bool(are_crossing(start, end, self.points[edges[:, 0]], self.points[edges[:, 1]]).any())
+
+    def _orient_tree(self, edges: set[tuple[int, int]], gate: dict[int, int]) -> dict[int, int]:
+        neighbours = {}
+        for i, j in edges:
+            if self.is_turbine[j]:
+                neighbours.setdefault(i, []).append(j)
+                neighbours.setdefault(j, []).append(i)
+
+        parent = {}
+        for root, substation in gate.items():
+            # The gate is the edge from the component root, which is the turbine with the component id
+            parent[root] = substation
+            stack = [root]
+            while stack:
+                current = stack.pop()
+                for neighbour in neighbours.get(current, []):
+                    if neighbour not in parent:
+                        parent[neighbour] = current
+                        stack.append(neighbour)
+        return parent
+
+    def _assign_cable_types(self, parent: dict[int, int], cable_types: tuple[int, ...]) -> np.ndarray | None:
+        """
+        :return: The ids of the connections of the layout, or None if the tree cannot be built with the cable types
+        """
+        number_of_turbines = {i: 0 for i in parent}
+        for i in parent:
+            current, visited = i, set()
+            while current in parent and current not in visited:
+                visited.add(current)
+                number_of_turbines[current] += 1
+                current = parent[current]
+
+        cheapest_first = sorted(cable_types, key=lambda num: self.core.cable_cost_per_km[num])
+        layout = []
+        for i, j in parent.items():
+            flow = number_of_turbines[i] * self.parameters.mw_produced_per_turbine
+            cable_type = next((c for c in cheapest_first if self.core.cable_capacity[c] >= flow), None)
+            link = self.link_ids[i, j].item()
+            if cable_type is None or link < 0:
+                return None
+            layout.append(self.core.get_connection_id(link, cable_type))
+
+        layout = np.array(layout, dtype=int)
+        links = self.core.connection_link[layout]
+        crossing_pairs = get_crossing_link_pairs(
+            self.core.link_origin[links],
+            self.core.link_destination[links],
+            self.coordinates.x,
+            self.coordinates.y,
+            self.core.unit_name,
+        )
+        if len(crossing_pairs) > 0:
+            return None
+        return layout
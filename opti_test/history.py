@@ -0,0 +1,258 @@
+from datetime import datetime
+import json
+import os
+from pathlib import Path
+import platform
+import sqlite3
+import subprocess
+
+import click
+from pydantic import BaseModel, Field
+
+from opti_test import __version__
+from opti_test.statistics import SolveStatistics
+
+DEFAULT_HISTORY_FILE = "performance_opti_test.db"
+
+
+class RunResult(BaseModel):
+    instance: str
+    status: str
+    objective_function_value: float | None = None
+    statistics: SolveStatistics = Field(default_factory=SolveStatistics)
+
+    @property
+    def total_time(self) -> float:
+        return self.statistics.get_total_time()
+
+    @property
+    def build_time(self) -> float:
+        return sum(time for phase, time in self.statistics.phase_times_in_seconds.items() if phase != "optimize")
+
+    @property
+    def solve_time(self) -> float:
+        return self.statistics.phase_times_in_seconds.get("optimize", 0.0)
+
+    @property
+    def memory_in_mb(self) -> float | None:
+        return self.statistics.memory_high_water_in_mb
+
+
+class Trend(BaseModel):
+    instance: str
+    code_version: str
+    number_of_runs: int
+    first_run: str
+    mean_total_time: float
+    min_total_time: float
+    mean_objective_function_value: float | None
+
+
+class PerformanceHistory:
+    """
+    SQLite store of performance runs. A run records the code version, git commit and machine once, and the result of
+    every instance with its solve statistics. The phase times are also stored in their own table, so that they can be
+    queried with SQL. The rows of the former "performance" table are imported once, see `_import_legacy_results`.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_HISTORY_FILE):
+        self.path = Path(path)
+        with self._connect() as connection:
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS runs
+                (RunId integer PRIMARY KEY AUTOINCREMENT, Timestamp timestamp, Suite text, CodeVersion text,
+                GitCommit text, Machine text, PythonVersion text);
+                CREATE TABLE IF NOT EXISTS results
+                (RunId integer REFERENCES runs(RunId), Instance text, Status text, TotalTime float, BuildTime float,
+                SolveTime float, ObjectiveFunctionValue float, MemoryInMb float, NumberOfVariables integer,
+                NumberOfConstraints integer, MipGap float, NodeCount integer, SimplexIterations integer,
+                Statistics text);
+                CREATE TABLE IF NOT EXISTS phase_times (RunId integer REFERENCES runs(RunId), Instance text, Phase text,
+                Time float);
+                CREATE INDEX IF NOT EXISTS results_by_instance ON results (Instance, RunId);
+            """)
+            if connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'performance'"
+            ).fetchone():
+                _import_legacy_results(connection)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def add_run(self, results: list[RunResult], suite: str = "performance") -> int:
+        """
+        Stores all results of a run in one transaction
+
+        :return: The id of the run
+        """
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "INSERT INTO runs (Timestamp, Suite, CodeVersion, GitCommit, Machine, PythonVersion) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    datetime.now().isoformat(),
+                    suite,
+                    __version__,
+                    get_git_commit(),
+                    get_machine(),
+                    platform.python_version(),
+                ),
+            )
+            run_id = cursor.lastrowid
+            connection.executemany(
+                "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        r.instance,
+                        r.status,
+                        r.total_time,
+                        r.build_time,
+                        r.solve_time,
+                        r.objective_function_value,
+                        r.memory_in_mb,
+                        r.statistics.number_of_variables,
+                        r.statistics.number_of_constraints,
+                        r.statistics.mip_gap,
+                        r.statistics.node_count,
+                        r.statistics.simplex_iterations,
+                        r.statistics.model_dump_json(),
+                    )
+                    for r in results
+                ],
+            )
+            connection.executemany(
+                "INSERT INTO phase_times VALUES (?, ?, ?, ?)",
+                [
+                    (run_id, r.instance, phase, time)
+                    for r in results
+                    for phase, time in r.statistics.phase_times_in_seconds.items()
+                ],
+            )
+        return run_id
+
+    def get_results(self, instance: str, suite: str | None = None, limit: int | None = None) -> list[RunResult]:
+        """
+        :return: The results of the instance, starting with the latest run
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                """SELECT results.Instance, results.Status, results.ObjectiveFunctionValue, results.Statistics
+                FROM results JOIN runs ON results.RunId = runs.RunId
+                WHERE results.Instance = ? AND (? IS NULL OR runs.Suite = ?)
+                ORDER BY results.RunId DESC LIMIT ?""",
+                (instance, suite, suite, -1 if limit is None else limit),
+            ).fetchall()
+        return [
+            RunResult(
+                instance=instance,
+                status=status,
+                objective_function_value=objective_function_value,
+                statistics=SolveStatistics.model_validate_json(statistics),
+            )
+            for instance, status, objective_function_value, statistics in rows
+        ]
+
+    def get_trends(self, instance: str | None = None, suite: str | None = None) -> list[Trend]:
+        """
+        :return: The aggregated results of every instance per code version, in the order of the versions
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                """SELECT results.Instance, runs.CodeVersion, COUNT(*), MIN(runs.Timestamp), AVG(results.TotalTime),
+                MIN(results.TotalTime), AVG(results.ObjectiveFunctionValue)
+                FROM results JOIN runs ON results.RunId = runs.RunId
+                WHERE (? IS NULL OR results.Instance = ?) AND (? IS NULL OR runs.Suite = ?)
+                GROUP BY results.Instance, runs.CodeVersion
+                ORDER BY results.Instance, MIN(runs.RunId)""",
+                (instance, instance, suite, suite),
+            ).fetchall()
+        return [
+            Trend(
+                instance=row[0],
+                code_version=row[1],
+                number_of_runs=row[2],
+                first_run=row[3],
+                mean_total_time=row[4],
+                min_total_time=row[5],
+                mean_objective_function_value=row[6],
+            )
+            for row in rows
+        ]
+
+    def get_report(self, instance: str | None = None, suite: str | None = None) -> str:
+        """
+        :return: A table of the trends, with the change of the mean total time relative to the previous version
+        """
+        lines = [
+            f"{'Instance':40} {'Version':10} {'Runs':>5} {'Mean time':>10} {'Min time':>10} {'Change':>8} Objective"
+        ]
+        previous = None
+        for trend in self.get_trends(instance, suite):
+            change = ""
+            if previous is not None and previous.instance == trend.instance and previous.mean_total_time > 0:
+                change = f"{trend.mean_total_time / previous.mean_total_time - 1:+.1%}"
+            lines.append(
+                f"{trend.instance:40} {trend.code_version:10} {trend.number_of_runs:>5} "
+                f"{trend.mean_total_time:>9.3f}s {trend.min_total_time:>9.3f}s {change:>8} "
+                f"{trend.mean_objective_function_value}"
+            )
+            previous = trend
+        return "\n".join(lines)
+
+
+def _import_legacy_results(connection: sqlite3.Connection):
+    """
+    Imports the rows of the "performance" table of the former performance test, and renames the table to
+    "performance_imported" in the same transaction, so that they are imported only once. The table does not record
+    which rows were written together, so every row becomes a run of its own. Its solution time was measured as a whole,
+    so it becomes the only phase, "total".
+    """
+    rows = connection.execute(
+        "SELECT Timestamp, Instance, CodeVersion, SolutionTime, ObjectiveFunctionValue FROM performance "
+        "ORDER BY Timestamp"
+    ).fetchall()
+    for timestamp, instance, code_version, solution_time, objective_function_value in rows:
+        run_id = connection.execute(
+            "INSERT INTO runs (Timestamp, Suite, CodeVersion) VALUES (?, 'performance', ?)", (timestamp, code_version)
+        ).lastrowid
+        statistics = SolveStatistics(phase_times_in_seconds={"total": solution_time})
+        connection.execute(
+            "INSERT INTO results (RunId, Instance, Status, TotalTime, ObjectiveFunctionValue, Statistics) "
+            "VALUES (?, ?, 'unknown', ?, ?, ?)",
+            (run_id, instance, solution_time, objective_function_value, statistics.model_dump_json()),
+        )
+        connection.execute("INSERT INTO phase_times VALUES (?, ?, 'total', ?)", (run_id, instance, solution_time))
+    connection.execute("ALTER TABLE performance RENAME TO performance_imported")
+
+
+def get_git_commit() -> str | None:
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def get_machine() -> str:
+    return json.dumps(
+        {
+            "node": platform.node(),
+            "system": platform.system(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+        }
+    )
+
+
+@click.command
+@click.option("--db_name", default=DEFAULT_HISTORY_FILE, help="sqlite file with the performance history")
+@click.option("--instance", default=None, help="only report this instance")
+@click.option("--suite", default=None, help="only report this suite, e.g. performance or benchmark")
+def report(db_name: str, instance: str | None, suite: str | None):
+    click.echo(PerformanceHistory(db_name).get_report(instance, suite))
+
+
+if __name__ == "__main__":
+    report()
@@ -0,0 +1,93 @@
+import os
+import tempfile
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+# Seconds between two reads of the improving solutions while HiGHS is solving
+_POLL_INTERVAL = 0.2
+
+
+class IncumbentWatcher:
+    """
+    Calls back with every improving solution while HiGHS is solving. HiGHS has no solution callback here, so it writes
+    the improving solutions to a file, which is read in a background thread, as HiGHS releases the GIL while solving.
+    The callback is therefore called from that thread, and its errors are raised when the solve has finished.
+
+    Usage:
+        with IncumbentWatcher(model, on_solution):
+            model.optimize()
+    """
+
+    def __init__(self, model, on_solution: Callable[[float, np.ndarray, np.ndarray], None]):
+        """
+        :param on_solution: Called with the objective function value, and the column indices and values of the
+            non-zero columns of every improving solution
+        """
+        self.model = model
+        self.on_solution = on_solution
+        self._number_of_solutions = 0
+        self._error = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        file_descriptor, file = tempfile.mkstemp(prefix="opti_test_", suffix=".sol")
+        os.close(file_descriptor)
+        self.file = Path(file)
+        self.model.set_raw_parameter("mip_improving_solution_save", True)
+        self.model.set_raw_parameter("mip_improving_solution_report_sparse", True)
+        self.model.set_raw_parameter("mip_improving_solution_file", file)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exception):
+        self._stop.set()
+        self._thread.join()
+        self.model.set_raw_parameter("mip_improving_solution_save", False)
+        # HiGHS has closed the file, so the solutions found since the last read are complete now
+        self._read()
+        self.file.unlink(missing_ok=True)
+        if self._error is not None and exception[0] is None:
+            raise self._error
+
+    def _run(self):
+        while not self._stop.wait(_POLL_INTERVAL):
+            self._read()
+
+    def _read(self):
+        if self._error is not None:
+            return
+        try:
+            solutions = get_improving_solutions(self.file.read_text())
+            for objective_function_value, columns, values in solutions[self._number_of_solutions :]:
+                self._number_of_solutions += 1
+                self.on_solution(objective_function_value, columns, values)
+        except Exception as error:
+            self._error = error
+
+
+def get_improving_solutions(text: str) -> list[tuple[float, np.ndarray, np.ndarray]]:
+    """
+    :param text: Content of a sparse HiGHS improving solution file, which may still be written
+    :return: The objective function value, and the column indices and values of the non-zero columns, of every
+        complete solution in the text
+    """
+    # The last line is incomplete if it does not end with a newline yet
+    lines = text.split("\n")[:-1]
+    solutions = []
+    position = 0
+    while position + 1 < len(lines) and lines[position].startswith("Objective"):
+        number_of_columns = -int(lines[position + 1].split()[-1])
+        block = lines[position + 2 : position + 2 + number_of_columns]
+        if len(block) < number_of_columns:
+            break
+        # Lines are "<name> <value> <index>", and names may contain spaces
+        values, columns = zip(*(line.rsplit(maxsplit=2)[1:] for line in block)) if block else ((), ())
+        solutions.append(
+            (float(lines[position].split()[-1]), np.array(columns, dtype=int), np.array(values, dtype=float))
+        )
+        position += 2 + number_of_columns
+    return solutions
@@ -0,0 +1,151 @@
+import multiprocessing
+import os
+import re
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from pydantic import BaseModel
+
+from opti_test.array_cable_problem import ArrayCableProblem
+from opti_test.cache import ResultCache
+from opti_test.model_data import ModelData
+from opti_test.processes import start_process_group, terminate_process_group
+
+# Line of the HiGHS branch and bound log, e.g. with fewer spaces between the columns
+#  L  0  0  0  0.00%  0.0413464953  0.0428064496  3.41%  6143  238  30  2692  21.6s
+_PROGRESS_LINE = re.compile(
+    r"^\s*(?:[A-Za-z]\s+)?\d+\s+\d+\s+\d+\s+[\d.]+%\s+(\S+)\s+(\S+)\s+(\S+)\s+.*\d+\s+[\d.]+s\s*$"
+)
+
+
+class SolveProgress(BaseModel):
+    elapsed_time_in_seconds: float
+    objective_function_value: float | None = None
+    best_bound: float | None = None
+    gap: float | None = None
+
+
+class SolveJob:
+    """
+    Creates the layout of a problem in a separate process, so that the caller is not blocked and can cancel the solve.
+    HiGHS has no progress callback, so the progress is read from the log file of the solver.
+    """
+
+    def __init__(
+        self,
+        array_cable_problem: ArrayCableProblem,
+        method: str = "mip",
+        cache_file: str | Path | None = None,
+        model_data: ModelData | None = None,
+    ):
+        """
+        :param cache_file: sqlite file of the result cache, or None to always solve the problem
+        :param model_data: Model data of the problem, e.g. kept across reruns of an app
+        """
+        self.solver_settings = array_cable_problem.solver_settings
+        file_descriptor, log_file = tempfile.mkstemp(prefix="opti_test_", suffix=".log")
+        os.close(file_descriptor)
+        self.log_file = Path(log_file)
+        problem = array_cable_problem.model_copy(
+            update={"solver_settings": self.solver_settings.model_copy(update={"log_file": str(self.log_file)})}
+        )
+
+        # Spawned instead of forked, as the caller may run threads, e.g. the Streamlit server. The process is not a
+        # daemon, as the decomposition solves its clusters in a process pool, which cancel terminates with it.
+        context = multiprocessing.get_context("spawn")
+        self._receiver, sender = context.Pipe(duplex=False)
+        self._process = context.Process(target=_create_layout, args=(problem, method, cache_file, model_data, sender))
+        self._start = perf_counter()
+        self._end = None
+        self._process.start()
+        sender.close()
+
+        self.result: ArrayCableProblem | None = None
+        self.error: str | None = None
+        self.is_cancelled = False
+
+    def is_running(self) -> bool:
+        self._receive()
+        return self._end is None
+
+    def get_progress(self) -> SolveProgress:
+        self._receive()
+        end = perf_counter() if self._end is None else self._end
+        log = self.log_file.read_text(errors="replace") if self.log_file.exists() else ""
+        return SolveProgress(elapsed_time_in_seconds=end - self._start, **get_progress_from_log(log))
+
+    def cancel(self):
+        if self._end is None:
+            terminate_process_group(self._process)
+            self._end = perf_counter()
+            self.is_cancelled = True
+
+    def close(self):
+        """
+        Cancels the solve if it is running, and removes the log file
+        """
+        self.cancel()
+        self._receiver.close()
+        self.log_file.unlink(missing_ok=True)
+
+    def _receive(self):
+        if self._end is not None:
+            return
+        # The result is received before the process ends, as it blocks on sending large results until they are read
+        if self._receiver.poll():
+            try:
+                kind, content = self._receiver.recv()
+            except EOFError:
+                kind, content = "error", "The solve process stopped without a result"
+            if kind == "result":
+                self.result = ArrayCableProblem.model_validate_json(content)
+                self.result.solver_settings = self.solver_settings
+            else:
+                self.error = content
+        elif self._process.is_alive():
+            return
+        else:
+            self.error = "The solve process stopped without a result"
+        self._process.join()
+        self._end = perf_counter()
+
+
+def get_progress_from_log(log: str) -> dict[str, float | None]:
+    """
+    :return: The objective function value of the incumbent, the best bound and the relative gap from the last progress
+        line of a HiGHS log, which are None if not known yet
+    """
+    for line in reversed(log.splitlines()):
+        match = _PROGRESS_LINE.match(line)
+        if match is not None:
+            best_bound, objective_function_value, gap = match.groups()
+            return {
+                "objective_function_value": _to_float(objective_function_value),
+                "best_bound": _to_float(best_bound),
+                "gap": None if not gap.endswith("%") else float(gap[:-1]) / 100,
+            }
+    return {}
+
+
+def _to_float(value: str) -> float | None:
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    return number if abs(number) != float("inf") else None
+
+
+def _create_layout(
+    problem: ArrayCableProblem, method: str, cache_file: str | Path | None, model_data: ModelData | None, sender
+):
+    start_process_group()
+    try:
+        problem.create_layout(
+            None if cache_file is None else ResultCache(cache_file), method=method, model_data=model_data
+        )
+        sender.send(("result", problem.model_dump_json()))
+    except Exception as error:
+        sender.send(("error", repr(error)))
+    finally:
+        sender.close()
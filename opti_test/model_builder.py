@@ -1,109 +1,516 @@
+import math
+from collections.abc import Callable
+from time import perf_counter
+
+import numpy as np
 import pyoptinterface as poi
 from pyoptinterface import highs, VariableDomain
 
-from .model_data import ModelData, Parameters
+from .classes import Connection
+from .crossings import get_crossing_link_pairs, get_crossing_link_pairs_of
+from .incumbents import IncumbentWatcher
+from .model_data import ModelData, Parameters, SolverSettings
+from .statistics import SolveStatistics
+
+# Adding or deleting a row of a built HiGHS model takes about as long as adding a few hundred rows while building it
+_ROW_EDIT_COST_IN_ROWS = 250
 
 
 class ModelBuilder:
-    def __init__(self, model_data: ModelData, parameters: Parameters):
+    def __init__(
+        self,
+        model_data: ModelData,
+        parameters: Parameters,
+        solver_settings: SolverSettings | None = None,
+        statistics: SolveStatistics | None = None,
+        is_incremental: bool = False,
+        on_incumbent: Callable[[list[Connection]], None] | None = None,
+    ):
+        """
+        :param statistics: Statistics to record the solve in, e.g. to add the phases of the caller
+        :param is_incremental: Keeps track of the non-crossing constraints, so that the model can be edited in place
+            and re-solved, at the cost of the memory for the crossing pairs
+        :param on_incumbent: Called with the connections of every improving layout while solving, from a background
+            thread, see IncumbentWatcher
+        """
         self.model_data = model_data
+        self.core = model_data.core
         self.parameters = parameters
+        self.solver_settings = SolverSettings() if solver_settings is None else solver_settings
+        self.statistics = SolveStatistics() if statistics is None else statistics
         self.model = highs.Model()
+        self.is_strong = self.solver_settings.formulation == "strong"
+        # The strong formulation counts the flow in turbines instead of MW
+        self.flow_unit = parameters.mw_produced_per_turbine if self.is_strong else 1.0
+        self.is_incremental = is_incremental
+        # Crossing pairs of the non-crossing constraints and their constraint indices, only kept if incremental
+        self._crossing_link_pairs = [np.empty((0, 2), dtype=int)]
+        self._crossing_constraints = [np.empty(0, dtype=int)]
+        self._forbidden_link_ids = set()
+        # Ids of the connections of the last layout
+        self.connection_ids = None
+        self.on_incumbent = on_incumbent
+        self._best_incumbent = math.inf
+        # Ids of the connections of the best non-crossing incumbent, kept with lazy crossings for when the time runs out
+        self._best_connection_ids = None
+        # perf_counter time at which the time limit of the current solve runs out
+        self._deadline = math.inf
+
+    def solve(self, initial_layout: list[Connection] | None = None, start: float | None = None) -> list | None:
+        """
+        :param start: perf_counter time at which the time limit starts, e.g. when the caller started to prepare the
+            solve, or the call of this method if None
+        """
+        start = perf_counter() if start is None else start
+        self._build()
+        if initial_layout is not None:
+            with self.statistics.measure("initial_layout"):
+                self._set_initial_layout(initial_layout)
+        return self._solve_model(start)
+
+    def resolve(self) -> list | None:
+        """
+        Solves the model again after editing it, starting from the last layout. HiGHS discards the start if the edits
+        made it infeasible.
+        """
+        start = perf_counter()
+        if self.connection_ids is not None:
+            with self.statistics.measure("initial_layout"):
+                self._set_initial_connections(self.connection_ids)
+        return self._solve_model(start)
+
+    def set_cable_cost(self, cable_type_id: int, cost_per_km: float):
+        self.model_data.set_cable_cost(cable_type_id, cost_per_km)
+        self._update_objective_coefficients(self.core.connections_by_cable_type.get(cable_type_id))
+
+    def move_unit(self, unit_id: int, x: float, y: float):
+        """
+        Moves the unit, keeping its links. The costs of its links are updated, and the non-crossing constraints of the
+        pairs which start or stop crossing are deleted or added, unless rebuilding the model is faster. Only possible
+        for an incremental model.
+        """
+        if not self.is_incremental:
+            raise ValueError("Units can only be moved in an incremental model")
+        core = self.core
+        link_ids = core.get_link_ids_of_unit(unit_id)
+        self.model_data.move_unit(unit_id, x, y)
+        new_pairs = get_crossing_link_pairs_of(
+            link_ids, core.link_origin, core.link_destination, core.coordinates.x, core.coordinates.y, core.unit_name
+        )
+
+        pairs, constraints = np.concatenate(self._crossing_link_pairs), np.concatenate(self._crossing_constraints)
+        codes, new_codes = pairs @ [len(core.link_origin), 1], new_pairs @ [len(core.link_origin), 1]
+        is_deleted = np.isin(pairs, link_ids).any(axis=1) & ~np.isin(codes, new_codes)
+        # With lazy crossings, the new pairs are left to the lazy constraint loop
+        is_added = ~np.isin(new_codes, codes) & (not self.solver_settings.lazy_crossings)
+        number_of_edits = np.count_nonzero(is_deleted) + np.count_nonzero(is_added)
+        if number_of_edits * _ROW_EDIT_COST_IN_ROWS > self.model.getnumrow():
+            self.model = highs.Model()
+            self._build()
+            return
 
-    def solve(self) -> list | None:
-        self._define_variables()
-        self._define_constraints()
-        self._define_objective_function()
-        return self._optimize()
+        self._update_objective_coefficients(np.flatnonzero(np.isin(core.connection_link, link_ids)))
+        for num in constraints[is_deleted].tolist():
+            self.model.delete_constraint(poi.ConstraintIndex(poi.ConstraintType.Linear, num))
+        self._crossing_link_pairs = [pairs[~is_deleted]]
+        self._crossing_constraints = [constraints[~is_deleted]]
+        self._add_non_crossing_constraints(new_pairs[is_added])
+
+    def set_parameters(self, parameters: Parameters):
+        """
+        Changes the right-hand sides of the flow balances and of the limit of cable types. The strong formulation
+        measures the flows in turbines, so a new power per turbine changes its coefficients, and it is rebuilt instead.
+        """
+        is_rebuilt = self.is_strong and parameters.mw_produced_per_turbine != self.parameters.mw_produced_per_turbine
+        self.parameters = parameters
+        if is_rebuilt:
+            self.flow_unit = parameters.mw_produced_per_turbine
+            self.model = highs.Model()
+            self._build()
+            return
+
+        for constraint in self._flow_balance_constraints:
+            self.model.set_normalized_rhs(constraint, parameters.mw_produced_per_turbine / self.flow_unit)
+        # HiGHS sets both bounds of a row to the new right-hand side, which would turn the limit into an equality
+        self.model.delete_constraint(self._cable_type_limit_constraint)
+        self._define_cable_type_limit()
+
+    def set_link_allowed(self, link_id: int, is_allowed: bool):
+        if is_allowed:
+            self._forbidden_link_ids.discard(link_id)
+        else:
+            self._forbidden_link_ids.add(link_id)
+        self.model.set_variable_attribute(
+            poi.VariableIndex(self.is_link[link_id].item()), poi.VariableAttribute.UpperBound, float(is_allowed)
+        )
+
+    def _build(self):
+        self._crossing_link_pairs = [np.empty((0, 2), dtype=int)]
+        self._crossing_constraints = [np.empty(0, dtype=int)]
+        with self.statistics.measure("variables"):
+            self._define_variables()
+            for link_id in self._forbidden_link_ids:
+                self.set_link_allowed(link_id, False)
+        with self.statistics.measure("constraints"):
+            self._define_constraints()
+            if self.is_strong:
+                self._define_valid_inequalities()
+        if not self.solver_settings.lazy_crossings:
+            with self.statistics.measure("non_crossing_constraints"):
+                self._define_non_crossing_constraints()
+        with self.statistics.measure("objective"):
+            self._define_objective_function()
+        self.statistics.number_of_variables = self.model.getnumcol()
+
+    def _solve_model(self, start: float) -> list | None:
+        self._best_incumbent = math.inf
+        self._best_connection_ids = None
+        if self.solver_settings.time_limit is not None:
+            self._deadline = start + self.solver_settings.time_limit
+            self.model.set_raw_parameter("time_limit", max(0.0, self._deadline - perf_counter()))
+        if self.solver_settings.mip_rel_gap is not None:
+            self.model.set_raw_parameter("mip_rel_gap", float(self.solver_settings.mip_rel_gap))
+        if self.solver_settings.node_limit is not None:
+            self.model.set_raw_parameter("mip_max_nodes", self.solver_settings.node_limit)
+        if self.solver_settings.threads is not None:
+            self.model.set_raw_parameter("threads", self.solver_settings.threads)
+        if self.solver_settings.log_file is not None:
+            self.model.set_raw_parameter("log_file", self.solver_settings.log_file)
+            self.model.set_raw_parameter("log_to_console", False)
+        if self.solver_settings.lazy_crossings:
+            connection_ids = self._optimize_with_lazy_crossings()
+        else:
+            connection_ids = self._optimize()
+        self.statistics.number_of_constraints = self.model.getnumrow()
+        self.connection_ids = connection_ids
+        if connection_ids is None:
+            return None
+        return [self.model_data.get_connection(num) for num in connection_ids.tolist()]
 
     def _define_variables(self):
-        self.install = {
-            c: self.model.add_variable(domain=VariableDomain.Binary, name=f"install_{c}")
-            for c in self.model_data.connections
-        }
-        self.is_link = {
-            link: self.model.add_variable(domain=VariableDomain.Binary, name=f"is_link_{link}_built")
-            for link in self.model_data.links
-        }
-        self.flow = {
-            f: self.model.add_variable(lb=0, domain=VariableDomain.Continuous, name=f"flow_in_link_{f}")
-            for f in self.model_data.links
-        }
-        self.is_cable_built = {
-            c: self.model.add_variable(domain=VariableDomain.Binary, name=f"is_cable_{c}_built")
-            for c in self.model_data.cable_types
-        }
+        # Variables are stored in arrays indexed by the ids of the core, together with their column indices
+        number_of_links = len(self.core.link_origin)
+        self.install = self._add_variables(
+            len(self.core.connection_link), VariableDomain.Binary, "install_{}", self.model_data.get_connection
+        )
+        self.is_link = self._add_variables(
+            number_of_links, VariableDomain.Binary, "is_link_{}_built", self.model_data.get_link
+        )
+        flow_domain = (
+            VariableDomain.Integer
+            if self.is_strong and self.solver_settings.integer_flows
+            else VariableDomain.Continuous
+        )
+        self.flow = self._add_variables(number_of_links, flow_domain, "flow_in_link_{}", self.model_data.get_link, lb=0)
+        self.is_cable_built = self._add_variables(
+            len(self.core.cable_capacity),
+            VariableDomain.Binary,
+            "is_cable_{}_built",
+            self.model_data.cable_types.__getitem__,
+        )
+
+    def _add_variables(self, number: int, domain: VariableDomain, name: str, get_key, **bounds) -> np.ndarray:
+        if self.solver_settings.debug_names:
+            variables = [
+                self.model.add_variable(domain=domain, name=name.format(get_key(k)), **bounds) for k in range(number)
+            ]
+            return np.array([v.index for v in variables], dtype=int)
+        variables = self.model.add_m_variables(number, domain=domain, **bounds)
+        return np.array([v.index for v in variables.tolist()], dtype=int)
+
+    def _add_constraint(self, coefficients: list[float], variables: list[int], sense, rhs: float, get_name):
+        # Names are only created in debug mode, as they take a large share of the build time for large instances
+        function = poi.ScalarAffineFunction(coefficients, variables)
+        if self.solver_settings.debug_names:
+            return self.model.add_linear_constraint(function, sense, rhs, name=get_name())
+        return self.model.add_linear_constraint(function, sense, rhs)
 
     def _map_variables(self):
         return self.install, self.is_link, self.flow, self.is_cable_built
 
     def _define_constraints(self):
         x, y, f, z = self._map_variables()  # For readability
+        core, get_link = self.core, self.model_data.get_link
+        capacity = self._get_connection_capacities()
 
-        for link in y:
-            self.model.add_linear_constraint(
-                sum(x[c] for c in self.model_data.get_connections_for_link(link)) - y[link],
+        for link, y_link, f_link in zip(range(len(y)), y.tolist(), f.tolist()):
+            connections = core.connections_by_link.get(link)
+            x_connections = x[connections].tolist()
+            self._add_constraint(
+                [1.0] * len(connections) + [-1.0],
+                x_connections + [y_link],
                 poi.Eq,
                 0,
-                name=f"Connections for link {link}",
+                lambda: f"Connections for link {get_link(link)}",
             )
-            self.model.add_linear_constraint(
-                f[link]
-                - sum(c.cable_type.max_mw_on_cable * x[c] for c in self.model_data.get_connections_for_link(link)),
+            self._add_constraint(
+                [1.0] + (-capacity[connections]).tolist(),
+                [f_link] + x_connections,
                 poi.Leq,
                 0,
-                name=f"Limit flow for link {link}",
+                lambda: f"Limit flow for link {get_link(link)}",
             )
 
-        for u in self.model_data.turbines:
-            self.model.add_linear_constraint(
-                sum(f[o] for o in self.model_data.get_outgoing_from_unit(u))
-                - sum(f[i] for i in self.model_data.get_incoming_into_unit(u)),
-                poi.Eq,
-                self.parameters.mw_produced_per_turbine,
-                name=f"Flow balance for {u}",
+        # The right-hand sides which depend on the parameters are kept, so that they can be changed in place
+        flow_balance_constraints = []
+        for u in np.flatnonzero(core.is_turbine).tolist():
+            outgoing = f[core.outgoing_by_unit.get(u)].tolist()
+            incoming = f[core.incoming_by_unit.get(u)].tolist()
+            flow_balance_constraints.append(
+                self._add_constraint(
+                    [1.0] * len(outgoing) + [-1.0] * len(incoming),
+                    outgoing + incoming,
+                    poi.Eq,
+                    self.parameters.mw_produced_per_turbine / self.flow_unit,
+                    lambda: f"Flow balance for {self.model_data.units[u]}",
+                )
             )
-            self.model.add_linear_constraint(
-                sum(y[link] for link in self.model_data.get_outgoing_from_unit(u)),
+            self._add_constraint(
+                [1.0] * len(outgoing),
+                y[core.outgoing_by_unit.get(u)].tolist(),
                 poi.Eq,
                 1,
-                name=f"Enforce link being built for {u}",
+                lambda: f"Enforce link being built for {self.model_data.units[u]}",
             )
 
-        for cable_type in z:
-            for c in self.model_data.get_connections_with_same_cable_type(cable_type):
-                self.model.add_linear_constraint(
-                    x[c] - z[cable_type],
+        for cable_type, z_cable_type in zip(range(len(z)), z.tolist()):
+            connections = core.connections_by_cable_type.get(cable_type)
+            for c, x_connection in zip(connections.tolist(), x[connections].tolist()):
+                self._add_constraint(
+                    [1.0, -1.0],
+                    [x_connection, z_cable_type],
                     poi.Leq,
                     0,
-                    name=f"Enable cable type selection for cable {cable_type} and connection {c}",
+                    lambda: "Enable cable type selection for cable {} and connection {}".format(
+                        self.model_data.cable_types[cable_type], self.model_data.get_connection(c)
+                    ),
                 )
 
-        self.model.add_linear_constraint(
-            sum(z.values()) <= self.parameters.max_number_of_cable_types, name="Limit number of cables"
+        self._flow_balance_constraints = flow_balance_constraints
+        self._define_cable_type_limit()
+
+    def _define_cable_type_limit(self):
+        _, _, _, z = self._map_variables()  # For readability
+        self._cable_type_limit_constraint = self._add_constraint(
+            [1.0] * len(z),
+            z.tolist(),
+            poi.Leq,
+            self.parameters.max_number_of_cable_types,
+            lambda: "Limit number of cables",
         )
 
-        self._add_non_crossing_constraints()
+    def _get_connection_capacities(self) -> np.ndarray:
+        """
+        :return: The capacity of every connection in the unit of the flow. The strong formulation rounds it down to
+            whole turbines, and to the number of turbines which can be upstream of the link.
+        """
+        core = self.core
+        capacity = core.cable_capacity[core.connection_cable_type]
+        if not self.is_strong:
+            return capacity
+        number_of_turbines = np.count_nonzero(core.is_turbine)
+        upstream_turbines = number_of_turbines - core.is_turbine[core.link_destination]
+        return np.minimum(np.floor(capacity / self.flow_unit + 1e-9), upstream_turbines[core.connection_link])
+
+    def _define_valid_inequalities(self):
+        # Valid for every layout, as each built link carries at least the turbine at its origin, and each cable carries
+        # at most the turbines of the largest cable type
+        _, y, f, _ = self._map_variables()  # For readability
+        core, get_link = self.core, self.model_data.get_link
+        number_of_turbines = np.count_nonzero(core.is_turbine)
+        max_turbines_per_cable = int(np.floor(core.cable_capacity / self.flow_unit + 1e-9).max(initial=0))
+        if number_of_turbines == 0 or max_turbines_per_cable == 0:
+            return
 
-    def _add_non_crossing_constraints(self):
+        for link, y_link, f_link in zip(range(len(y)), y.tolist(), f.tolist()):
+            self._add_constraint(
+                [1.0, -1.0], [f_link, y_link], poi.Geq, 0, lambda: f"Minimum flow for link {get_link(link)}"
+            )
+
+        into_substation = np.flatnonzero(~core.is_turbine[core.link_destination])
+        self._add_constraint(
+            [1.0] * len(into_substation),
+            y[into_substation].tolist(),
+            poi.Geq,
+            math.ceil(number_of_turbines / max_turbines_per_cable),
+            lambda: "Minimum number of feeders",
+        )
+
+        for u in np.flatnonzero(core.is_turbine).tolist():
+            incoming = core.incoming_by_unit.get(u)
+            if len(incoming) >= max_turbines_per_cable:
+                self._add_constraint(
+                    [1.0] * len(incoming),
+                    y[incoming].tolist(),
+                    poi.Leq,
+                    max_turbines_per_cable - 1,
+                    lambda: f"Maximum number of incoming links for {self.model_data.units[u]}",
+                )
+
+    def _define_non_crossing_constraints(self):
+        # The crossing pairs are by far the largest part of the model, so they are streamed into it block by block
+        for crossing_link_pairs in self.model_data.iter_crossing_link_pairs():
+            self._add_non_crossing_constraints(crossing_link_pairs)
+
+    def _add_non_crossing_constraints(self, crossing_link_pairs: np.ndarray):
         _, y, _, _ = self._map_variables()  # For readability
+        get_link = self.model_data.get_link
 
-        for num1, link1 in enumerate(y):
-            for num2, link2 in enumerate(y):
-                if num2 > num1 and link1.check_if_crossing(link2):
-                    self.model.add_linear_constraint(
-                        y[link1] + y[link2], poi.Leq, 1, name=f"Non crossing for {link1},{link2}"
-                    )
+        constraints = [
+            self._add_constraint(
+                [1.0, 1.0],
+                variables,
+                poi.Leq,
+                1,
+                lambda: f"Non crossing for {get_link(link1)},{get_link(link2)}",
+            )
+            for (link1, link2), variables in zip(crossing_link_pairs.tolist(), y[crossing_link_pairs].tolist())
+        ]
+        if self.is_incremental:
+            self._crossing_link_pairs.append(crossing_link_pairs)
+            self._crossing_constraints.append(np.array([c.index for c in constraints], dtype=int))
 
     def _define_objective_function(self):
         x, _, _, _ = self._map_variables()  # For readability
 
-        self.model.set_objective(sum(c.get_cost() * x[c] for c in x), poi.ObjectiveSense.Minimize)
+        objective = poi.ScalarAffineFunction(self.core.get_connection_costs().tolist(), x.tolist())
+        self.model.set_objective(objective, poi.ObjectiveSense.Minimize)
+
+    def _update_objective_coefficients(self, connection_ids: np.ndarray):
+        x, _, _, _ = self._map_variables()  # For readability
+        costs = self.core.get_connection_costs()[connection_ids]
+        for variable, cost in zip(x[connection_ids].tolist(), costs.tolist()):
+            self.model.set_objective_coefficient(poi.VariableIndex(variable), cost)
+
+    def _set_initial_layout(self, initial_layout: list[Connection]):
+        # Connections which are not part of the model are skipped. HiGHS then discards the start if it is infeasible.
+        connection_ids = [self.model_data.get_connection_id(c) for c in initial_layout]
+        self._set_initial_connections(np.unique([num for num in connection_ids if num is not None]).astype(int))
+
+    def _set_initial_connections(self, connection_ids: np.ndarray):
+        x, y, f, z = self._map_variables()  # For readability
+        link_ids = self.core.connection_link[connection_ids]
+
+        install = np.zeros(len(x))
+        install[connection_ids] = 1.0
+        is_link = np.zeros(len(y))
+        is_link[link_ids] = 1.0
+        flow = np.zeros(len(f))
+        flow[link_ids] = _get_flows(
+            self.core.link_origin[link_ids],
+            self.core.link_destination[link_ids],
+            self.parameters.mw_produced_per_turbine / self.flow_unit,
+        )
+        is_cable_built = np.zeros(len(z))
+        is_cable_built[self.core.connection_cable_type[connection_ids]] = 1.0
+
+        variables = [poi.VariableIndex(num) for num in np.concatenate([x, y, f, z]).tolist()]
+        self.model.set_primal_start(variables, np.concatenate([install, is_link, flow, is_cable_built]).tolist())
+
+    def _optimize_with_lazy_crossings(self):
+        # HiGHS has no lazy constraint callback, so the model is re-solved with the violated non-crossing cuts until
+        # the built links do not cross anymore. The final solution is then optimal for the full model. If the time runs
+        # out before, the best non-crossing incumbent of all solves is returned instead.
+        core = self.core
+
+        while True:
+            connection_ids = self._optimize()
+            if connection_ids is None:
+                return self._best_connection_ids
 
-    def _optimize(self):
+            with self.statistics.measure("lazy_crossings"):
+                built_links = core.connection_link[connection_ids]
+                crossing_pairs = self._get_crossing_pairs(built_links)
+            if len(crossing_pairs) == 0:
+                # A solve stopped by the time limit may be worse than a non-crossing incumbent of an earlier solve
+                costs = core.get_connection_costs()
+                best = self._best_connection_ids
+                if best is not None and costs[best].sum() < costs[connection_ids].sum():
+                    return best
+                return connection_ids
+            if self.solver_settings.time_limit is not None:
+                remaining_time = self._deadline - perf_counter()
+                if remaining_time <= 0:
+                    return self._best_connection_ids
+                self.model.set_raw_parameter("time_limit", remaining_time)
+
+            with self.statistics.measure("lazy_crossings"):
+                self._add_non_crossing_constraints(built_links[crossing_pairs])
+
+    def _optimize(self) -> np.ndarray | None:
+        """
+        :return: The ids of the installed connections, or None if no solution is available
+        """
         x, _, _, _ = self._map_variables()  # For readability
-        self.model.optimize()
-        try:
-            return [c for c in x if self.model.get_value(x[c]) > 0.5]
-        except RuntimeError:  # Error code from highs if no solution available
+        with self.statistics.measure("optimize"):
+            if self.on_incumbent is None and not self.solver_settings.lazy_crossings:
+                self.model.optimize()
+            else:
+                with IncumbentWatcher(self.model, self._report_incumbent):
+                    self.model.optimize()
+        self._record_solver_statistics()
+        # Checked explicitly, as a model without connections has no values to fail on
+        if self.model.get_model_attribute(poi.ModelAttribute.PrimalStatus) != poi.ResultStatusCode.FEASIBLE_POINT:
             return None
+        values = np.array([self.model.get_value(poi.VariableIndex(v)) for v in x.tolist()])
+        return np.flatnonzero(values > 0.5)
+
+    def _get_crossing_pairs(self, link_ids: np.ndarray) -> np.ndarray:
+        """
+        :return: The pairs of positions in link_ids of the crossing links
+        """
+        core = self.core
+        return get_crossing_link_pairs(
+            core.link_origin[link_ids],
+            core.link_destination[link_ids],
+            core.coordinates.x,
+            core.coordinates.y,
+            core.unit_name,
+        )
+
+    def _report_incumbent(self, objective_function_value: float, columns: np.ndarray, values: np.ndarray):
+        # Called from the thread of the IncumbentWatcher, so it does not call HiGHS
+        x, _, _, _ = self._map_variables()  # For readability
+        if objective_function_value >= self._best_incumbent:
+            return
+        connection_ids = np.flatnonzero(np.isin(x, columns[values > 0.5]))
+        # With lazy crossings, the incumbents of the model without all non-crossing constraints may cross
+        if self.solver_settings.lazy_crossings and len(
+            self._get_crossing_pairs(self.core.connection_link[connection_ids])
+        ):
+            return
+        self._best_incumbent = objective_function_value
+        self._best_connection_ids = connection_ids
+        if self.on_incumbent is not None:
+            self.on_incumbent([self.model_data.get_connection(num) for num in connection_ids.tolist()])
+
+    def _record_solver_statistics(self):
+        # Node counts and iterations are summed over the solves of the lazy crossings, the rest is from the last solve
+        statistics = self.statistics
+        statistics.number_of_solves += 1
+        statistics.termination_status = self.model.get_model_attribute(poi.ModelAttribute.TerminationStatus).name
+        statistics.simplex_iterations = (statistics.simplex_iterations or 0) + self.model.get_raw_info_int(
+            "simplex_iteration_count"
+        )
+        statistics.node_count = (statistics.node_count or 0) + self.model.get_raw_info_int64("mip_node_count")
+        statistics.mip_gap = self.model.get_raw_info_double("mip_gap")
+        statistics.mip_dual_bound = self.model.get_raw_info_double("mip_dual_bound")
+
+
+def _get_flows(origin: np.ndarray, destination: np.ndarray, mw_produced_per_turbine: float) -> np.ndarray:
+    """
+    :param origin: Unit id of the origin of each link of a tree layout
+    :param destination: Unit id of the destination of each link of a tree layout
+    :return: The flow on each link, where every turbine sends its production towards a substation
+    """
+    origin, destination = origin.tolist(), destination.tolist()
+    next_link = {o: num for num, o in enumerate(origin)}
+    flows = np.zeros(len(origin))
+    for num in range(len(origin)):
+        visited = set()
+        current = num
+        while current is not None and origin[current] not in visited:
+            visited.add(origin[current])
+            flows[current] += mw_produced_per_turbine
+            current = next_link.get(destination[current])
+    return flows
@@ -1,6 +1,14 @@
-from pydantic import BaseModel
+from collections.abc import Iterator
+from functools import cached_property
+from typing import Literal
 
+import numpy as np
+from pydantic import BaseModel, Field, InstanceOf, PrivateAttr
+
+from opti_test.candidates import CandidateReport, CandidateSettings, get_candidate_matrix
 from opti_test.classes import CableType, Connection, Link, Unit
+from opti_test.core import CoreData, Index, get_possible_links
+from opti_test.crossings import get_crossing_link_pairs, iter_crossing_link_pairs
 
 
 class Parameters(BaseModel):
@@ -8,39 +16,217 @@ class Parameters(BaseModel):
     max_number_of_cable_types: int
 
 
+class SolverSettings(BaseModel):
+    """
+    :param formulation: "strong" measures the flows in turbines, rounds the cable capacities down to whole turbines and
+        adds valid inequalities, which tighten the LP relaxation
+    :param integer_flows: Restricts the flows to whole turbines, only used by the strong formulation
+    :param time_limit: Wall-clock time limit in seconds of the mip method, counted from the call of create_layout,
+        after which the best layout found so far is returned. HiGHS gets the time left after building the model, and
+        with lazy_crossings the crossing detection between the solves counts as well. The model build is not
+        interrupted, and the non-crossing constraints of large farms may take longer than the limit, which
+        lazy_crossings avoids. HiGHS may use up the time in its presolve on large models, so heuristic_warm_start makes
+        sure that a layout is found in time.
+    :param mip_rel_gap: Relative gap between the layout and the lower bound at which the solve stops, 1e-4 by default
+    :param node_limit: Maximum number of branch and bound nodes
+    :param threads: Number of threads of HiGHS. HiGHS shares its threads between the models of a process, so the first
+        solve of a process sets their number.
+    :param log_file: File to write the HiGHS log to instead of the console, e.g. to follow the progress of a solve in
+        another process
+    """
+
+    formulation: Literal["basic", "strong"] = "basic"
+    integer_flows: bool = False
+    lazy_crossings: bool = False
+    debug_names: bool = False
+    heuristic_warm_start: bool = False
+    time_limit: float | None = None
+    mip_rel_gap: float | None = None
+    node_limit: int | None = None
+    threads: int | None = None
+    max_turbines_per_substation: int | None = None
+    decomposition_workers: int | None = None
+    presolve: bool = False
+    log_file: str | None = None
+
+
 class ModelData(BaseModel):
-    links: set[Link]
-    connections: set[Connection]
-    cable_types: set[CableType]
-    turbines: set[Unit]
+    """
+    Units, cable types and the candidate links between the units. The solver path works on the integer ids of the
+    array-backed core, and the pydantic objects are only created by the getters below.
+    """
+
+    units: list[Unit]
+    cable_types: list[CableType]
+    core: InstanceOf[CoreData] = Field(repr=False, exclude=True)
+    candidate_report: CandidateReport | None = None
+
+    _crossing_link_pairs: np.ndarray | None = PrivateAttr(default=None)
 
     @classmethod
-    def create(cls, units: set[Unit], cable_types: set[CableType]):
-        turbines = set([u for u in units if u.is_turbine()])
-        links = {Link(origin=o, destination=d) for o in units for d in units if o != d and o.is_turbine()}
-        connections = {Connection(link=link, cable_type=c) for link in links for c in cable_types}
-        return cls(links=links, connections=connections, cable_types=cable_types, turbines=turbines)
+    def create(cls, units: set[Unit], cable_types: set[CableType], candidate_settings: CandidateSettings | None = None):
+        units = list({(u.name, u.x, u.y): u for u in units}.values())
+        cable_types = list({(c.name, c.max_mw_on_cable, c.cost_per_km): c for c in cable_types}.values())
+        if candidate_settings is None:
+            core = CoreData.create(units, cable_types)
+            candidate_report = None
+        else:
+            core = CoreData.create(units, cable_types, get_candidate_matrix(units, candidate_settings))
+            candidate_report = _create_candidate_report(core, len(cable_types))
+        return cls(units=units, cable_types=cable_types, core=core, candidate_report=candidate_report)
+
+    def get_subproblem(
+        self, unit_ids: list[int], cable_type_ids: list[int], link_ids: np.ndarray | None = None
+    ) -> "ModelData":
+        """
+        :param link_ids: Ids of the links to keep, all links of this model if None
+        :return: The model data restricted to the given units and cable types, keeping only the links of this model
+        """
+        link_ids = slice(None) if link_ids is None else link_ids
+        is_link = np.zeros((len(self.units), len(self.units)), dtype=bool)
+        is_link[self.core.link_origin[link_ids], self.core.link_destination[link_ids]] = True
+        units = [self.units[num] for num in unit_ids]
+        cable_types = [self.cable_types[num] for num in cable_type_ids]
+        core = CoreData.create(units, cable_types, is_link[np.ix_(unit_ids, unit_ids)])
+        return ModelData(units=units, cable_types=cable_types, core=core)
+
+    def move_unit(self, unit_id: int, x: float, y: float) -> np.ndarray:
+        """
+        Moves the unit in place, keeping its links
+
+        :return: The ids of the links of the unit
+        """
+        self.units[unit_id] = self.units[unit_id].model_copy(update={"x": x, "y": y})
+        self._reset_caches()
+        return self.core.move_unit(unit_id, self.units[unit_id])
+
+    def set_cable_cost(self, cable_type_id: int, cost_per_km: float):
+        self.cable_types[cable_type_id] = self.cable_types[cable_type_id].model_copy(
+            update={"cost_per_km": cost_per_km}
+        )
+        self.core.cable_cost_per_km[cable_type_id] = cost_per_km
+        self._reset_caches()
+
+    def _reset_caches(self):
+        for name in ["links", "connections", "turbines"]:
+            self.__dict__.pop(name, None)
+        self._crossing_link_pairs = None
+
+    @cached_property
+    def links(self) -> set[Link]:
+        return {self.get_link(num) for num in range(len(self.core.link_origin))}
+
+    @cached_property
+    def connections(self) -> set[Connection]:
+        return {self.get_connection(num) for num in range(len(self.core.connection_link))}
+
+    @cached_property
+    def turbines(self) -> set[Unit]:
+        return {u for u in self.units if u.is_turbine()}
+
+    def get_link(self, link_id: int) -> Link:
+        return Link(
+            origin=self.units[self.core.link_origin[link_id]],
+            destination=self.units[self.core.link_destination[link_id]],
+        )
+
+    def get_connection(self, connection_id: int) -> Connection:
+        return Connection(
+            link=self.get_link(self.core.connection_link[connection_id]),
+            cable_type=self.cable_types[self.core.connection_cable_type[connection_id]],
+        )
+
+    def get_connection_id(self, connection: Connection) -> int | None:
+        """
+        :return: The id of the connection with the same units and cable type, or None if it is not part of the model
+        """
+        link_id = self.get_link_id(connection.link)
+        if link_id is None or connection.cable_type not in self.cable_types:
+            return None
+        return self.core.get_connection_id(link_id, self.cable_types.index(connection.cable_type))
+
+    def get_link_id(self, link: Link) -> int | None:
+        link_ids = self._get_link_ids(link)
+        return link_ids[0].item() if len(link_ids) > 0 else None
 
     def get_connections_for_link(self, link: Link) -> set[Connection]:
-        return {c for c in self.connections if c.link == link}
+        connection_ids = [self.core.connections_by_link.get(num) for num in self._get_link_ids(link).tolist()]
+        return self._get_connections(np.concatenate([np.empty(0, dtype=int), *connection_ids]))
 
     def get_incoming_into_unit(self, u: Unit) -> set[Link]:
-        return {link for link in self.links if link.destination == u}
+        return self._get_links(self._get_link_ids_of_name(self.core.incoming_by_unit, u.name))
 
     def get_outgoing_from_unit(self, u: Unit) -> set[Link]:
-        return {link for link in self.links if link.origin == u}
+        return self._get_links(self._get_link_ids_of_name(self.core.outgoing_by_unit, u.name))
+
+    def get_crossing_link_pairs(self) -> np.ndarray:
+        """
+        :return: (n, 2) array with the ids of all pairs of crossing links
+        """
+        if self._crossing_link_pairs is None:
+            core = self.core
+            self._crossing_link_pairs = get_crossing_link_pairs(
+                core.link_origin, core.link_destination, core.coordinates.x, core.coordinates.y, core.unit_name
+            )
+        return self._crossing_link_pairs
+
+    def iter_crossing_link_pairs(self) -> Iterator[np.ndarray]:
+        """
+        Yields the pairs of crossing links in blocks, without holding all of them in memory unless they are cached
+
+        :return: (n, 2) arrays with the ids of pairs of crossing links
+        """
+        if self._crossing_link_pairs is not None:
+            yield self._crossing_link_pairs
+            return
+        core = self.core
+        yield from iter_crossing_link_pairs(
+            core.link_origin, core.link_destination, core.coordinates.x, core.coordinates.y, core.unit_name
+        )
 
     def get_crossing_links_from_units(self, o: Unit, d: Unit) -> set[Link]:
-        first_set = [
-            link
-            for link in self.links
-            if (link.origin == o and link.destination == d) or (link.origin == d and link.destination == o)
-        ]
+        first_set = np.concatenate(
+            [self._get_link_ids(Link(origin=o, destination=d)), self._get_link_ids(Link(origin=d, destination=o))]
+        )
         link1 = first_set[0]
 
-        second_set = {link for link in self.links if link.check_if_crossing(link1)}
+        pairs = self.get_crossing_link_pairs()
+        second_set = np.concatenate([pairs[pairs[:, 0] == link1, 1], pairs[pairs[:, 1] == link1, 0]])
 
-        return second_set.union(first_set)
+        return self._get_links(np.concatenate([first_set, second_set]))
 
     def get_connections_with_same_cable_type(self, cable_type: CableType) -> set[Connection]:
-        return {c for c in self.connections if c.cable_type == cable_type}
+        if cable_type not in self.cable_types:
+            return set()
+        return self._get_connections(self.core.connections_by_cable_type.get(self.cable_types.index(cable_type)))
+
+    def _get_link_ids(self, link: Link) -> np.ndarray:
+        """
+        :return: The ids of all links between units with the names of the origin and destination of the link, as units
+            compare by name
+        """
+        link_ids = self._get_link_ids_of_name(self.core.outgoing_by_unit, link.origin.name)
+        destination = self.core.name_ids.get(link.destination.name, -1)
+        return link_ids[self.core.unit_name[self.core.link_destination[link_ids]] == destination]
+
+    def _get_link_ids_of_name(self, links_by_unit: Index, name: str) -> np.ndarray:
+        return np.concatenate(
+            [np.empty(0, dtype=int), *(links_by_unit.get(u) for u in self.core.get_unit_ids(name).tolist())]
+        )
+
+    def _get_links(self, link_ids: np.ndarray) -> set[Link]:
+        return {self.get_link(num) for num in link_ids.tolist()}
+
+    def _get_connections(self, connection_ids: np.ndarray) -> set[Connection]:
+        return {self.get_connection(num) for num in connection_ids.tolist()}
+
+
+def _create_candidate_report(core: CoreData, number_of_cable_types: int) -> CandidateReport:
+    number_of_links = int(get_possible_links(core.unit_name, core.is_turbine).sum())
+    number_of_candidate_links = len(core.link_origin)
+    return CandidateReport(
+        number_of_links=number_of_links,
+        number_of_candidate_links=number_of_candidate_links,
+        number_of_connections=number_of_links * number_of_cable_types,
+        number_of_candidate_connections=number_of_candidate_links * number_of_cable_types,
+    )
@@ -0,0 +1,88 @@
+import numpy as np
+from pydantic import BaseModel
+
+from opti_test.heuristic import HeuristicBuilder
+from opti_test.model_data import ModelData, Parameters
+
+# Relative tolerance of the bound on the links, so that links of optimal layouts are not lost to rounding
+_BOUND_TOLERANCE = 1e-9
+
+
+class PresolveReport(BaseModel):
+    too_small_cable_types: list[str]
+    dominated_cable_types: list[str]
+    upper_bound: float | None
+    number_of_links: int
+    number_of_kept_links: int
+    number_of_connections: int
+    number_of_kept_connections: int
+
+    def __str__(self):
+        return (
+            f"Presolve removed cable types {self.too_small_cable_types} below the production of a turbine and "
+            f"dominated cable types {self.dominated_cable_types}, and kept {self.number_of_kept_links} of "
+            f"{self.number_of_links} links and {self.number_of_kept_connections} of {self.number_of_connections} "
+            f"connections with the upper bound {self.upper_bound}"
+        )
+
+
+def presolve(model_data: ModelData, parameters: Parameters) -> tuple[ModelData, PresolveReport]:
+    """
+    Removes cable types and links which are not needed for an optimal layout:
+
+    - Cable types which cannot carry the production of a single turbine, as every built link carries at least that.
+    - Cable types which are dominated by another one with at least their capacity at no higher cost, including
+      duplicates with the same capacity and cost, which would only create symmetric layouts.
+    - Links whose cheapest connection exceeds the cost of the heuristic layout, even if all other turbines are
+      connected with their cheapest outgoing connection.
+
+    :return: The reduced model data, and a report of the reductions
+    """
+    core = model_data.core
+    is_too_small = core.cable_capacity < parameters.mw_produced_per_turbine
+    is_dominated = _get_dominated_cable_types(core.cable_capacity, core.cable_cost_per_km) & ~is_too_small
+    unit_ids = list(range(len(model_data.units)))
+    reduced = model_data.get_subproblem(unit_ids, np.flatnonzero(~is_too_small & ~is_dominated).tolist())
+
+    upper_bound = None
+    if core.is_turbine.any() and len(reduced.cable_types) > 0:
+        layout = HeuristicBuilder(reduced, parameters).solve()
+        if layout is not None:
+            upper_bound = sum(c.get_cost() for c in layout)
+            link_ids = _get_links_within_bound(reduced, upper_bound)
+            reduced = reduced.get_subproblem(unit_ids, list(range(len(reduced.cable_types))), link_ids)
+
+    report = PresolveReport(
+        too_small_cable_types=[c.name for c, remove in zip(model_data.cable_types, is_too_small.tolist()) if remove],
+        dominated_cable_types=[c.name for c, remove in zip(model_data.cable_types, is_dominated.tolist()) if remove],
+        upper_bound=upper_bound,
+        number_of_links=len(core.link_origin),
+        number_of_kept_links=len(reduced.core.link_origin),
+        number_of_connections=len(core.connection_link),
+        number_of_kept_connections=len(reduced.core.connection_link),
+    )
+    return reduced, report
+
+
+def _get_dominated_cable_types(capacity: np.ndarray, cost_per_km: np.ndarray) -> np.ndarray:
+    # Entry (i, j) states if cable type i dominates cable type j. Of equal cable types, the first one is kept.
+    is_at_least_as_good = (capacity[:, None] >= capacity[None, :]) & (cost_per_km[:, None] <= cost_per_km[None, :])
+    is_better = (capacity[:, None] > capacity[None, :]) | (cost_per_km[:, None] < cost_per_km[None, :])
+    is_first = np.triu(np.ones((len(capacity), len(capacity)), dtype=bool), 1)
+    return (is_at_least_as_good & (is_better | is_first)).any(axis=0)
+
+
+def _get_links_within_bound(model_data: ModelData, upper_bound: float) -> np.ndarray:
+    """
+    Every turbine has exactly one outgoing link, so a layout with a link costs at least the cheapest connection of that
+    link plus the cheapest outgoing connection of every other turbine.
+
+    :return: Ids of the links which may be part of a layout which is not more expensive than the upper bound
+    """
+    core = model_data.core
+    link_cost = core.link_distance * core.cable_cost_per_km.min()
+    cheapest_outgoing = np.full(len(core.is_turbine), np.inf)
+    np.minimum.at(cheapest_outgoing, core.link_origin, link_cost)
+    lower_bound = cheapest_outgoing[core.is_turbine].sum()
+    bound = link_cost - cheapest_outgoing[core.link_origin] + lower_bound
+    return np.flatnonzero(bound <= upper_bound * (1 + _BOUND_TOLERANCE) + _BOUND_TOLERANCE)
@@ -0,0 +1,26 @@
+import os
+import signal
+from multiprocessing.process import BaseProcess
+
+
+def start_process_group():
+    """
+    Makes the calling process the leader of a new process group, which then also holds the processes it starts, e.g.
+    the process pool of the decomposition. Process groups only exist on POSIX, so this does nothing elsewhere.
+    """
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+
+
+def terminate_process_group(process: BaseProcess):
+    """
+    Terminates the process together with the processes it started, if it is the leader of a process group, see
+    `start_process_group`. Terminating only the process would leave its children running without a parent.
+    """
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+        except ProcessLookupError:  # The process has not started its group yet, so it has no children either
+            pass
+    process.terminate()
+    process.join()
@@ -0,0 +1,65 @@
+import sys
+from contextlib import contextmanager
+from time import perf_counter
+
+from pydantic import BaseModel, Field
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+class SolveStatistics(BaseModel):
+    """
+    Instrumentation of a solve: the wall-clock time of every phase, the memory high-water mark of the process, the size
+    of the model and the statistics reported by HiGHS. Fields stay None if they do not apply to the solve method.
+    """
+
+    phase_times_in_seconds: dict[str, float] = Field(default_factory=dict)
+    memory_high_water_in_mb: float | None = None
+    number_of_variables: int | None = None
+    number_of_constraints: int | None = None
+    number_of_solves: int = 0
+    termination_status: str | None = None
+    mip_gap: float | None = None
+    mip_dual_bound: float | None = None
+    node_count: int | None = None
+    simplex_iterations: int | None = None
+
+    @contextmanager
+    def measure(self, phase: str):
+        """
+        Adds the time spent in the context to the phase, and updates the memory high-water mark afterwards
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_times_in_seconds[phase] = self.phase_times_in_seconds.get(phase, 0.0) + perf_counter() - start
+            self.memory_high_water_in_mb = get_memory_high_water_in_mb()
+
+    def get_total_time(self) -> float:
+        return sum(self.phase_times_in_seconds.values())
+
+    def __str__(self):
+        lines = [f"Total time: {self.get_total_time():.3f}s"]
+        lines.extend(f"  {phase}: {time:.3f}s" for phase, time in self.phase_times_in_seconds.items())
+        if self.memory_high_water_in_mb is not None:
+            lines.append(f"Memory high-water mark: {self.memory_high_water_in_mb:.1f} MB")
+        if self.number_of_variables is not None:
+            lines.append(f"Model size: {self.number_of_variables} variables, {self.number_of_constraints} constraints")
+        if self.termination_status is not None:
+            lines.append(
+                f"HiGHS: {self.termination_status} after {self.number_of_solves} solve(s), gap {self.mip_gap}, "
+                f"{self.node_count} nodes, {self.simplex_iterations} simplex iterations"
+            )
+        return "\n".join(lines)
+
+
+def get_memory_high_water_in_mb() -> float | None:
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # The maximum resident set size is reported in bytes on macOS, and in kilobytes elsewhere
+    return max_rss / 1024**2 if sys.platform == "darwin" else max_rss / 1024
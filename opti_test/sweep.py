@@ -0,0 +1,192 @@
+import itertools
+import json
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from opti_test.array_cable_problem import ArrayCableProblem
+from opti_test.classes import Layout
+from opti_test.model_builder import ModelBuilder
+from opti_test.model_data import ModelData
+from opti_test.statistics import SolveStatistics
+
+
+class Scenario(BaseModel):
+    """
+    Changes of the problem in a scenario of a sweep, where None keeps the value of the problem
+
+    :param cost_factor: Factor on the costs of all cable types of the problem
+    :param cost_per_km: Cost per km by cable type name, which replaces the cost of the problem and the factor
+    """
+
+    name: str
+    max_number_of_cable_types: int | None = None
+    mw_produced_per_turbine: float | None = None
+    cost_factor: float = 1.0
+    cost_per_km: dict[str, float] = Field(default_factory=dict)
+
+
+class SweepResult(BaseModel):
+    instance: str
+    scenario: str
+    status: str
+    solution_time: float
+    max_number_of_cable_types: int | None = None
+    mw_produced_per_turbine: float | None = None
+    objective_function_value: float | None = None
+    mip_gap: float | None = None
+    layout: Layout | None = None
+    error: str | None = None
+
+
+def create_scenarios(
+    max_number_of_cable_types: list[int | None] = (None,),
+    mw_produced_per_turbine: list[float | None] = (None,),
+    cost_factors: list[float] = (1.0,),
+) -> list[Scenario]:
+    """
+    :return: The scenarios of all combinations. The number of cable types changes fastest, so that the layout of a
+        scenario is a feasible start for the next one if the numbers are increasing.
+    """
+    return [
+        Scenario(
+            name=",".join(
+                f"{name}={value}"
+                for name, value in [("types", number_of_cable_types), ("mw", mw), ("cost", cost_factor)]
+                if value is not None
+            ),
+            max_number_of_cable_types=number_of_cable_types,
+            mw_produced_per_turbine=mw,
+            cost_factor=cost_factor,
+        )
+        for mw, cost_factor, number_of_cable_types in itertools.product(
+            mw_produced_per_turbine, cost_factors, max_number_of_cable_types
+        )
+    ]
+
+
+def load_scenarios(file: str) -> list[Scenario]:
+    """
+    :param file: json file with a list of scenarios, or with the lists of values of `create_scenarios`
+    """
+    with open(file, "r") as f:
+        content = json.load(f)
+    if isinstance(content, list):
+        return [Scenario(**scenario) for scenario in content]
+    return create_scenarios(**content)
+
+
+def sweep(array_cable_problem: ArrayCableProblem, scenarios: list[Scenario], instance: str = "") -> list[SweepResult]:
+    """
+    Solves the scenarios with the MIP one after the other. The model is built once, and every scenario only changes the
+    right-hand sides and the objective coefficients, and starts from the layout of the previous scenario. The presolve
+    depends on the parameters, so it is not applied.
+    """
+    problem = array_cable_problem
+    model_data = ModelData.create(problem.units, problem.cable_types, problem.candidate_settings)
+    cable_type_names = [c.name for c in model_data.cable_types]
+    costs_of_problem = model_data.core.cable_cost_per_km.copy()
+    model_builder = None
+    results = []
+    for scenario in scenarios:
+        start = perf_counter()
+        parameters = problem.parameters.model_copy(
+            update={
+                name: value
+                for name in ["max_number_of_cable_types", "mw_produced_per_turbine"]
+                if (value := getattr(scenario, name)) is not None
+            }
+        )
+        costs = [
+            scenario.cost_per_km.get(name, cost * scenario.cost_factor)
+            for name, cost in zip(cable_type_names, costs_of_problem.tolist())
+        ]
+        changed_cable_types = np.flatnonzero(costs != model_data.core.cable_cost_per_km).tolist()
+
+        if model_builder is None:
+            for cable_type in changed_cable_types:
+                model_data.set_cable_cost(cable_type, costs[cable_type])
+            model_builder = ModelBuilder(model_data, parameters, problem.solver_settings)
+            connections = model_builder.solve()
+        else:
+            model_builder.statistics = SolveStatistics()
+            model_builder.set_parameters(parameters)
+            for cable_type in changed_cable_types:
+                model_builder.set_cable_cost(cable_type, costs[cable_type])
+            connections = model_builder.resolve()
+
+        results.append(
+            SweepResult(
+                instance=instance,
+                scenario=scenario.name,
+                status="no layout" if connections is None else "solved",
+                solution_time=perf_counter() - start,
+                max_number_of_cable_types=parameters.max_number_of_cable_types,
+                mw_produced_per_turbine=parameters.mw_produced_per_turbine,
+                objective_function_value=None if connections is None else sum(c.get_cost() for c in connections),
+                mip_gap=model_builder.statistics.mip_gap,
+                layout=None if connections is None else Layout(connections=connections),
+            )
+        )
+    return results
+
+
+def sweep_instance(
+    input_file: str, scenarios: list[Scenario], solver_settings: dict | None = None
+) -> list[SweepResult]:
+    """
+    :param solver_settings: Solver settings overriding the ones in the input file, e.g. the time limit
+    """
+    start = perf_counter()
+    try:
+        with open(input_file, "r") as file:
+            array_cable_problem = ArrayCableProblem(**json.load(file))
+        array_cable_problem.solver_settings = array_cable_problem.solver_settings.model_copy(
+            update=solver_settings or {}
+        )
+        return sweep(array_cable_problem, scenarios, input_file)
+    except Exception as error:
+        return [
+            SweepResult(
+                instance=input_file,
+                scenario="",
+                status="failed",
+                solution_time=perf_counter() - start,
+                error=repr(error),
+            )
+        ]
+
+
+def run_sweeps(
+    input_files: list[str],
+    scenarios: list[Scenario],
+    workers: int | None = None,
+    solver_settings: dict | None = None,
+) -> list[SweepResult]:
+    """
+    Sweeps the instances in a process pool, as the sweeps of different instances are independent of each other
+
+    :return: The results of all instances and scenarios, in the order of the instances
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(sweep_instance, f, scenarios, solver_settings) for f in input_files]
+    results = []
+    for input_file, future in zip(input_files, futures):
+        try:
+            results.extend(future.result())
+        except Exception as error:  # The worker process itself failed
+            results.append(
+                SweepResult(instance=input_file, scenario="", status="failed", solution_time=0, error=repr(error))
+            )
+    return results
+
+
+def to_dataframe(results: list[SweepResult]):
+    """
+    :return: The results as one table, without the layouts
+    """
+    import pandas as pd
+
+    return pd.DataFrame([r.model_dump(exclude={"layout"}) for r in results])
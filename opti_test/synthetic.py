@@ -0,0 +1,96 @@
+import math
+
+import numpy as np
+
+from opti_test.array_cable_problem import ArrayCableProblem
+from opti_test.candidates import CandidateSettings
+from opti_test.classes import CableType, Unit
+from opti_test.model_data import Parameters
+
+MW_PRODUCED_PER_TURBINE = 15.0
+TURBINE_SPACING_IN_M = 1600.0
+
+# 66 kV array cables of increasing cross-section, with their capacity and their installed cost in thousands per km
+CABLE_CATALOGUE = [
+    CableType(name="66kV 3x150mm2", max_mw_on_cable=45, cost_per_km=320),
+    CableType(name="66kV 3x240mm2", max_mw_on_cable=60, cost_per_km=390),
+    CableType(name="66kV 3x400mm2", max_mw_on_cable=75, cost_per_km=480),
+    CableType(name="66kV 3x630mm2", max_mw_on_cable=90, cost_per_km=600),
+    CableType(name="66kV 3x800mm2", max_mw_on_cable=105, cost_per_km=690),
+]
+
+
+def create_synthetic_farm(
+    number_of_turbines: int,
+    number_of_substations: int = 1,
+    layout: str = "grid",
+    seed: int = 0,
+    number_of_cable_types: int = 3,
+    max_number_of_cable_types: int = 2,
+    candidate_settings: CandidateSettings | None = None,
+) -> ArrayCableProblem:
+    """
+    Creates a wind farm with realistic spacing and cable catalogue, which is reproducible for a given seed.
+
+    :param layout: Either "grid" for staggered rows of turbines, or "irregular" for randomly placed turbines which keep
+        a minimum distance from each other
+    :param number_of_cable_types: Number of cable types taken from the catalogue, starting with the smallest
+    """
+    if layout not in ["grid", "irregular"]:
+        raise ValueError(f"Unknown layout {layout}, use 'grid' or 'irregular'")
+    if number_of_substations < 1 or number_of_turbines < number_of_substations:
+        raise ValueError("A farm needs at least one substation, and at least as many turbines as substations")
+
+    rng = np.random.default_rng(seed)
+    if layout == "grid":
+        turbines = _get_grid_positions(number_of_turbines, rng)
+    else:
+        turbines = _get_irregular_positions(number_of_turbines, rng)
+    substations = _get_substation_positions(turbines, number_of_substations, rng)
+
+    units = [Unit(name=f"WTG_{num:03d}", x=x, y=y) for num, (x, y) in enumerate(turbines.tolist(), start=1)]
+    units.extend(Unit(name=f"OSS_{num}", x=x, y=y) for num, (x, y) in enumerate(substations.tolist(), start=1))
+    return ArrayCableProblem(
+        units=units,
+        cable_types=CABLE_CATALOGUE[:number_of_cable_types],
+        parameters=Parameters(
+            mw_produced_per_turbine=MW_PRODUCED_PER_TURBINE, max_number_of_cable_types=max_number_of_cable_types
+        ),
+        candidate_settings=candidate_settings,
+    )
+
+
+def _get_grid_positions(number_of_turbines: int, rng: np.random.Generator) -> np.ndarray:
+    # Every other row is shifted by half the spacing, and the positions are slightly perturbed as on real sites
+    number_of_columns = math.ceil(math.sqrt(number_of_turbines))
+    row, column = np.divmod(np.arange(number_of_turbines), number_of_columns)
+    x = (column + 0.5 * (row % 2)) * TURBINE_SPACING_IN_M
+    y = row * TURBINE_SPACING_IN_M * math.sqrt(3) / 2
+    return np.stack([x, y], axis=1) + rng.normal(scale=0.02 * TURBINE_SPACING_IN_M, size=(number_of_turbines, 2))
+
+
+def _get_irregular_positions(number_of_turbines: int, rng: np.random.Generator) -> np.ndarray:
+    # Rejection sampling in a square with room for twice the turbines at the grid spacing
+    side = math.sqrt(2 * number_of_turbines) * TURBINE_SPACING_IN_M
+    min_distance = 0.7 * TURBINE_SPACING_IN_M
+    positions = np.empty((0, 2))
+    while len(positions) < number_of_turbines:
+        candidate = rng.uniform(0, side, size=2)
+        if len(positions) == 0 or np.min(np.hypot(*(positions - candidate).T)) >= min_distance:
+            positions = np.vstack([positions, candidate])
+    return positions
+
+
+def _get_substation_positions(turbines: np.ndarray, number_of_substations: int, rng: np.random.Generator) -> np.ndarray:
+    # The substations are placed at the centres of a k-means clustering, shifted so that they do not hit a turbine
+    centres = turbines[rng.choice(len(turbines), number_of_substations, replace=False)]
+    for _ in range(20):
+        distances = np.hypot(*(turbines[:, None, :] - centres[None, :, :]).transpose(2, 0, 1))
+        assignment = np.argmin(distances, axis=1)
+        centres = np.array(
+            [
+                turbines[assignment == num].mean(axis=0) if np.any(assignment == num) else centres[num]
+                for num in range(number_of_substations)
+            ]
+        )
+    return centres + 0.25 * TURBINE_SPACING_IN_M
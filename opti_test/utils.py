@@ -1,50 +1,83 @@
-import math
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 
-from opti_test.classes import ArrayCableProblem, Unit, CableType
+from opti_test.array_cable_problem import ArrayCableProblem
+from opti_test.classes import CableType, Unit
+from opti_test.model_data import Parameters
+
+# The tables of an input, as sheets of an Excel file or as files named after them, e.g. "Turbine Data.csv"
+SHEETS = ("Parameters", "Turbine Data", "Cable Data")
 
 
-def read_excel(file):
+def read_excel(file) -> ArrayCableProblem:
     """
     :param file: This supports both a file-like object and a file name
     """
-    parameters = _get_parameters(file)
-    units = _get_units(file)
-    cable_types = _get_cable_types(file, parameters)
-
-    return ArrayCableProblem(units, cable_types, parameters)
-
-
-def _get_parameters(file):
-    df = pd.read_excel(file, "Parameters")
-    return df.to_dict("records")[0]
-
-
-def _get_units(file):
-    df = pd.read_excel(file, "Turbine Data")
-    return set([Unit(unit.Name, unit.East, unit.North) for _, unit in df.iterrows()])
-
-
-def _get_cable_types(file, parameters):
-    df = pd.read_excel(file, "Cable Data")
+    # All sheets are read in one pass over the workbook
+    return create_problem(*pd.read_excel(file, sheet_name=list(SHEETS)).values())
 
-    cable_types = set([])
-    for _, cable in df.iterrows():
-        cable_types.add(_cast_cable_type(cable, parameters))
 
-    return set(cable_types)
-
-
-def _cast_cable_type(cable_data, parameters) -> CableType:
-    mw_limit = _get_mw_limit_for_cable_type(cable_data.Rating, parameters["Voltage"])
-    refined_mw_limit = _round_mw_limit_based_on_turbine_power(mw_limit, parameters["MW"])
-
-    return CableType(cable_data.Number, refined_mw_limit, cable_data.Cost)
+def read_csv(directory: str | Path) -> ArrayCableProblem:
+    """
+    :param directory: Directory with a csv file per sheet, e.g. "Turbine Data.csv"
+    """
+    return create_problem(*(pd.read_csv(Path(directory) / f"{sheet}.csv") for sheet in SHEETS))
 
 
-def _get_mw_limit_for_cable_type(current: float, voltage):
-    return math.sqrt(3) * current * voltage / 1000
+def read_parquet(directory: str | Path) -> ArrayCableProblem:
+    """
+    :param directory: Directory with a parquet file per sheet, e.g. "Turbine Data.parquet"
+    """
+    return create_problem(*(pd.read_parquet(Path(directory) / f"{sheet}.parquet") for sheet in SHEETS))
 
 
-def _round_mw_limit_based_on_turbine_power(mw_limit, mw_turbine):
-    return math.floor(mw_limit / mw_turbine) * mw_turbine
+def create_problem(parameters: pd.DataFrame, turbines: pd.DataFrame, cables: pd.DataFrame) -> ArrayCableProblem:
+    """
+    :param parameters: One row with the voltage in kV ("Voltage"), the power of a turbine in MW ("MW") and optionally
+        the maximum number of cable types ("MaxCableTypes"), which defaults to the number of cable types
+    :param turbines: Name, easting ("East") and northing ("North") of every unit
+    :param cables: Name ("Number"), current rating in A ("Rating") and cost per km ("Cost") of every cable type
+    """
+    parameters = parameters.iloc[0]
+    # A blank cell is read as NaN, and whole numbers of a column with blank cells as floats
+    max_number_of_cable_types = parameters.get("MaxCableTypes")
+    turbines = turbines.drop_duplicates(["Name", "East", "North"])
+    cables = cables.drop_duplicates(["Number", "Rating", "Cost"])
+
+    mw_limits = _round_mw_limit_based_on_turbine_power(
+        _get_mw_limit_for_cable_type(cables["Rating"].to_numpy(dtype=float), parameters["Voltage"]), parameters["MW"]
+    )
+    units = [
+        Unit(name=name, x=x, y=y)
+        for name, x, y in zip(
+            turbines["Name"].astype(str),
+            turbines["East"].to_numpy(dtype=float),
+            turbines["North"].to_numpy(dtype=float),
+        )
+    ]
+    cable_types = [
+        CableType(name=name, max_mw_on_cable=mw_limit, cost_per_km=cost)
+        for name, mw_limit, cost in zip(
+            cables["Number"].astype(str), mw_limits.tolist(), cables["Cost"].to_numpy(dtype=float).tolist()
+        )
+    ]
+    return ArrayCableProblem(
+        units=units,
+        cable_types=cable_types,
+        parameters=Parameters(
+            mw_produced_per_turbine=parameters["MW"],
+            max_number_of_cable_types=(
+                len(cable_types) if pd.isna(max_number_of_cable_types) else int(max_number_of_cable_types)
+            ),
+        ),
+    )
+
+
+def _get_mw_limit_for_cable_type(current: np.ndarray, voltage: float) -> np.ndarray:
+    return np.sqrt(3) * current * voltage / 1000
+
+
+def _round_mw_limit_based_on_turbine_power(mw_limit: np.ndarray, mw_turbine: float) -> np.ndarray:
+    return np.floor(mw_limit / mw_turbine) * mw_turbine
@@ -0,0 +1,148 @@
+from concurrent.futures import ProcessPoolExecutor
+import sys
+
+import click
+import numpy as np
+
+from opti_test.candidates import CandidateSettings
+from opti_test.history import DEFAULT_HISTORY_FILE, PerformanceHistory, RunResult
+from opti_test.model_data import SolverSettings
+from opti_test.synthetic import create_synthetic_farm
+
+
+DEFAULT_SIZES = "10,25,50,100,150,200"
+DEFAULT_THRESHOLD = 0.25
+METRICS = ["build_time", "solve_time", "memory_in_mb"]
+# Differences below these are noise, whatever the relative change
+NOISE_FLOORS = {"build_time": 0.05, "solve_time": 0.05, "memory_in_mb": 10.0}
+NUMBER_OF_BASELINE_RUNS = 5
+
+
+SUITE = "benchmark"
+
+
+class BenchmarkResult(RunResult):
+    layout: str
+    number_of_turbines: int
+    number_of_substations: int
+
+
+def get_number_of_substations(number_of_turbines: int) -> int:
+    return min(4, 1 + number_of_turbines // 50)
+
+
+def run_case(number_of_turbines: int, layout: str, seed: int, time_limit: float) -> BenchmarkResult:
+    number_of_substations = get_number_of_substations(number_of_turbines)
+    problem = create_synthetic_farm(
+        number_of_turbines,
+        number_of_substations,
+        layout,
+        seed,
+        candidate_settings=CandidateSettings(k_nearest_neighbours=6, use_delaunay=True),
+    )
+    problem.solver_settings = SolverSettings(time_limit=time_limit)
+    problem.create_layout()
+
+    return BenchmarkResult(
+        instance=f"{layout}_{number_of_turbines}_turbines_{number_of_substations}_oss_seed_{seed}",
+        layout=layout,
+        number_of_turbines=number_of_turbines,
+        number_of_substations=number_of_substations,
+        status=problem.statistics.termination_status or "unknown",
+        objective_function_value=None
+        if problem.layout is None
+        else sum(c.get_cost() for c in problem.layout.connections),
+        statistics=problem.statistics,
+    )
+
+
+def run_benchmark(sizes: list[int], layouts: list[str], seed: int, time_limit: float) -> list[BenchmarkResult]:
+    # Every case runs alone in a fresh process, so that the memory high-water mark belongs to that case only
+    results = []
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as executor:
+        for layout in layouts:
+            for number_of_turbines in sizes:
+                result = executor.submit(run_case, number_of_turbines, layout, seed, time_limit).result()
+                print(
+                    f"{result.instance}: build {result.build_time:.2f}s, solve {result.solve_time:.2f}s, "
+                    f"memory {result.memory_in_mb} MB, {result.status}"
+                )
+                results.append(result)
+    return results
+
+
+def get_scaling_exponents(results: list[BenchmarkResult]) -> dict[tuple[str, str], float]:
+    """
+    :return: The exponent b of the fit metric ~ a * n^b over the number of turbines n, for every layout and metric
+    """
+    exponents = {}
+    for layout in sorted({r.layout for r in results}):
+        layout_results = [r for r in results if r.layout == layout]
+        for metric in METRICS:
+            points = [(r.number_of_turbines, getattr(r, metric)) for r in layout_results]
+            points = [(n, value) for n, value in points if value is not None and value > 0]
+            if len({n for n, _ in points}) >= 2:
+                n, values = np.array(points).T
+                exponents[(layout, metric)] = float(np.polyfit(np.log(n), np.log(values), 1)[0])
+    return exponents
+
+
+def get_baselines(history: PerformanceHistory, instances: list[str]) -> dict[str, dict[str, float]]:
+    """
+    :return: The median of every metric over the last runs of each instance
+    """
+    baselines = {}
+    for instance in instances:
+        results = history.get_results(instance, SUITE, NUMBER_OF_BASELINE_RUNS)
+        if results:
+            values = np.array([[getattr(r, metric) for metric in METRICS] for r in results], dtype=float)
+            baselines[instance] = {
+                metric: float(np.nanmedian(values[:, num]))
+                for num, metric in enumerate(METRICS)
+                if not np.isnan(values[:, num]).all()
+            }
+    return baselines
+
+
+def find_regressions(
+    results: list[BenchmarkResult], baselines: dict[str, dict[str, float]], threshold: float = DEFAULT_THRESHOLD
+) -> list[str]:
+    """
+    :param threshold: Allowed relative increase of a metric over its baseline
+    :return: A description of every metric which is worse than its baseline by more than the threshold
+    """
+    regressions = []
+    for result in results:
+        for metric, baseline in baselines.get(result.instance, {}).items():
+            value = getattr(result, metric)
+            if value is not None and value > baseline * (1 + threshold) + NOISE_FLOORS[metric]:
+                regressions.append(f"{result.instance}: {metric} {value:.3f} exceeds baseline {baseline:.3f}")
+    return regressions
+
+
+@click.command
+@click.option("--sizes", default=DEFAULT_SIZES, help="comma separated numbers of turbines")
+@click.option("--layouts", default="grid,irregular", help="comma separated farm layouts")
+@click.option("--seed", type=int, default=0, help="seed of the synthetic farms")
+@click.option("--time_limit", type=float, default=60, help="wall-clock time limit of a solve in seconds per farm")
+@click.option("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed relative regression")
+@click.option("--db_name", default=DEFAULT_HISTORY_FILE, help="sqlite file with the performance history")
+def run(sizes: str, layouts: str, seed: int, time_limit: float, threshold: float, db_name: str):
+    results = run_benchmark([int(s) for s in sizes.split(",")], layouts.split(","), seed, time_limit)
+
+    for (layout, metric), exponent in get_scaling_exponents(results).items():
+        print(f"Scaling of {metric} for {layout} farms: n^{exponent:.2f}")
+
+    history = PerformanceHistory(db_name)
+    baselines = get_baselines(history, [r.instance for r in results])
+    history.add_run(results, SUITE)
+
+    regressions = find_regressions(results, baselines, threshold)
+    for regression in regressions:
+        print(f"Regression: {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run()
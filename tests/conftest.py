@@ -0,0 +1,15 @@
+from opti_test.array_cable_problem import ArrayCableProblem
+from opti_test.classes import CableType, Unit
+from opti_test.model_data import Parameters
+from pytest import fixture
+
+
+@fixture
+def problem():
+    units = [Unit(name="WTG_1", x=0, y=0), Unit(name="WTG_2", x=1, y=1), Unit(name="OSS_1", x=2, y=0)]
+    cable_types = [
+        CableType(name="1", max_mw_on_cable=5, cost_per_km=10),
+        CableType(name="2", max_mw_on_cable=8, cost_per_km=20),
+    ]
+    parameters = Parameters(mw_produced_per_turbine=4, max_number_of_cable_types=2)
+    return ArrayCableProblem(units=units, cable_types=cable_types, parameters=parameters)
@@ -1,41 +1,112 @@
-from datetime import datetime
 import json
-import sqlite3
-from time import time
+import subprocess
+import sys
+import tracemalloc
 
-from opti_test import __version__
 from opti_test.array_cable_problem import ArrayCableProblem
+from opti_test.history import DEFAULT_HISTORY_FILE, PerformanceHistory, RunResult
+from opti_test.model_builder import ModelBuilder
+from opti_test.model_data import ModelData, SolverSettings
 
 
-DB_NAME = "performance_opti_test.db"
+IMPORT_TIME_BUDGET_IN_SECONDS = 0.5
+TEST_CASES = ["tests/test_cases/small.json", "tests/test_cases/medium.json", "tests/test_cases/large.json"]
 
 
-def setup():
-    with sqlite3.connect(DB_NAME) as connection:
-        connection.execute("""CREATE TABLE IF NOT EXISTS performance
-             (Timestamp timestamp, Instance text, CodeVersion text, SolutionTime float, ObjectiveFunctionValue float)""")
-
-
-def run_performance_test():
-    setup()
-    files = ["tests/test_cases/small.json", "tests/test_cases/medium.json", "tests/test_cases/large.json"]
-    for input_file in files:
+def run_performance_test(db_name: str = DEFAULT_HISTORY_FILE):
+    results = []
+    for input_file in TEST_CASES:
         with open(input_file, "r") as file:
             array_cable_problem = ArrayCableProblem(**json.load(file))
-        start = time()
         array_cable_problem.create_layout()
-        total_time = time() - start
-        if array_cable_problem.layout is None:
-            obj_value = 1e20
-        obj_value = sum([c.get_cost() for c in array_cable_problem.layout.connections])
-        with sqlite3.connect(DB_NAME) as connection:
-            connection.execute(
-                f"""INSERT INTO performance
-                    VALUES
-                        ('{datetime.now()}', '{input_file}', '{__version__}', {total_time}, {obj_value})
-                """
+        layout = array_cable_problem.layout
+        results.append(
+            RunResult(
+                instance=input_file,
+                status=array_cable_problem.statistics.termination_status or "unknown",
+                objective_function_value=None if layout is None else sum(c.get_cost() for c in layout.connections),
+                statistics=array_cable_problem.statistics,
+            )
+        )
+    history = PerformanceHistory(db_name)
+    history.add_run(results)
+    print(history.get_report(suite="performance"))
+
+
+def run_formulation_test(db_name: str = DEFAULT_HISTORY_FILE, time_limit: float = 600):
+    """
+    Compares the basic and the strong formulation on the test cases, and stores the results as suite "formulation"
+    """
+    settings = {
+        "basic": SolverSettings(time_limit=time_limit),
+        "strong": SolverSettings(formulation="strong", time_limit=time_limit),
+        "strong_integer": SolverSettings(formulation="strong", integer_flows=True, time_limit=time_limit),
+    }
+    results = []
+    for input_file in TEST_CASES:
+        for name, solver_settings in settings.items():
+            with open(input_file, "r") as file:
+                array_cable_problem = ArrayCableProblem(**json.load(file))
+            array_cable_problem.solver_settings = solver_settings
+            array_cable_problem.create_layout()
+            layout, statistics = array_cable_problem.layout, array_cable_problem.statistics
+            results.append(
+                RunResult(
+                    instance=f"{input_file} {name}",
+                    status=statistics.termination_status or "unknown",
+                    objective_function_value=None if layout is None else sum(c.get_cost() for c in layout.connections),
+                    statistics=statistics,
+                )
+            )
+            print(
+                f"{input_file} {name}: {statistics.get_total_time():.2f}s, {statistics.node_count} nodes, "
+                f"gap {statistics.mip_gap}, objective {results[-1].objective_function_value}"
             )
+    PerformanceHistory(db_name).add_run(results, suite="formulation")
+
+
+def run_memory_test(input_file: str = "tests/test_cases/large.json"):
+    """
+    Reports the peak memory of building the model when the crossing pairs are streamed into it, compared to building
+    it from all crossing pairs at once
+    """
+    with open(input_file, "r") as file:
+        array_cable_problem = ArrayCableProblem(**json.load(file))
+
+    peak_memory = {}
+    for is_streamed in [True, False]:
+        model_data = ModelData.create(array_cable_problem.units, array_cable_problem.cable_types)
+        tracemalloc.start()
+        if not is_streamed:
+            model_data.get_crossing_link_pairs()
+        model_builder = ModelBuilder(model_data, array_cable_problem.parameters)
+        model_builder._define_variables()
+        model_builder._define_constraints()
+        model_builder._define_non_crossing_constraints()
+        peak_memory[is_streamed] = tracemalloc.get_traced_memory()[1] / 1024**2
+        tracemalloc.stop()
+
+    print(
+        f"Peak memory of the model construction for {input_file}: {peak_memory[True]:.1f} MB streamed, "
+        f"{peak_memory[False]:.1f} MB materialized, saving {peak_memory[False] - peak_memory[True]:.1f} MB"
+    )
+
+
+def run_import_time_test():
+    code = (
+        "from time import perf_counter; start = perf_counter(); "
+        "import opti_test.array_cable_problem; print(perf_counter() - start)"
+    )
+    import_times = [
+        float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout)
+        for _ in range(5)
+    ]
+    import_time = min(import_times)
+    print(f"Cold import of the solve path: {import_time:.3f}s (budget {IMPORT_TIME_BUDGET_IN_SECONDS}s)")
+    assert import_time <= IMPORT_TIME_BUDGET_IN_SECONDS, "The import time of the solve path exceeds its budget"
 
 
 if __name__ == "__main__":
+    run_import_time_test()
+    run_memory_test()
     run_performance_test()
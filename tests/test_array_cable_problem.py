@@ -0,0 +1,114 @@
+import json
+
+from pytest import approx, raises
+
+from opti_test.array_cable_problem import ArrayCableProblem
+from opti_test.crossings import get_crossing_pairs
+from opti_test.model_data import SolverSettings
+from opti_test.synthetic import create_synthetic_farm
+
+
+def _get_cost(problem: ArrayCableProblem) -> float:
+    return sum(c.get_cost() for c in problem.layout.connections)
+
+
+def _solve_from_scratch(problem: ArrayCableProblem) -> float:
+    fresh_problem = ArrayCableProblem(
+        units=problem.units, cable_types=problem.cable_types, parameters=problem.parameters
+    )
+    fresh_problem.create_layout()
+    return _get_cost(fresh_problem)
+
+
+def test_reoptimize_after_moving_unit():
+    # Arrange
+    problem = create_synthetic_farm(8)
+    problem.reoptimize()
+    unit = problem.units[0]
+
+    # Act
+    problem.move_unit(unit, unit.x + 2500, unit.y + 1800)
+    problem.reoptimize()
+
+    # Assert
+    assert (unit.x + 2500, unit.y + 1800) == (problem.units[0].x, problem.units[0].y)
+    assert problem.statistics.number_of_solves == 1
+    assert "variables" not in problem.statistics.phase_times_in_seconds
+    assert _get_cost(problem) == approx(_solve_from_scratch(problem), rel=1e-6)
+    for c in problem.layout.connections:
+        for c2 in problem.layout.connections:
+            assert not c.link.check_if_crossing(c2.link)
+
+
+def test_lazy_crossings_keep_best_layout_when_time_runs_out():
+    # Arrange
+    with open("tests/test_cases/large.json", "r") as file:
+        problem = ArrayCableProblem(**json.load(file))
+    problem.solver_settings = SolverSettings(lazy_crossings=True, time_limit=0.5, heuristic_warm_start=True)
+
+    # Act
+    problem.create_layout()
+
+    # Assert
+    assert problem.statistics.termination_status == "TIME_LIMIT"
+    assert 0 == len(get_crossing_pairs([c.link for c in problem.layout.connections]))
+
+
+def test_reoptimize_after_changing_cable_cost():
+    # Arrange
+    problem = create_synthetic_farm(8)
+    problem.reoptimize()
+    cable_type = problem.cable_types[0]
+
+    # Act
+    problem.set_cable_cost(cable_type, 10 * cable_type.cost_per_km)
+    problem.reoptimize()
+
+    # Assert
+    assert 10 * cable_type.cost_per_km == problem.cable_types[0].cost_per_km
+    assert _get_cost(problem) == approx(_solve_from_scratch(problem), rel=1e-6)
+
+
+def test_reoptimize_after_removing_and_restoring_link():
+    # Arrange
+    problem = create_synthetic_farm(8)
+    problem.reoptimize()
+    cost = _get_cost(problem)
+    link = problem.layout.connections[0].link
+
+    # Act
+    problem.set_link_allowed(link, False)
+    problem.reoptimize()
+    links_without = [c.link for c in problem.layout.connections]
+    problem.set_link_allowed(link, True)
+    problem.reoptimize()
+
+    # Assert
+    assert link not in links_without
+    assert _get_cost(problem) == approx(cost, rel=1e-6)
+
+
+def test_set_link_allowed_needs_model():
+    # Arrange
+    problem = create_synthetic_farm(4)
+    problem.create_layout()
+
+    # Act, Assert
+    with raises(ValueError):
+        problem.set_link_allowed(problem.layout.connections[0].link, False)
+
+
+def test_fast_plot_has_a_trace_per_cable_type():
+    # Arrange
+    problem = create_synthetic_farm(8)
+    problem.create_layout(method="heuristic")
+    cable_types = {c.cable_type.name for c in problem.layout.connections}
+
+    # Act
+    fig = problem.plot(False, fast=True)
+
+    # Assert
+    assert len(fig.data) == 1 + len(cable_types)
+    assert {trace.name for trace in fig.data[1:]} == cable_types
+    assert sum(len(trace.x) for trace in fig.data[1:]) == 3 * len(problem.layout.connections)
+    assert len(problem.plot(False, fast=False).data) == 1 + len(problem.layout.connections)
@@ -0,0 +1,67 @@
+import json
+
+from opti_test.batch import BatchResult, get_input_files, solve_batch, summarize
+
+SMALL = "tests/test_cases/small.json"
+
+
+def test_get_input_files_from_directory():
+    # Act
+    input_files = get_input_files("tests/test_cases")
+
+    # Assert
+    assert ["tests/test_cases/large.json", "tests/test_cases/medium.json", SMALL] == input_files
+
+
+def test_solve_batch_writes_results(tmp_path):
+    # Arrange
+    output_file = tmp_path / "results.jsonl"
+    missing_file = str(tmp_path / "missing.json")
+
+    # Act
+    results = solve_batch([SMALL, missing_file], str(output_file), workers=2, method="heuristic")
+
+    # Assert
+    lines = [json.loads(line) for line in output_file.read_text().splitlines()]
+    assert {SMALL, missing_file} == {line["instance"] for line in lines}
+    status = {r.instance: r.status for r in results}
+    assert "solved" == status[SMALL]
+    assert "failed" == status[missing_file]
+
+
+def test_summarize_lists_failures():
+    # Arrange
+    results = [
+        BatchResult(instance="a.json", status="solved", solution_time=1),
+        BatchResult(instance="b.json", status="failed", solution_time=1, error="FileNotFoundError()"),
+    ]
+
+    # Act
+    summary = summarize(results)
+
+    # Assert
+    assert "Solved 1 of 2 instances\n  b.json: failed (FileNotFoundError())" == summary
+
+
+def test_solve_batch_terminates_instances_after_timeout(tmp_path):
+    # Arrange
+    output_file = tmp_path / "results.jsonl"
+    large_file = "tests/test_cases/large.json"
+
+    # Act
+    results = solve_batch([large_file, SMALL], str(output_file), workers=1, timeout=2)
+
+    # Assert
+    status = {r.instance: r for r in results}
+    assert "timeout" == status[large_file].status
+    assert status[large_file].solution_time < 5
+    # The terminated worker is replaced for the remaining instances
+    assert "solved" == status[SMALL].status
+
+
+def test_solve_batch_with_decomposition(tmp_path):
+    # Act
+    results = solve_batch([SMALL, SMALL], str(tmp_path / "results.jsonl"), workers=1, method="decomposition")
+
+    # Assert
+    assert ["solved", "solved"] == [r.status for r in results]
@@ -0,0 +1,41 @@
+from opti_test.statistics import SolveStatistics
+from tests.benchmark import BenchmarkResult, find_regressions, get_scaling_exponents
+
+
+def _create_result(number_of_turbines: int, build_time: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        instance=f"grid_{number_of_turbines}",
+        layout="grid",
+        number_of_turbines=number_of_turbines,
+        number_of_substations=1,
+        status="OPTIMAL",
+        objective_function_value=1.0,
+        statistics=SolveStatistics(
+            phase_times_in_seconds={"variables": build_time, "optimize": 1.0}, memory_high_water_in_mb=100.0
+        ),
+    )
+
+
+def test_find_regressions():
+    # Arrange
+    results = [_create_result(10, 2.0), _create_result(20, 1.1)]
+    baselines = {"grid_10": {"build_time": 1.0, "memory_in_mb": 100.0}, "grid_20": {"build_time": 1.0}}
+
+    # Act
+    regressions = find_regressions(results, baselines, threshold=0.25)
+
+    # Assert
+    assert 1 == len(regressions)
+    assert regressions[0].startswith("grid_10: build_time")
+
+
+def test_get_scaling_exponents():
+    # Arrange
+    results = [_create_result(10, 1.0), _create_result(20, 4.0), _create_result(40, 16.0)]
+
+    # Act
+    exponents = get_scaling_exponents(results)
+
+    # Assert
+    assert abs(exponents[("grid", "build_time")] - 2) < 1e-9
+    assert abs(exponents[("grid", "solve_time")]) < 1e-9
@@ -0,0 +1,70 @@
+from opti_test.cache import ResultCache, get_fingerprint
+from opti_test.classes import CableType, Connection, Layout, Link, Unit
+from opti_test.model_data import Parameters
+
+
+def _create_layout(num: int) -> Layout:
+    link = Link(origin=Unit(name=f"WTG_{num}", x=num, y=0), destination=Unit(name="OSS_1", x=0, y=0))
+    return Layout(connections=[Connection(link=link, cable_type=CableType(name="1", max_mw_on_cable=5, cost_per_km=1))])
+
+
+def test_get_fingerprint_ignores_order(problem):
+    # Arrange
+    reordered = problem.model_copy(update={"units": problem.units[::-1], "cable_types": problem.cable_types[::-1]})
+
+    # Act & Assert
+    assert get_fingerprint(problem) == get_fingerprint(reordered)
+
+
+def test_get_fingerprint_changes_with_parameters(problem):
+    # Arrange
+    changed = problem.model_copy(
+        update={"parameters": Parameters(mw_produced_per_turbine=4, max_number_of_cable_types=1)}
+    )
+
+    # Act & Assert
+    assert get_fingerprint(problem) != get_fingerprint(changed)
+
+
+def test_result_cache_round_trip(tmp_path):
+    # Arrange
+    cache = ResultCache(tmp_path / "results.db")
+    layout = _create_layout(1)
+
+    # Act
+    cache.set("key", layout)
+
+    # Assert
+    assert layout == cache.get("key")
+    assert cache.get("other key") is None
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path):
+    # Arrange
+    size = len(_create_layout(1).model_dump_json())
+    cache = ResultCache(tmp_path / "results.db", max_size_in_bytes=2 * size)
+    cache.set("1", _create_layout(1))
+    cache.set("2", _create_layout(2))
+    cache.get("1")
+
+    # Act
+    cache.set("3", _create_layout(3))
+
+    # Assert
+    assert cache.get("1") is not None
+    assert cache.get("2") is None
+    assert cache.get("3") is not None
+    assert cache.get_size_in_bytes() <= 2 * size
+
+
+def test_create_layout_uses_cache(tmp_path, problem):
+    # Arrange
+    cache = ResultCache(tmp_path / "results.db")
+    cached_layout = _create_layout(7)
+    cache.set(get_fingerprint(problem), cached_layout)
+
+    # Act
+    problem.create_layout(cache)
+
+    # Assert
+    assert cached_layout.connections == problem.layout.connections
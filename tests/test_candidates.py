@@ -0,0 +1,68 @@
+from opti_test.candidates import CandidateSettings, get_candidate_matrix
+from opti_test.classes import CableType, Unit
+from opti_test.model_data import ModelData
+from pytest import fixture, mark
+
+
+@fixture
+def units():
+    turbines = [Unit(name=f"WTG_{i}_{j}", x=1000 * i, y=1000 * j) for i in range(4) for j in range(4)]
+    return turbines + [Unit(name="OSS_1", x=5000, y=1500)]
+
+
+def test_get_candidate_matrix_without_pruning(units):
+    # Act
+    is_candidate = get_candidate_matrix(units, CandidateSettings())
+
+    # Assert
+    assert is_candidate.sum() == len(units) * (len(units) - 1)
+
+
+@mark.parametrize(
+    "settings",
+    [
+        CandidateSettings(k_nearest_neighbours=3),
+        CandidateSettings(use_delaunay=True),
+        CandidateSettings(max_distance_in_km=1.5),
+        CandidateSettings(k_nearest_neighbours=4, use_delaunay=True, max_distance_in_km=2),
+    ],
+)
+def test_get_candidate_matrix_keeps_nearest_substation(units, settings):
+    # Act
+    is_candidate = get_candidate_matrix(units, settings)
+
+    # Assert
+    assert (is_candidate == is_candidate.T).all()
+    assert not is_candidate.diagonal().any()
+    assert is_candidate[:-1, -1].all()
+    assert is_candidate.sum() < len(units) * (len(units) - 1)
+
+
+def test_get_candidate_matrix_delaunay_grid_edges(units):
+    # Arrange
+    grid = units[:-1]
+
+    # Act
+    is_candidate = get_candidate_matrix(grid, CandidateSettings(use_delaunay=True))
+
+    # Assert
+    # A 4x4 grid has 24 sides and one diagonal for each of its 9 cells
+    assert 2 * (24 + 9) == is_candidate.sum()
+
+
+def test_model_data_create_with_candidate_settings(units):
+    # Arrange
+    cable_types = {
+        CableType(name="1", max_mw_on_cable=5, cost_per_km=10),
+        CableType(name="2", max_mw_on_cable=8, cost_per_km=20),
+    }
+
+    # Act
+    model_data = ModelData.create(units, cable_types, CandidateSettings(k_nearest_neighbours=3))
+
+    # Assert
+    report = model_data.candidate_report
+    assert report.number_of_links == 16 * 16
+    assert report.number_of_candidate_links == len(model_data.links)
+    assert report.number_of_candidate_connections == len(model_data.connections) == 2 * len(model_data.links)
+    assert all(len(model_data.get_outgoing_from_unit(u)) >= 3 for u in model_data.turbines)
@@ -0,0 +1,45 @@
+import json
+
+from click.testing import CliRunner
+
+from interfaces.cli import run
+from opti_test.array_cable_problem import ArrayCableProblem
+
+
+def _run_and_get_solver_settings(monkeypatch, tmp_path, *arguments):
+    with open("tests/test_cases/small.json", "r") as file:
+        content = json.load(file)
+    content["solver_settings"] = {"lazy_crossings": True, "time_limit": 60}
+    input_file = tmp_path / "input.json"
+    input_file.write_text(json.dumps(content))
+    solver_settings = []
+    monkeypatch.setattr(
+        ArrayCableProblem, "create_layout", lambda self, *args, **kwargs: solver_settings.append(self.solver_settings)
+    )
+    result = CliRunner().invoke(
+        run, ["--input_file", str(input_file), "--output_file", str(tmp_path / "out.json"), "--no_cache", *arguments]
+    )
+    assert result.exit_code == 0, result.output
+    return solver_settings[0]
+
+
+def test_cli_keeps_solver_settings_of_input_file(monkeypatch, tmp_path):
+    # Act
+    solver_settings = _run_and_get_solver_settings(monkeypatch, tmp_path)
+
+    # Assert
+    assert solver_settings.lazy_crossings
+    assert solver_settings.time_limit == 60
+    assert solver_settings.formulation == "basic"
+
+
+def test_cli_overrides_only_given_options(monkeypatch, tmp_path):
+    # Act
+    solver_settings = _run_and_get_solver_settings(
+        monkeypatch, tmp_path, "--time_limit", "5", "--formulation", "strong"
+    )
+
+    # Assert
+    assert solver_settings.lazy_crossings
+    assert solver_settings.time_limit == 5
+    assert solver_settings.formulation == "strong"
@@ -0,0 +1,43 @@
+import numpy as np
+from pytest import approx
+
+from opti_test.classes import CableType, Connection, Link, Unit
+from opti_test.core import CoreData, Index
+
+
+def test_index_groups_ids():
+    # Arrange
+    groups = np.array([2, 0, 2, 1, 0])
+
+    # Act
+    index = Index.create(groups, 4)
+
+    # Assert
+    assert [1, 4] == index.get(0).tolist()
+    assert [3] == index.get(1).tolist()
+    assert [0, 2] == index.get(2).tolist()
+    assert [] == index.get(3).tolist()
+
+
+def test_core_data_matches_pydantic_objects():
+    # Arrange
+    units = [Unit(name="WTG_1", x=0, y=0), Unit(name="WTG_2", x=1000, y=1000), Unit(name="OSS_1", x=2000, y=0)]
+    cable_types = [
+        CableType(name="1", max_mw_on_cable=5, cost_per_km=10),
+        CableType(name="2", max_mw_on_cable=8, cost_per_km=20),
+    ]
+
+    # Act
+    core = CoreData.create(units, cable_types)
+    costs = core.get_connection_costs()
+
+    # Assert
+    assert 4 == len(core.link_origin)
+    assert core.is_turbine[core.link_origin].all()
+    for num, (link, cable_type) in enumerate(zip(core.connection_link, core.connection_cable_type)):
+        connection = Connection(
+            link=Link(origin=units[core.link_origin[link]], destination=units[core.link_destination[link]]),
+            cable_type=cable_types[cable_type],
+        )
+        assert connection.get_cost() == approx(costs[num])
+        assert num == core.get_connection_id(link, cable_type)
@@ -0,0 +1,96 @@
+from itertools import combinations
+import json
+
+from hypothesis import given, settings, strategies as st
+import numpy as np
+from shapely.geometry import LineString
+
+from opti_test.classes import Link, Unit
+from opti_test.array_cable_problem import ArrayCableProblem
+from opti_test.crossings import get_crossing_link_pairs, get_crossing_link_pairs_of, get_crossing_pairs
+from opti_test.model_data import ModelData
+from tests.test_model_builder import model_data_st
+
+
+@st.composite
+def links_st(draw):
+    coordinates = st.floats(min_value=0, max_value=10, allow_nan=False, allow_infinity=False)
+    points = draw(st.lists(st.tuples(coordinates, coordinates), min_size=2, max_size=8))
+    units = [Unit(name=f"WTG_{num}", x=x, y=y) for num, (x, y) in enumerate(points)]
+    return [Link(origin=o, destination=d) for o in units for d in units if o != d]
+
+
+@given(links=links_st())
+@settings(deadline=None)
+def test_get_crossing_pairs_matches_pairwise_check(links):
+    # Arrange
+    expected = [
+        [num1, num2]
+        for num1, link1 in enumerate(links)
+        for num2, link2 in enumerate(links)
+        if num2 > num1 and _is_crossing_in_shapely(link1, link2)
+    ]
+
+    # Act
+    pairs = get_crossing_pairs(links)
+
+    # Assert
+    assert expected == pairs.tolist()
+
+
+def test_get_crossing_pairs_ignores_shared_units():
+    # Arrange
+    a, b, c = Unit(name="WTG_1", x=0, y=0), Unit(name="WTG_2", x=1, y=1), Unit(name="OSS_1", x=1, y=0)
+    links = [Link(origin=a, destination=b), Link(origin=a, destination=c), Link(origin=b, destination=c)]
+
+    # Act
+    pairs = get_crossing_pairs(links)
+
+    # Assert
+    assert 0 == len(pairs)
+
+
+def test_get_crossing_pairs_matches_pairwise_check_on_nearly_degenerate_links():
+    # Arrange
+    with open("tests/test_cases/large.json", "r") as file:
+        problem = ArrayCableProblem(**json.load(file))
+    model_data = ModelData.create(problem.units, problem.cable_types)
+    core = model_data.core
+    arrays = core.link_origin, core.link_destination, core.coordinates.x, core.coordinates.y, core.unit_name
+    links = [model_data.get_link(num) for num in range(len(core.link_origin))]
+    # shapely decides some of these pairs differently depending on the order of the links
+    expected = [(i, j) for i, j in combinations(range(len(links)), 2) if _is_crossing_in_shapely(links[i], links[j])]
+
+    # Act
+    pairs = get_crossing_link_pairs(*arrays)
+    pairs_of_all_links = get_crossing_link_pairs_of(np.arange(len(links)), *arrays)
+
+    # Assert
+    assert expected == [tuple(pair) for pair in pairs.tolist()]
+    assert expected == [tuple(pair) for pair in pairs_of_all_links.tolist()]
+
+
+def _is_crossing_in_shapely(link1: Link, link2: Link) -> bool:
+    if link1.origin in [link2.origin, link2.destination] or link1.destination in [link2.origin, link2.destination]:
+        return False
+    line1 = LineString([(link1.origin.x, link1.origin.y), (link1.destination.x, link1.destination.y)])
+    line2 = LineString([(link2.origin.x, link2.origin.y), (link2.destination.x, link2.destination.y)])
+    return line1.crosses(line2)
+
+
+@given(model_data=model_data_st(), data=st.data())
+@settings(deadline=None)
+def test_get_crossing_link_pairs_of_matches_all_pairs(model_data, data):
+    # Arrange
+    core = model_data.core
+    arrays = core.link_origin, core.link_destination, core.coordinates.x, core.coordinates.y, core.unit_name
+    unit_id = data.draw(st.integers(min_value=0, max_value=len(model_data.units) - 1))
+    link_ids = core.get_link_ids_of_unit(unit_id)
+
+    # Act
+    pairs = get_crossing_link_pairs_of(link_ids, *arrays)
+
+    # Assert
+    all_pairs = get_crossing_link_pairs(*arrays)
+    expected = all_pairs[np.isin(all_pairs, link_ids).any(axis=1)]
+    assert expected.tolist() == pairs.tolist()
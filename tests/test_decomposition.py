@@ -0,0 +1,85 @@
+from hypothesis import given, settings
+from pytest import raises
+
+from opti_test.classes import CableType, Unit
+from opti_test.decomposition import DecompositionBuilder, get_substation_assignment
+from opti_test.model_data import ModelData, Parameters, SolverSettings
+from tests.test_model_builder import model_data_st
+
+
+def create_two_cluster_model_data(cable_types: set[CableType]) -> ModelData:
+    units = (
+        {Unit(name=f"WTG_A{i}", x=1000 * i, y=0) for i in range(1, 4)}
+        | {Unit(name=f"WTG_B{i}", x=1000 * i, y=10000) for i in range(1, 4)}
+        | {Unit(name="OSS_A", x=0, y=0), Unit(name="OSS_B", x=0, y=10000)}
+    )
+    return ModelData.create(units, cable_types)
+
+
+def test_turbines_assigned_to_nearest_substation():
+    # Arrange
+    model_data = create_two_cluster_model_data({CableType(name="1", max_mw_on_cable=24, cost_per_km=10)})
+
+    # Act
+    assignment = get_substation_assignment(model_data.core)
+
+    # Assert
+    for num, unit in enumerate(model_data.units):
+        if unit.is_turbine():
+            assert unit.name[-2] == model_data.units[assignment[num]].name[-1]
+
+
+def test_substation_capacity_respected():
+    # Arrange
+    units = {Unit(name=f"WTG_{i}", x=1000 * i, y=0) for i in range(1, 7)} | {
+        Unit(name="OSS_A", x=0, y=0),
+        Unit(name="OSS_B", x=0, y=50000),
+    }
+    model_data = ModelData.create(units, {CableType(name="1", max_mw_on_cable=24, cost_per_km=10)})
+
+    # Act
+    assignment = get_substation_assignment(model_data.core, max_turbines_per_substation=3)
+
+    # Assert
+    assert 1 == len(set(get_substation_assignment(model_data.core).tolist()) - {-1})
+    assert [3, 3] == [(assignment == s).sum() for s in sorted(set(assignment.tolist()) - {-1})]
+    with raises(ValueError):
+        get_substation_assignment(model_data.core, max_turbines_per_substation=2)
+
+
+def test_cable_type_limit_shared_across_clusters():
+    # Arrange
+    model_data = create_two_cluster_model_data(
+        {
+            CableType(name="small", max_mw_on_cable=8, cost_per_km=10),
+            CableType(name="medium", max_mw_on_cable=16, cost_per_km=15),
+            CableType(name="large", max_mw_on_cable=24, cost_per_km=30),
+        }
+    )
+    parameters = Parameters(mw_produced_per_turbine=8, max_number_of_cable_types=2)
+
+    # Act
+    layout = DecompositionBuilder(model_data, parameters, SolverSettings(decomposition_workers=2)).solve()
+
+    # Assert
+    assert set([c.link.origin for c in layout]) == model_data.turbines
+    assert 2 >= len(set([c.cable_type for c in layout]))
+
+
+@given(model_data=model_data_st())
+@settings(deadline=None, max_examples=20)
+def test_decomposition_layout_is_feasible(model_data):
+    # Arrange
+    parameters = Parameters(mw_produced_per_turbine=8, max_number_of_cable_types=1)
+
+    # Act
+    layout = DecompositionBuilder(model_data, parameters, SolverSettings(decomposition_workers=1)).solve()
+
+    # Assert
+    if layout is None:  # Account for possible infeasibilities
+        return
+    assert set([c.link.origin for c in layout]) == model_data.turbines
+    assert 1 >= len(set([c.cable_type for c in layout]))
+    for c in layout:
+        for c2 in layout:
+            assert not c.link.check_if_crossing(c2.link)
@@ -0,0 +1,55 @@
+from hypothesis import given, settings, strategies as st
+import numpy as np
+from pytest import approx, mark
+from shapely.geometry import LineString
+
+from opti_test.classes import Link, Unit
+from opti_test.geometry import UnitCoordinates, are_crossing, is_crossing
+
+coordinates = st.one_of(
+    st.floats(min_value=0, max_value=10, allow_nan=False, allow_infinity=False),
+    st.sampled_from([0.0, 5e-324, 1e-308, 1.1, 1.0000000000000002]),
+)
+points = st.tuples(coordinates, coordinates)
+
+
+def test_unit_coordinates_get_distance_matrix_in_km():
+    # Arrange
+    units = [Unit(name="WTG_1", x=0, y=0), Unit(name="WTG_2", x=1000, y=1000), Unit(name="OSS_1", x=3000, y=4000)]
+    unit_coordinates = UnitCoordinates(units)
+
+    # Act
+    distances = unit_coordinates.get_distance_matrix_in_km()
+
+    # Assert
+    assert distances[0, 1] == approx(1.414213)
+    assert distances[2, 0] == approx(5)
+    for num1, u1 in enumerate(units):
+        for num2, u2 in enumerate(units):
+            assert distances[num1, num2] == Link(origin=u1, destination=u2).get_distance_in_km()
+
+
+@given(segments=st.lists(st.tuples(points, points, points, points), min_size=1, max_size=20))
+@settings(deadline=None)
+def test_are_crossing_matches_shapely(segments):
+    # Arrange
+    start1, end1, start2, end2 = (np.array([s[num] for s in segments], dtype=float) for num in range(4))
+    expected = [LineString([s[0], s[1]]).crosses(LineString([s[2], s[3]])) for s in segments]
+
+    # Act
+    crossing = are_crossing(start1, end1, start2, end2)
+
+    # Assert
+    assert expected == crossing.tolist()
+    assert expected == [is_crossing(*s) for s in segments]
+
+
+@mark.parametrize(
+    "end, expected", [((1, 0), True), ((0.5, 0.5), False), ((2, -1), True), ((1, 1), False), ((0.4, 0.5), False)]
+)
+def test_is_crossing(end, expected):
+    # Act
+    crossing = is_crossing((0, 0), (1, 1), (0, 1), end)
+
+    # Assert
+    assert crossing == expected
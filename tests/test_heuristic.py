@@ -0,0 +1,70 @@
+from hypothesis import given, settings
+from pytest import approx
+
+from opti_test.classes import CableType, Unit
+from opti_test.heuristic import HeuristicBuilder
+from opti_test.model_builder import ModelBuilder
+from opti_test.model_data import ModelData, Parameters
+from tests.test_model_builder import model_data_st
+
+
+@given(model_data=model_data_st())
+@settings(deadline=None)
+def test_heuristic_layout_is_feasible(model_data):
+    # Arrange
+    parameters = Parameters(mw_produced_per_turbine=8, max_number_of_cable_types=1)
+    heuristic_builder = HeuristicBuilder(model_data, parameters)
+
+    # Act
+    layout = heuristic_builder.solve()
+
+    # Assert
+    if layout is None:  # The heuristic may miss feasible layouts
+        return
+    assert set([c.link.origin for c in layout]) == model_data.turbines
+    assert 1 == len(set([c.cable_type for c in layout]))
+    for c in layout:
+        for c2 in layout:
+            assert not c.link.check_if_crossing(c2.link)
+
+
+@given(model_data=model_data_st())
+@settings(deadline=None)
+def test_heuristic_not_better_than_mip(model_data):
+    # Arrange
+    parameters = Parameters(mw_produced_per_turbine=8, max_number_of_cable_types=2)
+
+    # Act
+    layout = HeuristicBuilder(model_data, parameters).solve()
+    mip_layout = ModelBuilder(model_data, parameters).solve()
+
+    # Assert
+    if layout is None or mip_layout is None:  # Account for possible infeasibilities
+        return
+    mip_cost, heuristic_cost = sum(c.get_cost() for c in mip_layout), sum(c.get_cost() for c in layout)
+    assert mip_cost <= heuristic_cost or mip_cost == approx(heuristic_cost, rel=1e-3)
+
+
+def test_heuristic_respects_cable_capacity():
+    # Arrange
+    units = {Unit(name=f"WTG_{i}", x=1000 * i, y=0) for i in range(1, 5)} | {Unit(name="OSS_1", x=0, y=0)}
+    cable_types = {
+        CableType(name="small", max_mw_on_cable=16, cost_per_km=10),
+        CableType(name="large", max_mw_on_cable=32, cost_per_km=30),
+    }
+    model_data = ModelData.create(units, cable_types)
+    parameters = Parameters(mw_produced_per_turbine=8, max_number_of_cable_types=2)
+
+    # Act
+    layout = HeuristicBuilder(model_data, parameters).solve()
+
+    # Assert
+    assert 4 == len(layout)
+    next_unit = {c.link.origin.name: c.link.destination.name for c in layout}
+    for c in layout:
+        number_of_upstream_turbines = 0
+        for name in next_unit:
+            while name in next_unit and name != c.link.origin.name:
+                name = next_unit[name]
+            number_of_upstream_turbines += name == c.link.origin.name
+        assert c.cable_type.max_mw_on_cable >= 8 * number_of_upstream_turbines
@@ -0,0 +1,108 @@
+import sqlite3
+
+from opti_test.history import PerformanceHistory, RunResult
+from opti_test.statistics import SolveStatistics
+
+
+def _create_result(instance: str, total_time: float, objective_function_value: float | None = 1.0) -> RunResult:
+    return RunResult(
+        instance=instance,
+        status="OPTIMAL",
+        objective_function_value=objective_function_value,
+        statistics=SolveStatistics(
+            phase_times_in_seconds={"variables": total_time / 2, "optimize": total_time / 2}, number_of_variables=10
+        ),
+    )
+
+
+def test_add_run(tmp_path):
+    # Arrange
+    history = PerformanceHistory(tmp_path / "history.db")
+
+    # Act
+    run_id = history.add_run([_create_result("small", 2.0), _create_result("large", 4.0, None)])
+
+    # Assert
+    with sqlite3.connect(history.path) as connection:
+        runs = connection.execute("SELECT RunId, Suite, CodeVersion FROM runs").fetchall()
+        phases = connection.execute("SELECT Instance, Phase, Time FROM phase_times ORDER BY Instance").fetchall()
+    assert [run_id] == [run[0] for run in runs]
+    assert "performance" == runs[0][1]
+    assert [("large", "variables", 2.0), ("large", "optimize", 2.0)] == phases[:2]
+    results = history.get_results("large")
+    assert 1 == len(results)
+    assert results[0].objective_function_value is None
+    assert 10 == results[0].statistics.number_of_variables
+    assert 2.0 == results[0].solve_time
+
+
+def test_imports_legacy_results_once(tmp_path):
+    # Arrange
+    path = tmp_path / "history.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute(
+            "CREATE TABLE performance (Timestamp timestamp, Instance text, CodeVersion text, SolutionTime float, "
+            "ObjectiveFunctionValue float)"
+        )
+        connection.executemany(
+            "INSERT INTO performance VALUES (?, ?, ?, ?, ?)",
+            [("2025-03-12 09:13:05", "small", "0.0.1", 2.0, 1.0), ("2025-03-12 09:13:10", "small", "0.0.1", 4.0, 1.0)],
+        )
+
+    # Act
+    PerformanceHistory(path)
+    history = PerformanceHistory(path)
+
+    # Assert
+    assert [4.0, 2.0] == [r.total_time for r in history.get_results("small")]
+    trends = history.get_trends("small")
+    assert [("0.0.1", 2, 3.0)] == [(t.code_version, t.number_of_runs, t.mean_total_time) for t in trends]
+
+
+def test_get_results_starts_with_latest_run(tmp_path):
+    # Arrange
+    history = PerformanceHistory(tmp_path / "history.db")
+    history.add_run([_create_result("small", 1.0)])
+    history.add_run([_create_result("small", 2.0)], suite="benchmark")
+    history.add_run([_create_result("small", 3.0)])
+
+    # Act
+    results = history.get_results("small", suite="performance", limit=1)
+
+    # Assert
+    assert [3.0] == [r.total_time for r in results]
+
+
+def test_get_report(tmp_path):
+    # Arrange
+    history = PerformanceHistory(tmp_path / "history.db")
+    history.add_run([_create_result("small", 2.0)])
+    history.add_run([_create_result("small", 4.0)])
+
+    # Act
+    trends = history.get_trends("small")
+    report = history.get_report("small")
+
+    # Assert
+    assert 1 == len(trends)
+    assert 2 == trends[0].number_of_runs
+    assert 3.0 == trends[0].mean_total_time
+    assert 2.0 == trends[0].min_total_time
+    assert 2 == len(report.splitlines())
+
+
+def test_get_report_compares_versions(tmp_path, monkeypatch):
+    # Arrange
+    history = PerformanceHistory(tmp_path / "history.db")
+    monkeypatch.setattr("opti_test.history.__version__", "1.0.0")
+    history.add_run([_create_result("small", 2.0)])
+    monkeypatch.setattr("opti_test.history.__version__", "1.1.0")
+    history.add_run([_create_result("small", 1.0)])
+
+    # Act
+    trends = history.get_trends()
+    report = history.get_report()
+
+    # Assert
+    assert ["1.0.0", "1.1.0"] == [t.code_version for t in trends]
+    assert "-50.0%" in report.splitlines()[2]
@@ -0,0 +1,17 @@
+import subprocess
+import sys
+
+from pytest import mark
+
+
+@mark.parametrize("module", ["opti_test.array_cable_problem", "opti_test.batch"])
+def test_solve_path_does_not_import_plotting_dependencies(module):
+    # Arrange
+    code = f"import sys, {module}; print(','.join(sorted(sys.modules)))"
+
+    # Act
+    modules = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    # Assert
+    loaded = set(modules.strip().split(","))
+    assert {"pandas", "plotly", "streamlit", "shapely"}.isdisjoint(loaded)
@@ -0,0 +1,56 @@
+from pytest import approx
+
+from opti_test.incumbents import get_improving_solutions
+from opti_test.model_data import SolverSettings
+from opti_test.synthetic import create_synthetic_farm
+
+_SOLUTIONS = """Objective 0.1537673568176
+# Columns -2
+NoName 1 2
+install_WTG 1_OSS_1 1 90
+Objective 0.0428064875785
+# Columns -0
+Objective 0.04
+# Columns -2
+NoName 1 3
+"""
+
+
+def test_get_improving_solutions_skips_incomplete_solution():
+    # Act
+    solutions = get_improving_solutions(_SOLUTIONS)
+
+    # Assert
+    assert [objective for objective, _, _ in solutions] == [0.1537673568176, 0.0428064875785]
+    assert solutions[0][1].tolist() == [2, 90]
+    assert solutions[0][2].tolist() == [1.0, 1.0]
+    assert len(solutions[1][1]) == 0
+
+
+def test_incumbents_improve_until_the_layout():
+    # Arrange
+    problem = create_synthetic_farm(8)
+    incumbents = []
+
+    # Act
+    problem.create_layout(on_incumbent=incumbents.append)
+
+    # Assert
+    costs = [sum(c.get_cost() for c in layout.connections) for layout in incumbents]
+    assert len(incumbents) >= 1
+    assert costs == sorted(costs, reverse=True)
+    assert costs[-1] == approx(sum(c.get_cost() for c in problem.layout.connections))
+    assert set(incumbents[-1].connections) == set(problem.layout.connections)
+
+
+def test_mip_rel_gap_stops_early():
+    # Arrange
+    problem = create_synthetic_farm(8)
+    problem.solver_settings = SolverSettings(mip_rel_gap=0.5, node_limit=1000, threads=1)
+
+    # Act
+    problem.create_layout()
+
+    # Assert
+    assert problem.layout is not None
+    assert problem.statistics.mip_gap <= 0.5
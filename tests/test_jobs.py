@@ -0,0 +1,108 @@
+import os
+from time import perf_counter, sleep
+
+from pytest import approx, mark
+
+from opti_test.jobs import SolveJob, get_progress_from_log
+from opti_test.synthetic import create_synthetic_farm
+
+_LOG = """
+        Nodes      |    B&B Tree     |            Objective Bounds              |  Dynamic Constraints |       Work
+Src  Proc. InQueue |  Leaves   Expl. | BestBound       BestSol              Gap |   Cuts   InLp Confl. | LpIters     Time
+
+         0       0         0   0.00%   0              inf                  inf        0      0      0         0     0.8s
+ L       0       0         0   0.00%   0.0413464953    0.0428064496       3.41%     6143    238     30      2692    21.6s
+"""
+
+
+def test_get_progress_from_log():
+    # Act
+    progress = get_progress_from_log(_LOG)
+
+    # Assert
+    assert progress["objective_function_value"] == approx(0.0428064496)
+    assert progress["best_bound"] == approx(0.0413464953)
+    assert progress["gap"] == approx(0.0341)
+
+
+def test_get_progress_from_log_without_incumbent():
+    # Act
+    progress = get_progress_from_log(_LOG.splitlines()[4])
+
+    # Assert
+    assert progress == {"objective_function_value": None, "best_bound": 0.0, "gap": None}
+    assert get_progress_from_log("Running HiGHS") == {}
+
+
+def test_solve_job():
+    # Arrange
+    problem = create_synthetic_farm(4)
+    job = SolveJob(problem)
+
+    # Act
+    while job.is_running():
+        sleep(0.1)
+
+    # Assert
+    assert job.error is None
+    assert job.result.layout is not None
+    assert job.result.solver_settings.log_file is None
+    assert job.log_file.exists()
+    job.close()
+    assert not job.log_file.exists()
+
+
+def test_solve_job_with_decomposition():
+    # Arrange
+    job = SolveJob(create_synthetic_farm(6, 2), method="decomposition")
+
+    # Act
+    while job.is_running():
+        sleep(0.1)
+
+    # Assert
+    assert job.error is None
+    assert job.result.layout is not None
+    job.close()
+
+
+def test_cancel_solve_job():
+    # Arrange
+    job = SolveJob(create_synthetic_farm(40))
+
+    # Act
+    job.cancel()
+
+    # Assert
+    assert not job.is_running()
+    assert job.is_cancelled
+    assert job.result is None
+    job.close()
+
+
+@mark.skipif(not hasattr(os, "killpg"), reason="process groups only exist on POSIX")
+def test_cancel_decomposition_job_stops_its_process_pool():
+    # Arrange
+    job = SolveJob(create_synthetic_farm(80, 3), method="decomposition")
+    while job.is_running() and not job.log_file.read_text():  # The clusters are solving once HiGHS logs
+        sleep(0.1)
+    os.killpg(job._process.pid, 0)  # The job leads the process group of the process pool
+
+    # Act
+    job.cancel()
+
+    # Assert
+    assert not _is_process_group_alive(job._process.pid)
+    job.close()
+
+
+def _is_process_group_alive(process_group: int, timeout: float = 5) -> bool:
+    # Terminated processes stay in the group until they are reaped
+    start = perf_counter()
+    while perf_counter() - start < timeout:
+        try:
+            os.killpg(process_group, 0)
+        except ProcessLookupError:
+            return False
+        sleep(0.1)
+    return True
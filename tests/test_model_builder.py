@@ -1,8 +1,13 @@
+from time import perf_counter
+
 from hypothesis import given, settings, strategies as st
+from pytest import approx
 
 from opti_test.classes import CableType, Unit
+from opti_test.heuristic import HeuristicBuilder
 from opti_test.model_builder import ModelBuilder
-from opti_test.model_data import ModelData, Parameters
+from opti_test.model_data import ModelData, Parameters, SolverSettings
+from opti_test.synthetic import create_synthetic_farm
 
 
 # Strategies for generating valid data
@@ -90,3 +95,99 @@ def test_no_cables_cross(model_data):
         for c2 in layout:
             if c != c2 and c.link.check_if_crossing(c2.link):
                 assert False
+
+
+@given(model_data=model_data_st())
+@settings(deadline=None)
+def test_lazy_crossings_same_objective(model_data):
+    # Arrange
+    parameters = Parameters(mw_produced_per_turbine=8, max_number_of_cable_types=2)
+    model_builder = ModelBuilder(model_data, parameters)
+    lazy_model_builder = ModelBuilder(model_data, parameters, SolverSettings(lazy_crossings=True))
+
+    # Act
+    layout = model_builder.solve()
+    lazy_layout = lazy_model_builder.solve()
+
+    # Assert
+    if layout is None:  # Account for possible infeasibilities
+        assert lazy_layout is None
+        return
+    assert sum(c.get_cost() for c in layout) == approx(sum(c.get_cost() for c in lazy_layout), rel=1e-3)
+    for c in lazy_layout:
+        for c2 in lazy_layout:
+            assert not c.link.check_if_crossing(c2.link)
+
+
+@given(model_data=model_data_st())
+@settings(deadline=None)
+def test_debug_names_same_model(model_data):
+    # Arrange
+    parameters = Parameters(mw_produced_per_turbine=8, max_number_of_cable_types=2)
+    model_builder = ModelBuilder(model_data, parameters)
+    debug_model_builder = ModelBuilder(model_data, parameters, SolverSettings(debug_names=True))
+
+    # Act
+    layout = model_builder.solve()
+    debug_layout = debug_model_builder.solve()
+
+    # Assert
+    assert model_builder.model.getnumcol() == debug_model_builder.model.getnumcol()
+    assert model_builder.model.getnumrow() == debug_model_builder.model.getnumrow()
+    if layout is None:  # Account for possible infeasibilities
+        assert debug_layout is None
+        return
+    assert model_builder.model.get_obj_value() == approx(debug_model_builder.model.get_obj_value(), rel=1e-3)
+
+
+@given(model_data=model_data_st())
+@settings(deadline=None)
+def test_warm_start_from_own_layout(model_data):
+    # Arrange
+    parameters = Parameters(mw_produced_per_turbine=8, max_number_of_cable_types=2)
+    layout = ModelBuilder(model_data, parameters).solve()
+    if layout is None:  # Account for possible infeasibilities
+        return
+    model_builder = ModelBuilder(model_data, parameters)
+
+    # Act
+    warm_layout = model_builder.solve(initial_layout=layout)
+
+    # Assert
+    assert sum(c.get_cost() for c in warm_layout) == approx(sum(c.get_cost() for c in layout), rel=1e-3)
+
+
+@given(model_data=model_data_st(), integer_flows=st.booleans())
+@settings(deadline=None)
+def test_strong_formulation_same_objective(model_data, integer_flows):
+    # Arrange
+    parameters = Parameters(mw_produced_per_turbine=8, max_number_of_cable_types=2)
+    model_builder = ModelBuilder(model_data, parameters)
+    strong_model_builder = ModelBuilder(
+        model_data, parameters, SolverSettings(formulation="strong", integer_flows=integer_flows)
+    )
+
+    # Act
+    layout = model_builder.solve()
+    strong_layout = strong_model_builder.solve(initial_layout=layout)
+
+    # Assert
+    if layout is None:  # Account for possible infeasibilities
+        assert strong_layout is None
+        return
+    assert sum(c.get_cost() for c in strong_layout) == approx(sum(c.get_cost() for c in layout), rel=1e-3)
+
+
+def test_time_limit_counts_from_start_of_solve():
+    # Arrange
+    problem = create_synthetic_farm(20)
+    model_data = ModelData.create(problem.units, problem.cable_types)
+    initial_layout = HeuristicBuilder(model_data, problem.parameters).solve()
+    model_builder = ModelBuilder(model_data, problem.parameters, SolverSettings(time_limit=60))
+
+    # Act
+    layout = model_builder.solve(initial_layout, start=perf_counter() - 60)
+
+    # Assert
+    assert model_builder.statistics.termination_status == "TIME_LIMIT"
+    assert sum(c.get_cost() for c in layout) == approx(sum(c.get_cost() for c in initial_layout))
@@ -67,3 +67,38 @@ def test_get_connections_with_same_cable_type(model_data):
     # Assert
     assert 4 == len(connections)
     assert cable_type == connections.pop().cable_type
+
+
+def test_get_connection_id(model_data):
+    # Arrange
+    connection = next(iter(model_data.connections))
+
+    # Act
+    connection_id = model_data.get_connection_id(connection)
+
+    # Assert
+    assert connection == model_data.get_connection(connection_id)
+
+
+def test_lookups_compare_units_by_name():
+    # Arrange
+    units = [
+        Unit(name="WTG_1", x=0, y=0),
+        Unit(name="WTG_1", x=5, y=5),
+        Unit(name="WTG_2", x=1, y=1),
+        Unit(name="OSS_1", x=2, y=0),
+    ]
+    model_data = ModelData.create(units, {CableType(name="1", max_mw_on_cable=5, cost_per_km=10)})
+    unit, other = Unit(name="WTG_1", x=0, y=0), Unit(name="OSS_1", x=2, y=0)
+    link = Link(origin=unit, destination=other)
+
+    # Act
+    outgoing = model_data.get_outgoing_from_unit(unit)
+    incoming = model_data.get_incoming_into_unit(other)
+    connections = model_data.get_connections_for_link(link)
+
+    # Assert
+    assert {li for li in model_data.links if li.origin == unit} == outgoing
+    assert {li for li in model_data.links if li.destination == other} == incoming
+    assert {c for c in model_data.connections if c.link == link} == connections
+    assert 4 == len(outgoing)
@@ -0,0 +1,52 @@
+from hypothesis import given, settings
+from pytest import approx
+
+from opti_test.classes import CableType, Unit
+from opti_test.model_builder import ModelBuilder
+from opti_test.model_data import ModelData, Parameters
+from opti_test.presolve import presolve
+from tests.test_model_builder import model_data_st
+
+
+def test_presolve_removes_cable_types():
+    # Arrange
+    units = {Unit(name=f"WTG_{i}", x=1000 * i, y=0) for i in range(1, 4)} | {Unit(name="OSS_1", x=0, y=0)}
+    cable_types = {
+        CableType(name="too small", max_mw_on_cable=5, cost_per_km=1),
+        CableType(name="small", max_mw_on_cable=16, cost_per_km=10),
+        CableType(name="small copy", max_mw_on_cable=16, cost_per_km=10),
+        CableType(name="expensive", max_mw_on_cable=16, cost_per_km=20),
+        CableType(name="large", max_mw_on_cable=32, cost_per_km=30),
+    }
+    model_data = ModelData.create(units, cable_types)
+    parameters = Parameters(mw_produced_per_turbine=8, max_number_of_cable_types=2)
+
+    # Act
+    reduced, report = presolve(model_data, parameters)
+
+    # Assert
+    assert ["too small"] == report.too_small_cable_types
+    assert 2 == len(report.dominated_cable_types)
+    assert "expensive" in report.dominated_cable_types
+    assert {"large"} < {c.name for c in reduced.cable_types}
+    assert 2 == len(reduced.cable_types)
+    assert report.number_of_kept_links < report.number_of_links
+    assert report.number_of_kept_connections == 2 * report.number_of_kept_links
+
+
+@given(model_data=model_data_st())
+@settings(deadline=None)
+def test_presolve_keeps_optimal_cost(model_data):
+    # Arrange
+    parameters = Parameters(mw_produced_per_turbine=8, max_number_of_cable_types=2)
+
+    # Act
+    reduced, _ = presolve(model_data, parameters)
+    layout = ModelBuilder(reduced, parameters).solve()
+    mip_layout = ModelBuilder(model_data, parameters).solve()
+
+    # Assert
+    assert (layout is None) == (mip_layout is None)
+    if layout is None:
+        return
+    assert sum(c.get_cost() for c in layout) == approx(sum(c.get_cost() for c in mip_layout), rel=1e-3)
@@ -0,0 +1,56 @@
+from opti_test.cache import ResultCache
+from opti_test.model_data import SolverSettings
+from opti_test.statistics import SolveStatistics
+
+
+def test_measure_adds_up_phase_times():
+    # Arrange
+    statistics = SolveStatistics()
+
+    # Act
+    for _ in range(2):
+        with statistics.measure("phase"):
+            pass
+
+    # Assert
+    assert ["phase"] == list(statistics.phase_times_in_seconds)
+    assert statistics.get_total_time() == statistics.phase_times_in_seconds["phase"]
+    assert statistics.memory_high_water_in_mb > 0
+
+
+def test_create_layout_records_statistics(problem):
+    # Act
+    problem.create_layout()
+
+    # Assert
+    statistics = problem.layout.statistics
+    assert statistics == problem.statistics
+    assert {"model_data", "variables", "constraints", "optimize"} <= set(statistics.phase_times_in_seconds)
+    assert 1 == statistics.number_of_solves
+    assert "OPTIMAL" == statistics.termination_status
+    assert statistics.number_of_variables > 0 and statistics.number_of_constraints > 0
+
+
+def test_lazy_crossings_count_solves(problem):
+    # Arrange
+    problem.solver_settings = SolverSettings(lazy_crossings=True)
+
+    # Act
+    problem.create_layout()
+
+    # Assert
+    assert problem.statistics.number_of_solves >= 1
+    assert "non_crossing_constraints" not in problem.statistics.phase_times_in_seconds
+
+
+def test_cached_layout_has_statistics_of_lookup(problem, tmp_path):
+    # Arrange
+    cache = ResultCache(tmp_path / "results.db")
+    problem.create_layout(cache)
+
+    # Act
+    problem.create_layout(cache)
+
+    # Assert
+    assert ["cache"] == list(problem.layout.statistics.phase_times_in_seconds)
+    assert problem.layout.statistics.termination_status is None
@@ -0,0 +1,82 @@
+import json
+
+from pytest import approx
+
+from opti_test.model_builder import ModelBuilder
+from opti_test.model_data import SolverSettings
+from opti_test.sweep import Scenario, create_scenarios, load_scenarios, run_sweeps, sweep, to_dataframe
+from opti_test.synthetic import create_synthetic_farm
+
+SMALL = "tests/test_cases/small.json"
+
+
+def _solve_scenario(problem, scenario: Scenario) -> float | None:
+    fresh_problem = problem.model_copy(deep=True)
+    fresh_problem.parameters.max_number_of_cable_types = scenario.max_number_of_cable_types
+    fresh_problem.cable_types = [
+        c.model_copy(update={"cost_per_km": scenario.cost_per_km.get(c.name, c.cost_per_km * scenario.cost_factor)})
+        for c in fresh_problem.cable_types
+    ]
+    fresh_problem.create_layout()
+    return None if fresh_problem.layout is None else sum(c.get_cost() for c in fresh_problem.layout.connections)
+
+
+def test_sweep_builds_once_and_matches_separate_solves(monkeypatch):
+    # Arrange
+    problem = create_synthetic_farm(8, number_of_cable_types=3)
+    scenarios = create_scenarios([1, 2, 4], cost_factors=[1.0]) + [
+        Scenario(name="cheap", max_number_of_cable_types=1, cost_per_km={problem.cable_types[-1].name: 1e-3})
+    ]
+    builds = []
+    build = ModelBuilder._build
+    monkeypatch.setattr(ModelBuilder, "_build", lambda self: builds.append(1) or build(self))
+
+    # Act
+    results = sweep(problem, scenarios)
+
+    # Assert
+    assert len(builds) == 1
+    assert [r.scenario for r in results] == [s.name for s in scenarios]
+    for result, scenario in zip(results, scenarios):
+        assert result.objective_function_value == approx(_solve_scenario(problem, scenario), rel=1e-6)
+        assert result.max_number_of_cable_types == scenario.max_number_of_cable_types
+        assert len({c.cable_type.name for c in result.layout.connections}) <= scenario.max_number_of_cable_types
+
+
+def test_sweep_rebuilds_strong_formulation_for_new_power():
+    # Arrange
+    problem = create_synthetic_farm(6)
+    problem.solver_settings = SolverSettings(formulation="strong")
+    mw = problem.parameters.mw_produced_per_turbine
+    scenarios = create_scenarios(mw_produced_per_turbine=[mw, mw / 2])
+
+    # Act
+    results = sweep(problem, scenarios)
+
+    # Assert
+    assert ["solved", "solved"] == [r.status for r in results]
+    assert results[1].objective_function_value <= results[0].objective_function_value * (1 + 1e-6)
+
+
+def test_create_scenarios_changes_number_of_cable_types_fastest():
+    # Act
+    scenarios = create_scenarios([1, 2], [8.0], [1.0, 2.0])
+
+    # Assert
+    assert [(1, 1.0), (2, 1.0), (1, 2.0), (2, 2.0)] == [(s.max_number_of_cable_types, s.cost_factor) for s in scenarios]
+
+
+def test_run_sweeps_writes_one_table(tmp_path):
+    # Arrange
+    sweep_file = tmp_path / "sweep.json"
+    sweep_file.write_text(json.dumps({"max_number_of_cable_types": [1, 2]}))
+    missing_file = str(tmp_path / "missing.json")
+
+    # Act
+    results = run_sweeps([SMALL, missing_file], load_scenarios(str(sweep_file)), workers=2)
+    table = to_dataframe(results)
+
+    # Assert
+    assert [SMALL, SMALL, missing_file] == table["instance"].tolist()
+    assert ["solved", "solved", "failed"] == table["status"].tolist()
+    assert "layout" not in table.columns
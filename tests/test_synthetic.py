@@ -0,0 +1,36 @@
+import numpy as np
+from pytest import mark, raises
+
+from opti_test.synthetic import TURBINE_SPACING_IN_M, create_synthetic_farm
+
+
+@mark.parametrize("layout", ["grid", "irregular"])
+def test_create_synthetic_farm(layout):
+    # Act
+    problem = create_synthetic_farm(40, number_of_substations=3, layout=layout, seed=3)
+
+    # Assert
+    turbines = np.array([[u.x, u.y] for u in problem.units if u.is_turbine()])
+    distances = np.hypot(*(turbines[:, None, :] - turbines[None, :, :]).transpose(2, 0, 1))
+    np.fill_diagonal(distances, np.inf)
+    assert 40 == len(turbines)
+    assert 43 == len({u.name for u in problem.units})
+    assert distances.min() > 0.5 * TURBINE_SPACING_IN_M
+    assert 3 == len(problem.cable_types)
+
+
+def test_create_synthetic_farm_is_reproducible():
+    # Act
+    problem = create_synthetic_farm(20, 2, "irregular", seed=7)
+    same_problem = create_synthetic_farm(20, 2, "irregular", seed=7)
+    other_problem = create_synthetic_farm(20, 2, "irregular", seed=8)
+
+    # Assert
+    assert problem.units == same_problem.units
+    assert [(u.x, u.y) for u in problem.units] != [(u.x, u.y) for u in other_problem.units]
+
+
+def test_create_synthetic_farm_rejects_unknown_layout():
+    # Act & Assert
+    with raises(ValueError):
+        create_synthetic_farm(10, layout="circle")
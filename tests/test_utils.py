@@ -0,0 +1,73 @@
+import pandas as pd
+from pytest import approx, importorskip
+
+from opti_test.utils import SHEETS, create_problem, read_csv, read_excel, read_parquet
+
+_TABLES = (
+    pd.DataFrame({"Voltage": [66.0], "MW": [8.0], "MaxCableTypes": [2]}),
+    pd.DataFrame({"Name": ["WTG1", "WTG2", "WTG2", "OSS"], "East": [0.0, 1.0, 1.0, 2.0], "North": [0, 1, 1, 0]}),
+    pd.DataFrame({"Number": [1, 2], "Rating": [400.0, 600.0], "Cost": [0.5, 0.7]}),
+)
+
+
+def test_create_problem():
+    # Act
+    problem = create_problem(*_TABLES)
+
+    # Assert
+    assert [(u.name, u.x, u.y) for u in problem.units] == [("WTG1", 0, 0), ("WTG2", 1, 1), ("OSS", 2, 0)]
+    # sqrt(3) * 400 A * 66 kV = 45.7 MW, which is rounded down to whole turbines of 8 MW
+    assert [c.max_mw_on_cable for c in problem.cable_types] == approx([40.0, 64.0])
+    assert [c.name for c in problem.cable_types] == ["1", "2"]
+    assert problem.parameters.mw_produced_per_turbine == 8.0
+    assert problem.parameters.max_number_of_cable_types == 2
+
+
+def test_create_problem_with_blank_max_cable_types():
+    # Arrange
+    parameters = pd.DataFrame({"Voltage": [66.0], "MW": [8.0], "MaxCableTypes": [None]}, dtype=float)
+
+    # Act
+    problem = create_problem(parameters, *_TABLES[1:])
+
+    # Assert
+    assert problem.parameters.max_number_of_cable_types == 2
+
+
+def test_read_csv(tmp_path):
+    # Arrange
+    for sheet, table in zip(SHEETS, _TABLES):
+        table.to_csv(tmp_path / f"{sheet}.csv", index=False)
+
+    # Act
+    problem = read_csv(tmp_path)
+
+    # Assert
+    assert problem == create_problem(*_TABLES)
+
+
+def test_read_parquet(tmp_path):
+    # Arrange
+    importorskip("pyarrow")
+    for sheet, table in zip(SHEETS, _TABLES):
+        table.to_parquet(tmp_path / f"{sheet}.parquet")
+
+    # Act
+    problem = read_parquet(tmp_path)
+
+    # Assert
+    assert problem == create_problem(*_TABLES)
+
+
+def test_read_excel(tmp_path):
+    # Arrange
+    importorskip("openpyxl")
+    with pd.ExcelWriter(tmp_path / "input.xlsx") as writer:
+        for sheet, table in zip(SHEETS, _TABLES):
+            table.to_excel(writer, sheet_name=sheet, index=False)
+
+    # Act
+    problem = read_excel(tmp_path / "input.xlsx")
+
+    # Assert
+    assert problem == create_problem(*_TABLES)